@@ -0,0 +1,81 @@
+"""Micro-benchmark serialization of large source lists.
+
+Usage:
+    python benchmarks/bench_list_serialization.py
+
+Compares the validated path (a ``Source`` model per row, then FastAPI's
+``response_model`` re-validation, JSON-mode dump and ``json.dumps``) with
+the fast path (rows zipped into dicts and encoded by ``fast_json.dumps``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import timeit
+
+from pydantic import TypeAdapter
+
+from infograph.core.fast_json import dumps, records
+from infograph.core.schemas.source import Source
+from infograph.stores.duckdb.source_store_duckdb import (
+    SOURCE_COLUMNS,
+    SourceStoreDuckDB,
+)
+
+
+def sample_rows(count: int) -> list[tuple]:
+    return [
+        (
+            f"00000000-0000-0000-0000-{index:012d}",
+            "11111111-1111-1111-1111-111111111111",
+            f"Renewable energy outlook, part {index}",
+            f"https://example.com/articles/{index}",
+            "Solar and wind capacity additions continued to outpace forecasts " * 3,
+            0.5 + (index % 50) / 100,
+            1_700_000_000 + index,
+        )
+        for index in range(count)
+    ]
+
+
+ADAPTER = TypeAdapter(list[Source])
+
+
+def validated(rows: list[tuple]) -> bytes:
+    models = [SourceStoreDuckDB._row_to_source(row) for row in rows]
+    content = ADAPTER.dump_python(ADAPTER.validate_python(models), mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def fast(rows: list[tuple]) -> bytes:
+    return dumps(records(SOURCE_COLUMNS, rows))
+
+
+def bench(label: str, fn, repeat: int, number: int) -> float:
+    timings = timeit.repeat(fn, repeat=repeat, number=number)
+    best = min(timings) / number * 1000
+    median = statistics.median(timings) / number * 1000
+    print(f"  {label:<10} best {best:9.3f} ms   median {median:9.3f} ms")
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+
+    for count in (50, 1000, 10000):
+        rows = sample_rows(count)
+        assert json.loads(validated(rows)) == json.loads(fast(rows))
+        print(f"{count} sources")
+        slow = bench("validated", lambda: validated(rows), args.repeat, args.number)
+        quick = bench("fast", lambda: fast(rows), args.repeat, args.number)
+        print(f"  {'':<10} {slow / quick:5.1f}x faster")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+"""Benchmark the streaming DuckDuckGo parser against the html.parser one.
+
+Usage:
+    python benchmarks/bench_search_parser.py [saved-page.html ...]
+
+Without arguments a large synthetic result page is generated, with the same
+shape as DuckDuckGo's HTML endpoint: a heavy head, deeply nested result
+blocks with many attributes, entities and highlighted snippet terms.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import timeit
+from pathlib import Path
+
+from infograph.services.search_providers import (
+    DuckDuckGoStreamParser,
+    _absolute_url,
+    _DuckDuckGoParser,
+)
+
+BASE_URL = "https://duckduckgo.com/html/"
+
+
+def synthetic_page(results: int = 60, filler_blocks: int = 400) -> str:
+    head = [
+        "<!DOCTYPE html><html lang='en'><head><meta charset='utf-8'>",
+        "<style>" + ".result{margin:0} " * 2000 + "</style>",
+        "<script>var data = '" + "<a class=\"result__a\">x</a>" * 200 + "';</script>",
+        "</head><body class='body--html'>",
+    ]
+    filler = "".join(
+        f'<div class="nav-item" data-id="{i}" data-track="nav" role="link">'
+        f'<span class="label" aria-hidden="true">Item {i}</span></div>'
+        for i in range(filler_blocks)
+    )
+    blocks = []
+    for i in range(results):
+        blocks.append(
+            f'<div class="result results_links results_links_deep web-result" '
+            f'data-nir="1" data-index="{i}"><div class="links_main links_deep '
+            f'result__body"><h2 class="result__title"><a rel="nofollow" '
+            f'class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2F'
+            f'example{i}.com%2Fpage&amp;rut=abc{i}">Result {i} &amp; '
+            f"<b>solar</b> power</a></h2>"
+            f'<div class="result__extras"><div class="result__extras__url">'
+            f'<a class="result__url" href="https://example{i}.com/page">'
+            f"example{i}.com/page</a></div></div>"
+            f'<a class="result__snippet" href="https://example{i}.com/page">'
+            f"Snippet {i} about <b>solar</b> panels &mdash; efficiency, "
+            f"cost &amp; adoption trends over time.</a>"
+            f'<div class="clear"></div></div></div>'
+        )
+    return "".join(head) + filler + "".join(blocks) + "</body></html>"
+
+
+def reference_parse(html: str, limit: int) -> list:
+    parser = _DuckDuckGoParser()
+    parser.feed(html)
+    parser.close()
+    return [
+        (result.title, _absolute_url(result.url, BASE_URL), result.snippet)
+        for result in parser.results
+    ][:limit]
+
+
+def stream_parse(html: str, limit: int | None, chunk_size: int | None = None) -> list:
+    parser = DuckDuckGoStreamParser(BASE_URL, limit)
+    if chunk_size is None:
+        parser.feed(html)
+    else:
+        for start in range(0, len(html), chunk_size):
+            if parser.feed(html[start : start + chunk_size]):
+                break
+    return [(r.title, r.url, r.snippet) for r in parser.close()]
+
+
+def bench(label: str, fn, repeat: int, number: int) -> float:
+    timings = timeit.repeat(fn, repeat=repeat, number=number)
+    best = min(timings) / number * 1000
+    median = statistics.median(timings) / number * 1000
+    print(f"  {label:<34} best {best:8.3f} ms   median {median:8.3f} ms")
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="*", type=Path)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    pages = {path.name: path.read_text() for path in args.pages} or {
+        "synthetic": synthetic_page()
+    }
+    for name, html in pages.items():
+        full = len(reference_parse(html, sys.maxsize))
+        assert reference_parse(html, sys.maxsize) == stream_parse(html, None)
+        assert reference_parse(html, args.limit) == stream_parse(html, args.limit)
+        print(f"{name}: {len(html) / 1024:.0f} KiB, {full} results")
+        baseline = bench(
+            "html.parser (current)",
+            lambda: reference_parse(html, args.limit),
+            args.repeat,
+            args.number,
+        )
+        runs = {
+            "stream, full page": lambda: stream_parse(html, None),
+            f"stream, limit={args.limit}": lambda: stream_parse(html, args.limit),
+            f"stream, limit={args.limit}, 16 KiB chunks": lambda: stream_parse(
+                html, args.limit, 16384
+            ),
+        }
+        for label, fn in runs.items():
+            best = bench(label, fn, args.repeat, args.number)
+            print(f"  {'':<34} {baseline / best:5.1f}x faster")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
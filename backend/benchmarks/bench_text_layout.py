@@ -0,0 +1,96 @@
+"""Micro-benchmark infographic text wrapping.
+
+Usage:
+    python benchmarks/bench_text_layout.py
+
+Compares the previous approach (``load_default`` per render, measuring the
+whole candidate line with ``textlength`` for every word and ``getbbox`` per
+line) with ``text_layout``'s cached glyph advances and single-pass wrap, on
+a long research prompt and a layout with many long bullets.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import timeit
+
+from PIL import Image, ImageDraw, ImageFont
+
+from infograph.services.text_layout import default_font_registry, wrap_text
+
+MAX_WIDTH = 896
+WORDS = (
+    "coastal tidal energy installations ecosystems mitigation strategies "
+    "sediment transport marine mammals turbine acoustic monitoring policy"
+).split()
+
+
+def sample_text(words: int) -> str:
+    return " ".join(WORDS[i % len(WORDS)] for i in range(words))
+
+
+def legacy_layout(texts: list[str]) -> int:
+    draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+    font = ImageFont.load_default()
+    y = 0
+    for text in texts:
+        for paragraph in text.splitlines():
+            words = paragraph.split()
+            lines = []
+            current = words[0]
+            for word in words[1:]:
+                candidate = f"{current} {word}"
+                if draw.textlength(candidate, font=font) <= MAX_WIDTH:
+                    current = candidate
+                else:
+                    lines.append(current)
+                    current = word
+            lines.append(current)
+            for line in lines:
+                bbox = font.getbbox(line)
+                y += max(1, bbox[3] - bbox[1]) + 6
+    return y
+
+
+def cached_layout(texts: list[str]) -> int:
+    metrics = default_font_registry.get("body")
+    y = 0
+    for text in texts:
+        y += len(wrap_text(text, metrics, MAX_WIDTH)) * (metrics.line_height + 6)
+    return y
+
+
+def bench(label: str, fn, repeat: int, number: int) -> float:
+    timings = timeit.repeat(fn, repeat=repeat, number=number)
+    best = min(timings) / number * 1000
+    median = statistics.median(timings) / number * 1000
+    print(f"  {label:<10} best {best:9.3f} ms   median {median:9.3f} ms")
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    cases = {
+        "short prompt + 3 bullets": [sample_text(12)] + [sample_text(8)] * 3,
+        "long prompt (1500 words)": [sample_text(1500)],
+        "50 long bullets": [sample_text(40)] * 50,
+    }
+    for name, texts in cases.items():
+        print(name)
+        legacy = bench(
+            "legacy", lambda: legacy_layout(texts), args.repeat, args.number
+        )
+        cached = bench(
+            "cached", lambda: cached_layout(texts), args.repeat, args.number
+        )
+        print(f"  {'':<10} {legacy / cached:5.1f}x faster")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BlockingExecutor:
+    """Sized thread pool for running blocking calls from async code.
+
+    Tracks queue depth (calls submitted but not yet running) and the time
+    calls spend waiting for a thread, so pool sizing problems show up in
+    metrics instead of as unexplained request latency.
+    """
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        self.name = name
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{name}-executor"
+        )
+        self._lock = Lock()
+        self._queued = 0
+        self._running = 0
+        self._submitted = 0
+        self._started = 0
+        self._completed = 0
+        self._failed = 0
+        self._max_queue_depth = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    async def run(self, fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """Run ``fn`` on the pool and await its result."""
+        loop = asyncio.get_running_loop()
+        submitted_at = time.perf_counter()
+        started = False
+        abandoned = False
+        with self._lock:
+            self._submitted += 1
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+
+        def call() -> R:
+            nonlocal started, abandoned
+            wait_seconds = time.perf_counter() - submitted_at
+            with self._lock:
+                started = True
+                if not abandoned:
+                    self._queued -= 1
+                self._running += 1
+                self._started += 1
+                self._total_wait_seconds += wait_seconds
+                self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException:
+                with self._lock:
+                    self._failed += 1
+                raise
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+            return result
+
+        try:
+            return await loop.run_in_executor(self._pool, call)
+        except asyncio.CancelledError:
+            with self._lock:
+                if not started:
+                    abandoned = True
+                    self._queued -= 1
+            raise
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "queue_depth": self._queued,
+                "max_queue_depth": self._max_queue_depth,
+                "running": self._running,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "avg_wait_ms": round(self._total_wait_seconds / self._started * 1000, 3)
+                if self._started
+                else 0.0,
+                "max_wait_ms": round(self._max_wait_seconds * 1000, 3),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+class AsyncFacade(Generic[T]):
+    """Async view of a blocking store or service.
+
+    Every method of the wrapped object becomes a coroutine function that runs
+    the original call on the given executor.
+    """
+
+    def __init__(self, target: T, executor: BlockingExecutor) -> None:
+        self.target = target
+        self.executor = executor
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.target, name)
+        if not callable(attr):
+            return attr
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self.executor.run(attr, *args, **kwargs)
+
+        call.__name__ = name
+        call.__doc__ = attr.__doc__
+        return call
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Callable, Literal
+
+from infograph.settings import settings
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is refused because its circuit is open."""
+
+
+@dataclass
+class CircuitBreaker:
+    """Count-based circuit breaker.
+
+    The outcomes of the last ``window_size`` calls are kept; once at least
+    ``minimum_calls`` are recorded and the failure rate reaches
+    ``failure_rate_threshold`` the circuit opens and calls are refused for
+    ``open_seconds``. It then lets ``half_open_max_calls`` trial calls
+    through: a success closes the circuit, a failure re-opens it.
+
+    Callers pair every allowed call with ``record_success``,
+    ``record_failure`` or, for calls abandoned without an outcome,
+    ``record_cancelled``.
+    """
+
+    name: str
+    failure_rate_threshold: float = field(
+        default_factory=lambda: settings.search_breaker_failure_rate
+    )
+    minimum_calls: int = field(default_factory=lambda: settings.search_breaker_min_calls)
+    window_size: int = field(default_factory=lambda: settings.search_breaker_window)
+    open_seconds: float = field(
+        default_factory=lambda: settings.search_breaker_open_seconds
+    )
+    half_open_max_calls: int = 1
+    clock: Callable[[], float] = time.monotonic
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+    _outcomes: deque[bool] = field(init=False, repr=False)
+    _state: BreakerState = field(default="closed", init=False, repr=False)
+    _opened_at: float = field(default=0.0, init=False, repr=False)
+    _trials: int = field(default=0, init=False, repr=False)
+    _times_opened: int = field(default=0, init=False, repr=False)
+    _rejected: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._outcomes = deque(maxlen=self.window_size)
+
+    @property
+    def state(self) -> BreakerState:
+        with self._lock:
+            return self._current_state()
+
+    def allow(self) -> bool:
+        """Return whether a call may proceed, reserving a trial if half-open."""
+        with self._lock:
+            state = self._current_state()
+            if state == "closed":
+                return True
+            if state == "half_open" and self._trials < self.half_open_max_calls:
+                self._trials += 1
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._current_state() == "half_open":
+                self._state = "closed"
+                self._trials = 0
+                self._outcomes.clear()
+            self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._current_state() == "half_open":
+                self._open()
+                return
+            self._outcomes.append(False)
+            if len(self._outcomes) >= self.minimum_calls and (
+                self._failure_rate() >= self.failure_rate_threshold
+            ):
+                self._open()
+
+    def record_cancelled(self) -> None:
+        with self._lock:
+            if self._current_state() == "half_open" and self._trials:
+                self._trials -= 1
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "failure_rate": round(self._failure_rate(), 4),
+                "calls_in_window": len(self._outcomes),
+                "times_opened": self._times_opened,
+                "rejected": self._rejected,
+            }
+
+    def _current_state(self) -> BreakerState:
+        if self._state == "open" and self.clock() - self._opened_at >= self.open_seconds:
+            self._state = "half_open"
+            self._trials = 0
+        return self._state
+
+    def _failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def _open(self) -> None:
+        self._state = "open"
+        self._opened_at = self.clock()
+        self._trials = 0
+        self._times_opened += 1
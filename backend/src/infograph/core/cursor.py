@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import base64
+import json
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(created_at: int, item_id: str) -> str:
+    """Encode a ``(created_at, id)`` keyset position as an opaque string."""
+    raw = json.dumps([created_at, item_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, str]:
+    """Decode a cursor produced by :func:`encode_cursor`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+    if not isinstance(created_at, int) or not isinstance(item_id, str):
+        raise InvalidCursorError("Invalid cursor")
+    return created_at, item_id
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+
+@dataclass(frozen=True)
+class SessionEvent:
+    """Event published for a research session."""
+
+    session_id: str
+    event: str
+    data: dict[str, Any]
+
+
+@dataclass(eq=False)
+class Subscription:
+    """Bounded per-subscriber queue bound to the subscriber's event loop.
+
+    A subscriber that falls more than ``max_queue`` events behind is marked
+    overflowed and should reconnect, rather than blocking publishers or
+    silently missing events.
+    """
+
+    topic: str
+    loop: asyncio.AbstractEventLoop
+    max_queue: int
+    overflowed: bool = False
+    _queue: asyncio.Queue[SessionEvent | None] = field(init=False, repr=False)
+    _bus: EventBus | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+
+    async def get(self, timeout: float | None = None) -> SessionEvent | None:
+        """Return the next event, or None once the subscription overflowed."""
+        if self.overflowed:
+            return None
+        return await asyncio.wait_for(self._queue.get(), timeout)
+
+    def close(self) -> None:
+        if self._bus is not None:
+            self._bus.unsubscribe(self)
+            self._bus = None
+
+    def _deliver(self, event: SessionEvent) -> None:
+        if self.overflowed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            self._queue.get_nowait()
+            self._queue.put_nowait(None)
+
+
+class EventBus:
+    """In-process pub/sub fanning session events out to async subscribers.
+
+    ``publish`` is thread-safe and never blocks, so stores can call it from
+    worker threads; delivery is scheduled onto each subscriber's loop.
+    """
+
+    def __init__(self, max_queue: int = 256) -> None:
+        self.max_queue = max_queue
+        self._lock = Lock()
+        self._subscriptions: dict[str, set[Subscription]] = {}
+
+    def subscribe(self, topic: str) -> Subscription:
+        """Subscribe from a coroutine running on the consumer's loop."""
+        subscription = Subscription(
+            topic=topic,
+            loop=asyncio.get_running_loop(),
+            max_queue=self.max_queue,
+            _bus=self,
+        )
+        with self._lock:
+            self._subscriptions.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.topic)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.topic]
+
+    def subscriber_count(self, topic: str) -> int:
+        with self._lock:
+            return len(self._subscriptions.get(topic, ()))
+
+    def publish(self, event: SessionEvent) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(event.session_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+            except RuntimeError:
+                # The subscriber's loop has been closed.
+                self.unsubscribe(subscription)
+
+
+default_event_bus = EventBus()
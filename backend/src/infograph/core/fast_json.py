@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable, Sequence
+
+from fastapi import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(value: Any) -> bytes:
+    """Encode plain JSON data (dicts, lists, str, int, float, bool, None).
+
+    Uses orjson when it is installed and falls back to the standard
+    library otherwise; both produce the same compact UTF-8 output as
+    FastAPI's own ``JSONResponse``.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(
+        value, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def records(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> list[dict[str, Any]]:
+    """Zip database rows into dicts keyed by ``columns``."""
+    return [dict(zip(columns, row)) for row in rows]
+
+
+class FastJSONResponse(Response):
+    """JSON response for trusted store records.
+
+    Routes return one of these instead of Pydantic models to skip
+    ``response_model`` validation and serialization entirely; the content
+    must already be plain JSON data shaped like the declared model.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
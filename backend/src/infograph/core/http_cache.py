@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+
+from fastapi import Request, Response
+
+# Content-addressed URLs never change what they point at.
+IMMUTABLE = "private, max-age=31536000, immutable"
+# Per-user data that may change: cache, but revalidate before every use.
+REVALIDATE = "private, no-cache"
+
+
+def strong_etag(*parts: object) -> str:
+    """Quoted strong entity tag derived from the given parts."""
+    raw = "\x00".join(str(part) for part in parts)
+    return f'"{hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def http_date(timestamp: float) -> str:
+    return formatdate(timestamp, usegmt=True)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of ``etag`` against an If-None-Match header value."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: float | None = None
+) -> bool:
+    """Whether the client's cached copy is current (RFC 9110 section 13.2.2).
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted
+    without it.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified) <= since
+    return False
+
+
+def cache_headers(
+    etag: str, cache_control: str, last_modified: float | None = None
+) -> dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
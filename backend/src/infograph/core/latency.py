@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import math
+from collections import deque
+from threading import Lock
+from typing import Any
+
+
+class LatencyWindow:
+    """Sliding window of recent latencies with quantile lookups."""
+
+    def __init__(self, size: int = 200) -> None:
+        self._lock = Lock()
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """Nearest-rank quantile of the window, or None when empty."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, math.ceil(q * len(samples)) - 1))
+        return samples[index]
+
+    def metrics(self) -> dict[str, Any]:
+        p50, p95 = self.quantile(0.5), self.quantile(0.95)
+        return {
+            "samples": len(self),
+            "p50_ms": round(p50 * 1000, 3) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000, 3) if p95 is not None else None,
+        }
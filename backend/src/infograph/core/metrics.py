@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Callable
+
+
+class MetricsRegistry:
+    """Named collection of metric providers exposed by the API."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._providers: dict[str, Callable[[], dict[str, Any]]] = {}
+
+    def register(self, name: str, provider: Callable[[], dict[str, Any]]) -> None:
+        with self._lock:
+            self._providers[name] = provider
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            providers = dict(self._providers)
+        return {name: provider() for name, provider in sorted(providers.items())}
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Iterator
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+from infograph.core.blocking_executor import BlockingExecutor
+from infograph.core.fast_json import dumps
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Whether the client asked for newline-delimited JSON."""
+    accept = request.headers.get("accept", "")
+    return any(
+        part.split(";")[0].strip().lower() == NDJSON_MEDIA_TYPE
+        for part in accept.split(",")
+    )
+
+
+async def _encode_batches(
+    batches: Iterator[list[dict[str, Any]]], executor: BlockingExecutor
+) -> AsyncIterator[bytes]:
+    try:
+        while True:
+            batch = await executor.run(next, batches, None)
+            if batch is None:
+                return
+            yield b"".join(dumps(record) + b"\n" for record in batch)
+    finally:
+        await executor.run(_close, batches)
+
+
+def _close(batches: Iterator[list[dict[str, Any]]]) -> None:
+    try:
+        batches.close()
+    except ValueError:
+        # Still running on another thread after a cancelled fetch; the
+        # generator closes its cursor when it is collected.
+        pass
+
+
+def ndjson_response(
+    batches: Iterator[list[dict[str, Any]]], executor: BlockingExecutor
+) -> StreamingResponse:
+    """Stream record batches as one JSON object per line.
+
+    Each batch is fetched on ``executor`` and written as soon as it is
+    encoded, so memory stays flat however many records there are.
+    """
+    return StreamingResponse(
+        _encode_batches(batches, executor), media_type=NDJSON_MEDIA_TYPE
+    )
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+JobStatus = Literal["queued", "running", "completed", "failed"]
+
+
+class JobCreate(BaseModel):
+    """Fields for enqueuing a background job."""
+
+    session_id: str
+    job_type: str = "research"
+    max_attempts: int = 3
+
+
+class Job(BaseModel):
+    """Background job claimed by workers under a lease."""
+
+    job_id: str = Field(..., description="UUID")
+    session_id: str
+    job_type: str
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    worker_id: str | None = None
+    lease_expires_at: int | None = None
+    last_error: str | None = None
+    created_at: int
+    updated_at: int
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of results with an opaque cursor for the next page."""
+
+    items: list[T]
+    next_cursor: str | None = None
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class SearchCacheEntry(BaseModel):
+    """Cached search results for one normalized query and result limit."""
+
+    cache_key: str
+    query: str
+    max_results: int
+    results: list[dict[str, Any]]
+    fetched_at: int
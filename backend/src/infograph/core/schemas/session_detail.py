@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from infograph.core.schemas.infographic import Infographic
+from infograph.core.schemas.message import Message
+from infograph.core.schemas.page import Page
+from infograph.core.schemas.research_session import ResearchSession
+from infograph.core.schemas.source import Source
+
+DETAIL_PARTS = ("sources", "messages", "infographic")
+
+
+class SessionDetail(BaseModel):
+    """A session with the related records requested via ``include``.
+
+    Parts that were not requested are null; ``infographic`` is also null
+    when the session has none yet.
+    """
+
+    session: ResearchSession
+    sources: list[Source] | None = None
+    messages: Page[Message] | None = None
+    infographic: Infographic | None = None
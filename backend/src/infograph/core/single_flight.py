@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from threading import Event, Lock
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar
+
+R = TypeVar("R")
+
+
+class SingleFlightError(RuntimeError):
+    """Base class for single-flight failures."""
+
+
+class SingleFlightLimitError(SingleFlightError):
+    """Raised when a key already has the maximum number of waiters."""
+
+
+class SingleFlightTimeoutError(SingleFlightError, TimeoutError):
+    """Raised when a waiter gives up on the in-flight call."""
+
+
+@dataclass(eq=False)
+class _Call(Generic[R]):
+    done: Event = field(default_factory=Event)
+    result: R | None = None
+    error: BaseException | None = None
+    waiters: int = 0
+
+
+@dataclass(eq=False)
+class _AsyncCall(Generic[R]):
+    task: asyncio.Task[R]
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for and share its outcome, result or exception. At most
+    ``max_waiters`` callers may wait per key, and each waits at most
+    ``timeout_seconds``; the leader itself is never interrupted.
+
+    ``do`` coalesces blocking calls across threads and ``ado`` coalesces
+    coroutines on one event loop. Async work runs in its own task, so a
+    cancelled caller never cancels it for the others.
+    """
+
+    def __init__(self, max_waiters: int, timeout_seconds: float) -> None:
+        self.max_waiters = max_waiters
+        self.timeout_seconds = timeout_seconds
+        self._lock = Lock()
+        self._calls: dict[Hashable, _Call[Any]] = {}
+        self._async_calls: dict[Hashable, _AsyncCall[Any]] = {}
+        self._executions = 0
+        self._coalesced = 0
+        self._rejected = 0
+        self._timeouts = 0
+
+    def do(self, key: Hashable, fn: Callable[[], R]) -> R:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self._executions += 1
+                leader = True
+            elif call.waiters >= self.max_waiters:
+                self._rejected += 1
+                raise SingleFlightLimitError(f"Too many waiters for {key!r}")
+            else:
+                call.waiters += 1
+                self._coalesced += 1
+                leader = False
+        if leader:
+            return self._lead(key, call, fn)
+        if not call.done.wait(self.timeout_seconds):
+            with self._lock:
+                call.waiters -= 1
+                self._timeouts += 1
+            raise SingleFlightTimeoutError(f"Timed out waiting for {key!r}")
+        if call.error is not None:
+            raise call.error
+        return call.result  # type: ignore[return-value]
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[R]]) -> R:
+        with self._lock:
+            call = self._async_calls.get(key)
+            if call is None:
+                call = _AsyncCall(task=asyncio.ensure_future(fn()))
+                self._async_calls[key] = call
+                self._executions += 1
+                call.task.add_done_callback(
+                    lambda _task: self._forget_async(key, call)
+                )
+                leader = True
+            elif call.waiters >= self.max_waiters:
+                self._rejected += 1
+                raise SingleFlightLimitError(f"Too many waiters for {key!r}")
+            else:
+                call.waiters += 1
+                self._coalesced += 1
+                leader = False
+        if leader:
+            return await asyncio.shield(call.task)
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(call.task), self.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._timeouts += 1
+            raise SingleFlightTimeoutError(f"Timed out waiting for {key!r}") from None
+        finally:
+            with self._lock:
+                call.waiters -= 1
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            calls = [*self._calls.values(), *self._async_calls.values()]
+            return {
+                "in_flight": len(calls),
+                "waiting": sum(call.waiters for call in calls),
+                "executions": self._executions,
+                "coalesced": self._coalesced,
+                "rejected": self._rejected,
+                "timeouts": self._timeouts,
+            }
+
+    def _lead(self, key: Hashable, call: _Call[R], fn: Callable[[], R]) -> R:
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def _forget_async(self, key: Hashable, call: _AsyncCall[Any]) -> None:
+        with self._lock:
+            if self._async_calls.get(key) is call:
+                del self._async_calls[key]
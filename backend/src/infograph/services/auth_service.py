@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+import duckdb
 import jwt
-from google.auth.transport import requests
-from google.oauth2 import id_token
 
 from infograph.core.schemas.user import User, UserCreate
+from infograph.services.google_token_verifier import (
+    CertificateFetchError,
+    GoogleTokenVerifier,
+    default_google_token_verifier,
+)
 from infograph.settings import settings
 from infograph.stores.duckdb.user_store_duckdb import UserStoreDuckDB
 
@@ -16,22 +20,29 @@ class AuthServiceError(RuntimeError):
     """Raised when authentication fails."""
 
 
+class AuthUnavailableError(AuthServiceError):
+    """Raised when a credential cannot be checked right now."""
+
+
 @dataclass
 class AuthService:
     """Service for Google OAuth verification and JWT issuance."""
 
     user_store: UserStoreDuckDB
+    token_verifier: GoogleTokenVerifier = field(
+        default_factory=lambda: default_google_token_verifier
+    )
 
     def verify_google_token(self, credential: str) -> dict:
         """Verify Google credential and return payload."""
         if not settings.google_client_id:
             raise AuthServiceError("Google client ID not configured")
         try:
-            return id_token.verify_oauth2_token(
-                credential,
-                requests.Request(),
-                settings.google_client_id,
-            )
+            return self.token_verifier.verify(credential, settings.google_client_id)
+        except CertificateFetchError as exc:
+            raise AuthUnavailableError(
+                "Google sign-in is temporarily unavailable"
+            ) from exc
         except ValueError as exc:
             raise AuthServiceError("Invalid Google token") from exc
 
@@ -47,9 +58,16 @@ class AuthService:
         if existing_user:
             return existing_user
 
-        return self.user_store.create_user(
-            UserCreate(email=email, name=name, google_id=google_id)
-        )
+        try:
+            return self.user_store.create_user(
+                UserCreate(email=email, name=name, google_id=google_id)
+            )
+        except duckdb.ConstraintException:
+            # A concurrent first login created the user; google_id is unique.
+            existing_user = self.user_store.get_user_by_google_id(google_id)
+            if existing_user is None:
+                raise
+            return existing_user
 
     def issue_token(self, user: User) -> str:
         """Issue JWT token for user."""
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Mapping, Protocol
+
+import jwt as pyjwt
+from google.auth import exceptions as google_exceptions
+from google.auth import jwt as google_jwt
+from google.auth.transport import requests
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_OAUTH2_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+GOOGLE_ISSUERS = {"accounts.google.com", "https://accounts.google.com"}
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def parse_max_age(cache_control: str | None) -> float | None:
+    """Return the ``max-age`` of a Cache-Control header, if any."""
+    if not cache_control:
+        return None
+    match = _MAX_AGE_PATTERN.search(cache_control)
+    return float(match.group(1)) if match else None
+
+
+class CertificateFetchError(RuntimeError):
+    """Raised when signing certificates cannot be fetched.
+
+    Deliberately not a ``ValueError``: the token may be fine, the outage is
+    ours or Google's.
+    """
+
+
+class CertSource(Protocol):
+    """Where signing certificates come from.
+
+    ``fetch`` returns PEM certificates (or public keys) by key id, plus how
+    long they may be cached in seconds, or ``None`` when unspecified.
+    """
+
+    def fetch(self) -> tuple[Mapping[str, str], float | None]: ...
+
+
+@dataclass
+class HttpCertSource:
+    """Fetches Google's OAuth2 certificates over HTTP."""
+
+    url: str = GOOGLE_OAUTH2_CERTS_URL
+    timeout_seconds: float = 10.0
+    _request: requests.Request = field(
+        default_factory=requests.Request, init=False, repr=False
+    )
+
+    def fetch(self) -> tuple[Mapping[str, str], float | None]:
+        try:
+            response = self._request(
+                self.url, method="GET", timeout=self.timeout_seconds
+            )
+        except google_exceptions.TransportError as exc:
+            raise CertificateFetchError(f"Could not fetch certificates: {exc}") from exc
+        if response.status != 200:
+            raise CertificateFetchError(
+                f"Could not fetch certificates: HTTP {response.status}"
+            )
+        data = response.data
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        headers = {key.lower(): value for key, value in response.headers.items()}
+        try:
+            certs = json.loads(data)
+        except ValueError as exc:
+            raise CertificateFetchError("Certificate response is not JSON") from exc
+        return certs, parse_max_age(headers.get("cache-control"))
+
+
+@dataclass
+class GoogleTokenVerifier:
+    """Verifies Google ID tokens against an in-process certificate cache.
+
+    Certificates are kept for the ``max-age`` the source reports. Once less
+    than ``refresh_margin_seconds`` remain, a background thread refreshes
+    them while requests keep using the cached set; only a cold or fully
+    expired cache makes a caller wait on the fetch. A token signed with an
+    unknown key id forces one refresh (rate limited by
+    ``min_refresh_interval_seconds``) to pick up rotated keys.
+
+    When a fetch fails, the last good certificates keep being served and
+    the fetch is retried after ``min_refresh_interval_seconds``; with
+    nothing cached yet, ``CertificateFetchError`` is raised.
+    """
+
+    cert_source: CertSource = field(default_factory=HttpCertSource)
+    default_ttl_seconds: float = 300.0
+    refresh_margin_seconds: float = 60.0
+    min_refresh_interval_seconds: float = 30.0
+    clock: Callable[[], float] = time.monotonic
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _refresh_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    _certs: Mapping[str, str] = field(default_factory=dict, init=False, repr=False)
+    _expires_at: float = field(default=0.0, init=False, repr=False)
+    _fetched_at: float | None = field(default=None, init=False, repr=False)
+    _refreshing: bool = field(default=False, init=False, repr=False)
+    _fetches: int = field(default=0, init=False, repr=False)
+    _failures: int = field(default=0, init=False, repr=False)
+
+    def verify(self, token: str, audience: str) -> dict[str, Any]:
+        """Verify signature, expiry, audience and issuer; return the claims.
+
+        Raises ``ValueError`` for any invalid token and
+        ``CertificateFetchError`` when no certificates can be obtained.
+        """
+        try:
+            key_id = pyjwt.get_unverified_header(token).get("kid")
+        except pyjwt.PyJWTError as exc:
+            raise ValueError("Malformed token") from exc
+        certs = self.certs()
+        if key_id is not None and key_id not in certs and self._may_force_refresh():
+            certs = self.refresh()
+        claims = google_jwt.decode(token, certs=dict(certs), audience=audience)
+        if claims.get("iss") not in GOOGLE_ISSUERS:
+            raise ValueError(f"Wrong issuer: {claims.get('iss')}")
+        return claims
+
+    def certs(self) -> Mapping[str, str]:
+        """Return cached certificates, refreshing them as needed."""
+        now = self.clock()
+        with self._lock:
+            certs, expires_at = self._certs, self._expires_at
+        if not certs or now >= expires_at:
+            return self.refresh()
+        if now >= expires_at - self.refresh_margin_seconds:
+            self._refresh_in_background()
+        return certs
+
+    def refresh(self) -> Mapping[str, str]:
+        """Fetch certificates now; concurrent callers share one fetch."""
+        started = self.clock()
+        with self._refresh_lock:
+            with self._lock:
+                if self._fetched_at is not None and self._fetched_at >= started:
+                    return self._certs
+            try:
+                certs, max_age = self.cert_source.fetch()
+            except Exception as exc:
+                with self._lock:
+                    self._failures += 1
+                    if self._certs:
+                        logger.warning(
+                            "Certificate fetch failed; serving the last good set",
+                            exc_info=True,
+                        )
+                        self._expires_at = max(
+                            self._expires_at,
+                            self.clock() + self.min_refresh_interval_seconds,
+                        )
+                        return self._certs
+                if isinstance(exc, CertificateFetchError):
+                    raise
+                raise CertificateFetchError(
+                    f"Could not fetch certificates: {exc}"
+                ) from exc
+            fetched_at = self.clock()
+            ttl = self.default_ttl_seconds if max_age is None else max_age
+            with self._lock:
+                self._certs = dict(certs)
+                self._fetched_at = fetched_at
+                self._expires_at = fetched_at + ttl
+                self._fetches += 1
+                return self._certs
+
+    def metrics(self) -> dict[str, Any]:
+        now = self.clock()
+        with self._lock:
+            return {
+                "keys": len(self._certs),
+                "fetches": self._fetches,
+                "failures": self._failures,
+                "expires_in_seconds": round(max(self._expires_at - now, 0.0), 3),
+            }
+
+    def _may_force_refresh(self) -> bool:
+        with self._lock:
+            return (
+                self._fetched_at is None
+                or self.clock() - self._fetched_at >= self.min_refresh_interval_seconds
+            )
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run() -> None:
+            try:
+                self.refresh()
+            except Exception:
+                logger.warning("Background certificate refresh failed", exc_info=True)
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(target=run, name="google-cert-refresh", daemon=True).start()
+
+
+default_google_token_verifier = GoogleTokenVerifier()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Iterable
+
+from infograph.core.blocking_executor import BlockingExecutor
+from infograph.services.infographic_service import (
+    IMAGE_FORMATS,
+    IMAGE_SIZES,
+    content_lock,
+    source_image_path,
+    variant_path,
+)
+from infograph.settings import settings
+from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class InfographicFileReclaimer:
+    """Background deletion of infographic images no longer in the database.
+
+    Paths released by a session delete are scheduled for prompt removal, and
+    a periodic sweep of the output directory catches files orphaned any other
+    way (crashes between render and insert, deletes from older versions).
+    Every candidate is re-checked against the ``infographics`` table in
+    batches before it is unlinked, and the sweep skips files younger than the
+    grace period so an in-flight render is never removed. Candidates are
+    checked once more under their content lock, as a content-addressed image
+    may be picked up by a new infographic at any time. Size and format
+    variants live as long as the image they were derived from.
+    """
+
+    infographic_store: InfographicStoreDuckDB
+    output_dir: Path = field(default_factory=lambda: Path(settings.infographic_path))
+    interval_seconds: float = field(
+        default_factory=lambda: settings.infographic_reclaim_interval_seconds
+    )
+    batch_size: int = field(
+        default_factory=lambda: settings.infographic_reclaim_batch_size
+    )
+    grace_seconds: float = field(
+        default_factory=lambda: settings.infographic_orphan_grace_seconds
+    )
+    executor: BlockingExecutor | None = None
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+    _pending: set[str] = field(default_factory=set, init=False, repr=False)
+    _loop: asyncio.AbstractEventLoop | None = field(default=None, init=False, repr=False)
+    _wakeup: asyncio.Event | None = field(default=None, init=False, repr=False)
+    _task: asyncio.Task | None = field(default=None, init=False, repr=False)
+    _files_deleted: int = field(default=0, init=False, repr=False)
+    _bytes_reclaimed: int = field(default=0, init=False, repr=False)
+    _sweeps: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.executor is None:
+            self.executor = BlockingExecutor("reclaimer", 1)
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="infographic-reclaimer")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        self._loop = None
+        self._wakeup = None
+
+    def schedule(self, image_paths: Iterable[str]) -> None:
+        """Queue released image paths for deletion; safe from any thread."""
+        with self._lock:
+            self._pending.update(path for path in image_paths if path)
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def reclaim(self, image_paths: list[str]) -> int:
+        """Delete the given files that no infographic references any more."""
+        deleted = 0
+        for start in range(0, len(image_paths), self.batch_size):
+            batch = image_paths[start : start + self.batch_size]
+            sources = {path: str(source_image_path(Path(path))) for path in batch}
+            referenced = self.infographic_store.filter_referenced_image_paths(
+                sorted(set(sources.values()))
+            )
+            for path in batch:
+                if sources[path] not in referenced:
+                    deleted += self._unlink_unreferenced(Path(path), sources[path])
+        return deleted
+
+    def reclaim_pending(self) -> int:
+        with self._lock:
+            pending, self._pending = sorted(self._pending), set()
+        return self.reclaim(pending)
+
+    def sweep(self) -> int:
+        """Reclaim unreferenced images older than the grace period."""
+        if not self.output_dir.is_dir():
+            return 0
+        cutoff = time.time() - self.grace_seconds
+        deleted = 0
+        batch: list[str] = []
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_file() or entry.stat().st_mtime > cutoff:
+                        continue
+                except FileNotFoundError:
+                    # A variant already removed along with its image.
+                    continue
+                batch.append(str(self.output_dir / entry.name))
+                if len(batch) >= self.batch_size:
+                    deleted += self.reclaim(batch)
+                    batch = []
+        if batch:
+            deleted += self.reclaim(batch)
+        with self._lock:
+            self._sweeps += 1
+        return deleted
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "files_deleted": self._files_deleted,
+                "bytes_reclaimed": self._bytes_reclaimed,
+                "sweeps": self._sweeps,
+            }
+
+    def _unlink_unreferenced(self, path: Path, source: str) -> int:
+        """Unlink ``path``, and every variant if it is a rendered image."""
+        paths = [path]
+        if path == Path(source):
+            paths = sorted(
+                {
+                    variant_path(path, size, image_format)
+                    for size in IMAGE_SIZES
+                    for image_format in IMAGE_FORMATS
+                }
+            )
+        with content_lock(path.stem):
+            if self.infographic_store.filter_referenced_image_paths([source]):
+                return 0
+            return sum(self._unlink(candidate) for candidate in paths)
+
+    def _unlink(self, path: Path) -> bool:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        except OSError:
+            logger.warning("Could not delete infographic file %s", path, exc_info=True)
+            return False
+        with self._lock:
+            self._files_deleted += 1
+            self._bytes_reclaimed += size
+        return True
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        wakeup = self._wakeup
+        next_sweep = time.monotonic()
+        while True:
+            wakeup.clear()
+            try:
+                if time.monotonic() >= next_sweep:
+                    await self.executor.run(self.sweep)
+                    next_sweep = time.monotonic() + self.interval_seconds
+                await self.executor.run(self.reclaim_pending)
+            except Exception:
+                logger.exception("Infographic file reclaim failed")
+            timeout = max(next_sweep - time.monotonic(), 0)
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
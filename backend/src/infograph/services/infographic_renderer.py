@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import os
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+from infograph.services.text_layout import FontMetrics, default_font_registry, wrap_text
+
+
+SAVE_OPTIONS: dict[str, dict] = {
+    "PNG": {"optimize": True},
+    "WEBP": {"quality": 82, "method": 4},
+}
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """Everything needed to render one infographic, picklable for workers."""
+
+    layout_data: dict
+    output_path: str
+    image_size: tuple[int, int] = (960, 540)
+    background_color: str = "white"
+    text_color: str = "black"
+
+
+def render_basic(job: RenderJob) -> str:
+    """Render the basic template to ``job.output_path`` and return the path.
+
+    Runs in render worker processes, so it only depends on the job.
+    """
+    output_path = Path(job.output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    layout_data = job.layout_data
+
+    image = Image.new("RGB", job.image_size, job.background_color)
+    draw = ImageDraw.Draw(image)
+    title_font = default_font_registry.get("title")
+    body_font = default_font_registry.get("body")
+
+    margin_x = 32
+    max_width = job.image_size[0] - margin_x * 2
+    y = 24
+
+    y = _draw_wrapped_text(
+        draw,
+        f"Research: {layout_data.get('title', '')}",
+        title_font,
+        margin_x,
+        y,
+        max_width,
+        job.text_color,
+    )
+    y += 12
+
+    y = _draw_wrapped_text(
+        draw,
+        "Key Points:",
+        body_font,
+        margin_x,
+        y,
+        max_width,
+        job.text_color,
+    )
+    for bullet in layout_data.get("bullets", []):
+        y = _draw_wrapped_text(
+            draw,
+            f"• {bullet}",
+            body_font,
+            margin_x + 8,
+            y,
+            max_width - 8,
+            job.text_color,
+        )
+
+    y += 8
+    _draw_wrapped_text(
+        draw,
+        f"Sources: {layout_data.get('source_count', 0)}",
+        body_font,
+        margin_x,
+        y,
+        max_width,
+        job.text_color,
+    )
+
+    _save_atomically(image, output_path, "PNG")
+    return str(output_path)
+
+
+def render_variant(
+    source_path: str,
+    output_path: str,
+    max_size: tuple[int, int] | None,
+    image_format: str,
+) -> str:
+    """Write a resized and/or re-encoded copy of a rendered image.
+
+    ``max_size`` bounds the variant while keeping the aspect ratio; None
+    keeps the original size. Returns the output path.
+    """
+    with Image.open(source_path) as source:
+        image = source.convert("RGB")
+    if max_size is not None:
+        image.thumbnail(max_size, Image.Resampling.LANCZOS)
+    _save_atomically(image, Path(output_path), image_format.upper())
+    return output_path
+
+
+def _save_atomically(image: Image.Image, output_path: Path, image_format: str) -> None:
+    # Written under a temporary name and renamed so a concurrent reader
+    # never sees a partial file under the content key.
+    options = SAVE_OPTIONS.get(image_format, {})
+    partial_path = output_path.with_name(f".{uuid.uuid4().hex}.partial")
+    image.save(partial_path, format=image_format, **options)
+    os.replace(partial_path, output_path)
+
+
+def _draw_wrapped_text(
+    draw: ImageDraw.ImageDraw,
+    text: str,
+    font: FontMetrics,
+    x: int,
+    y: int,
+    max_width: int,
+    fill: str,
+) -> int:
+    for line in wrap_text(text, font, max_width):
+        draw.text((x, y), line, font=font.font, fill=fill)
+        y += font.line_height + 6
+    return y
@@ -1,15 +1,69 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
-
-from PIL import Image, ImageDraw, ImageFont
+from threading import Lock
+from typing import Any, Callable
 
 from infograph.core.schemas.infographic import Infographic, InfographicCreate
 from infograph.core.schemas.research_session import ResearchSession
 from infograph.core.schemas.source import Source
+from infograph.services.infographic_renderer import (
+    RenderJob,
+    render_basic,
+    render_variant,
+)
+from infograph.services.render_engine import RenderEngine, RenderEngineError
 from infograph.settings import settings
 from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
+from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
+
+logger = logging.getLogger(__name__)
+
+# Bump when rendering changes so cached images are not reused for new output.
+RENDER_VERSION = 2
+
+# Renders and releases of the same content key are serialized so a file is
+# never unlinked between the existence check and the row that references it.
+_CONTENT_LOCKS = tuple(Lock() for _ in range(64))
+
+
+# Served image variants: size name -> bounding box (None keeps the original
+# size) and format name -> media type. "full" PNG is the rendered original.
+IMAGE_SIZES: dict[str, tuple[int, int] | None] = {"full": None, "thumb": (320, 180)}
+IMAGE_FORMATS = {"png": "image/png", "webp": "image/webp"}
+
+_VARIANT_NAME = re.compile(r"^(?P<stem>[^.]+)\.(?:thumb|full)\.(?:png|webp)$")
+
+
+def variant_path(image_path: Path, size: str, image_format: str) -> Path:
+    """Where the given variant of a rendered image is stored."""
+    if size == "full" and image_format == "png":
+        return image_path
+    return image_path.with_name(f"{image_path.stem}.{size}.{image_format}")
+
+
+def source_image_path(path: Path) -> Path:
+    """The rendered image a variant derives from; other paths map to themselves."""
+    match = _VARIANT_NAME.match(path.name)
+    return path.with_name(f"{match['stem']}.png") if match else path
+
+
+def content_key(render_spec: dict[str, Any]) -> str:
+    """Stable hash of everything that determines a rendered image."""
+    canonical = json.dumps(
+        render_spec, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def content_lock(key: str) -> Lock:
+    """Lock guarding renders and deletions of one content key's image."""
+    return _CONTENT_LOCKS[hash(key) % len(_CONTENT_LOCKS)]
 
 
 class InfographicServiceError(RuntimeError):
@@ -18,7 +72,22 @@ class InfographicServiceError(RuntimeError):
 
 @dataclass
 class InfographicService:
-    """Service for generating infographic assets."""
+    """Service for generating infographic assets.
+
+    Images are content-addressed: the layout, template, size and colors are
+    hashed into a key and the PNG is stored once as ``<key>.png``. Identical
+    layouts reuse the existing file without rendering. A file is shared by
+    every infographic row that points at it and is only removed once none
+    does.
+
+    Size and format variants (see ``IMAGE_SIZES`` and ``IMAGE_FORMATS``)
+    are derived from the rendered PNG on first request and stored next to
+    it; they share its lifetime.
+
+    With a ``render_engine`` the PIL work runs in its worker processes;
+    otherwise it runs in the calling thread. With a ``session_store`` the
+    infographic row is only written while its session still exists.
+    """
 
     infographic_store: InfographicStoreDuckDB
     output_dir: Path = field(default_factory=lambda: Path(settings.infographic_path))
@@ -26,6 +95,16 @@ class InfographicService:
     default_bullets_limit: int = 3
     background_color: str = "white"
     text_color: str = "black"
+    render_engine: RenderEngine | None = None
+    session_store: SessionStoreDuckDB | None = None
+    _counter_lock: Lock = field(default_factory=Lock, init=False, repr=False)
+    _counters: dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(
+            ("renders", "reuses", "variants", "files_released"), 0
+        ),
+        init=False,
+        repr=False,
+    )
 
     def generate_infographic(
         self,
@@ -38,23 +117,138 @@ class InfographicService:
             raise InfographicServiceError("Unsupported template type")
 
         layout_data = self._build_basic_layout(session, sources)
-        output_path = self._render_basic(layout_data, session.session_id)
-        self.infographic_store.delete_infographic(session.session_id)
-        return self.infographic_store.create_infographic(
-            InfographicCreate(
-                session_id=session.session_id,
-                template_type=template_type,
-                layout_data={
-                    **layout_data,
-                    "image_path": str(output_path),
-                },
-            )
-        )
+        key = content_key(self._render_spec(layout_data, template_type))
+        output_path = self.output_dir / f"{key}.png"
+        with content_lock(key):
+            if output_path.exists():
+                self._count("reuses")
+            else:
+                self._run_renderer(
+                    render_basic,
+                    RenderJob(
+                        layout_data=layout_data,
+                        output_path=str(output_path),
+                        image_size=self.image_size,
+                        background_color=self.background_color,
+                        text_color=self.text_color,
+                    ),
+                )
+                self._count("renders")
+            with self.infographic_store.client.transaction():
+                # A session deleted mid-render must not get a row that keeps
+                # the image referenced forever; the unreferenced file is
+                # left to the reclaimer's sweep.
+                if self.session_store is not None and not self.session_store.lock_session(
+                    session.session_id
+                ):
+                    raise InfographicServiceError("Session no longer exists")
+                released = self.infographic_store.delete_infographic(session.session_id)
+                infographic = self.infographic_store.create_infographic(
+                    InfographicCreate(
+                        session_id=session.session_id,
+                        template_type=template_type,
+                        layout_data={
+                            **layout_data,
+                            "content_key": key,
+                            "image_path": str(output_path),
+                        },
+                    )
+                )
+        self._release([path for path in released if path != str(output_path)])
+        return infographic
 
     def get_infographic(self, session_id: str) -> Infographic | None:
         """Return infographic metadata for a session."""
         return self.infographic_store.get_infographic(session_id)
 
+    def image_variant(
+        self, image_path: str, size: str = "full", image_format: str = "png"
+    ) -> Path | None:
+        """Return the path of an image variant, generating it if needed.
+
+        Returns None when the rendered image itself is missing.
+        """
+        if size not in IMAGE_SIZES or image_format not in IMAGE_FORMATS:
+            raise InfographicServiceError("Unsupported image variant")
+        source = Path(image_path)
+        target = variant_path(source, size, image_format)
+        if target.exists():
+            return target
+        with content_lock(source.stem):
+            if target.exists():
+                return target
+            if not source.exists():
+                return None
+            self._run_renderer(
+                render_variant,
+                str(source),
+                str(target),
+                IMAGE_SIZES[size],
+                image_format,
+            )
+            self._count("variants")
+        return target
+
+    def delete_infographic(self, session_id: str) -> None:
+        """Delete a session's infographic and any image no longer referenced."""
+        self._release(self.infographic_store.delete_infographic(session_id))
+
+    def metrics(self) -> dict[str, Any]:
+        with self._counter_lock:
+            counters = dict(self._counters)
+        total = counters["renders"] + counters["reuses"]
+        return {
+            **counters,
+            "reuse_ratio": round(counters["reuses"] / total, 4) if total else 0.0,
+        }
+
+    def _render_spec(self, layout_data: dict, template_type: str) -> dict[str, Any]:
+        return {
+            "version": RENDER_VERSION,
+            "template_type": template_type,
+            "layout": layout_data,
+            "image_size": list(self.image_size),
+            "background_color": self.background_color,
+            "text_color": self.text_color,
+        }
+
+    def _run_renderer(self, fn: Callable[..., str], *args: Any) -> None:
+        if self.render_engine is None:
+            fn(*args)
+            return
+        try:
+            self.render_engine.run(fn, *args)
+        except RenderEngineError as exc:
+            raise InfographicServiceError(f"Rendering failed: {exc}") from exc
+
+    def _release(self, image_paths: list[str]) -> None:
+        """Unlink each image, and its variants, that nothing references."""
+        for image_path in image_paths:
+            path = Path(image_path)
+            with content_lock(path.stem):
+                if self.infographic_store.filter_referenced_image_paths([image_path]):
+                    continue
+                variants = {
+                    variant_path(path, size, image_format)
+                    for size in IMAGE_SIZES
+                    for image_format in IMAGE_FORMATS
+                }
+                for variant in sorted(variants):
+                    try:
+                        variant.unlink()
+                    except FileNotFoundError:
+                        continue
+                    except OSError:
+                        logger.warning(
+                            "Could not delete infographic %s", variant, exc_info=True
+                        )
+                        continue
+                    self._count("files_released")
+
+    def _count(self, name: str) -> None:
+        with self._counter_lock:
+            self._counters[name] += 1
+
     def _build_basic_layout(
         self, session: ResearchSession, sources: list[Source]
     ) -> dict:
@@ -68,89 +262,3 @@ class InfographicService:
             "bullets": bullet_points,
             "source_count": len(sources),
         }
-
-    def _render_basic(self, layout_data: dict, session_id: str) -> Path:
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        output_path = self.output_dir / f"{session_id}_basic.png"
-
-        image = Image.new("RGB", self.image_size, self.background_color)
-        draw = ImageDraw.Draw(image)
-        title_font = ImageFont.load_default()
-        body_font = ImageFont.load_default()
-
-        margin_x = 32
-        max_width = self.image_size[0] - margin_x * 2
-        y = 24
-
-        y = self._draw_wrapped_text(
-            draw,
-            f"Research: {layout_data.get('title', '')}",
-            title_font,
-            margin_x,
-            y,
-            max_width,
-        )
-        y += 12
-
-        y = self._draw_wrapped_text(
-            draw,
-            "Key Points:",
-            body_font,
-            margin_x,
-            y,
-            max_width,
-        )
-        for bullet in layout_data.get("bullets", []):
-            y = self._draw_wrapped_text(
-                draw,
-                f"• {bullet}",
-                body_font,
-                margin_x + 8,
-                y,
-                max_width - 8,
-            )
-
-        y += 8
-        self._draw_wrapped_text(
-            draw,
-            f"Sources: {layout_data.get('source_count', 0)}",
-            body_font,
-            margin_x,
-            y,
-            max_width,
-        )
-
-        image.save(output_path, format="PNG")
-        return output_path
-
-    def _draw_wrapped_text(
-        self,
-        draw: ImageDraw.ImageDraw,
-        text: str,
-        font: ImageFont.ImageFont,
-        x: int,
-        y: int,
-        max_width: int,
-    ) -> int:
-        lines: list[str] = []
-        for paragraph in text.splitlines():
-            words = paragraph.split()
-            if not words:
-                lines.append("")
-                continue
-            current = words[0]
-            for word in words[1:]:
-                candidate = f"{current} {word}"
-                if draw.textlength(candidate, font=font) <= max_width:
-                    current = candidate
-                else:
-                    lines.append(current)
-                    current = word
-            lines.append(current)
-
-        for line in lines:
-            draw.text((x, y), line, font=font, fill=self.text_color)
-            bbox = font.getbbox(line)
-            line_height = max(1, bbox[3] - bbox[1])
-            y += line_height + 6
-        return y
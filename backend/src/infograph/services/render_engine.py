@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable, TypeVar
+
+from infograph.settings import settings
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+
+class RenderEngineError(RuntimeError):
+    """Raised when a render job cannot be completed."""
+
+
+class RenderQueueFullError(RenderEngineError):
+    """Raised when the engine already has its maximum of queued jobs."""
+
+
+class RenderTimeoutError(RenderEngineError, TimeoutError):
+    """Raised when a render job exceeds its timeout."""
+
+
+class RenderWorkerCrashedError(RenderEngineError):
+    """Raised when the worker process running a job died."""
+
+
+@dataclass
+class RenderEngine:
+    """Runs CPU-bound rendering in a pool of worker processes.
+
+    Jobs are picklable module-level functions and arguments. They run in
+    ``workers`` spawned processes, so PIL work never holds the API
+    process's GIL. ``initializer`` runs once in each new worker, e.g. to
+    preload fonts. At most ``workers + max_queue`` jobs are in flight;
+    beyond that ``run`` fails fast with ``RenderQueueFullError``.
+
+    A job that exceeds ``timeout_seconds`` (counted from submission) or
+    whose worker dies takes the pool down with it: the worker processes
+    are killed and a fresh pool is started on the next job. Other jobs
+    caught in the restart are retried once on the new pool.
+    """
+
+    workers: int = field(default_factory=lambda: settings.render_workers)
+    max_queue: int = field(default_factory=lambda: settings.render_queue_size)
+    timeout_seconds: float = field(
+        default_factory=lambda: settings.render_timeout_seconds
+    )
+    initializer: Callable[[], None] | None = None
+    _pool: ProcessPoolExecutor | None = field(default=None, init=False, repr=False)
+    _slots: BoundedSemaphore = field(init=False, repr=False)
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+    _closed: bool = field(default=False, init=False, repr=False)
+    _counters: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._slots = BoundedSemaphore(self.workers + self.max_queue)
+        self._counters = dict.fromkeys(
+            (
+                "submitted",
+                "completed",
+                "failed",
+                "rejected",
+                "timeouts",
+                "crashes",
+                "pool_restarts",
+            ),
+            0,
+        )
+
+    def run(self, fn: Callable[..., R], *args: Any) -> R:
+        """Run ``fn(*args)`` in a worker process and return its result."""
+        if not self._slots.acquire(blocking=False):
+            self._count("rejected")
+            raise RenderQueueFullError("Render queue is full")
+        self._count("submitted")
+        try:
+            for attempt in range(2):
+                pool = self._get_pool()
+                try:
+                    result = pool.submit(fn, *args).result(self.timeout_seconds)
+                except FutureTimeoutError:
+                    self._count("timeouts")
+                    self._restart(pool)
+                    raise RenderTimeoutError(
+                        f"Render exceeded {self.timeout_seconds}s"
+                    ) from None
+                except BrokenProcessPool as exc:
+                    # Only the first job to see a broken pool restarts it;
+                    # the others were collateral and get another attempt.
+                    if self._restart(pool) or attempt:
+                        self._count("crashes")
+                        raise RenderWorkerCrashedError("Render worker died") from exc
+                    continue
+                except Exception:
+                    self._count("failed")
+                    raise
+                self._count("completed")
+                return result
+            raise AssertionError("unreachable")
+        finally:
+            self._slots.release()
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "started": self._pool is not None,
+                **self._counters,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._closed = True
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._closed:
+                raise RenderEngineError("Render engine is shut down")
+            if self._pool is None:
+                # Spawned rather than forked: the API process is threaded.
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=self.initializer,
+                )
+            return self._pool
+
+    def _restart(self, pool: ProcessPoolExecutor) -> bool:
+        """Discard ``pool`` if it is still current; return whether it was."""
+        with self._lock:
+            if self._pool is not pool:
+                return False
+            self._pool = None
+            self._counters["pool_restarts"] += 1
+        logger.warning("Restarting render worker pool")
+        # ProcessPoolExecutor cannot interrupt a running job, so hung
+        # workers are killed directly.
+        for process in list(getattr(pool, "_processes", {}).values()):
+            process.kill()
+        pool.shutdown(wait=False, cancel_futures=True)
+        return True
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import time
+from dataclasses import dataclass, field
+
+from infograph.core.blocking_executor import BlockingExecutor
+from infograph.core.schemas.job import Job, JobCreate
+from infograph.core.schemas.research_session import ResearchSessionUpdate
+from infograph.services.research_service import ResearchService
+from infograph.settings import settings
+from infograph.stores.duckdb.job_store_duckdb import JobStoreDuckDB
+
+logger = logging.getLogger(__name__)
+
+UNFINISHED_STATUSES = ["pending", "searching", "generating"]
+
+
+@dataclass
+class ResearchJobRunner:
+    """Worker pool running research sessions from the durable job queue.
+
+    Jobs live in the ``jobs`` table, so any worker in any process sharing the
+    database can claim them. Each claim holds a lease that is extended by a
+    heartbeat while the pipeline runs; leases left behind by a crashed worker
+    expire and the job is re-queued until its attempts are exhausted.
+    """
+
+    research_service: ResearchService
+    job_store: JobStoreDuckDB
+    worker_count: int = field(default_factory=lambda: settings.research_worker_count)
+    lease_seconds: int = field(default_factory=lambda: settings.job_lease_seconds)
+    poll_interval_seconds: float = field(
+        default_factory=lambda: settings.job_poll_interval_seconds
+    )
+    max_attempts: int = field(default_factory=lambda: settings.job_max_attempts)
+    retention_seconds: int = field(
+        default_factory=lambda: settings.job_retention_seconds
+    )
+    worker_prefix: str = field(
+        default_factory=lambda: f"{socket.gethostname()}-{os.getpid()}"
+    )
+    store_executor: BlockingExecutor | None = None
+    _loop: asyncio.AbstractEventLoop | None = field(default=None, init=False, repr=False)
+    _wakeup: asyncio.Event | None = field(default=None, init=False, repr=False)
+    _tasks: list[asyncio.Task] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Rendering holds a pipeline thread for a while, so job-store calls
+        # (heartbeats in particular) get a separate pool.
+        if self.store_executor is None:
+            self.store_executor = BlockingExecutor("research-store", 2)
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """Recover stale work, then start workers on the running event loop."""
+        if self.is_running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        await self.store_executor.run(self.recover)
+        self._tasks = [
+            asyncio.create_task(
+                self._worker(f"{self.worker_prefix}-{index}"),
+                name=f"research-worker-{index}",
+            )
+            for index in range(self.worker_count)
+        ]
+        self._tasks.append(
+            asyncio.create_task(self._maintenance(), name="research-maintenance")
+        )
+
+    async def stop(self) -> None:
+        """Cancel worker tasks and wait for them to exit.
+
+        Jobs interrupted here keep their lease and are re-queued once it
+        expires.
+        """
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop = None
+        self._wakeup = None
+
+    def submit(self, session_id: str) -> Job:
+        """Persist a job for a session and wake an idle worker.
+
+        Inside a transaction the worker is only woken once it commits, so it
+        never polls before the job is visible.
+        """
+        job = self.job_store.enqueue_job(
+            JobCreate(session_id=session_id, max_attempts=self.max_attempts)
+        )
+        self.job_store.client.after_commit(self._notify)
+        return job
+
+    def recover(self) -> int:
+        """Re-queue expired leases and sweep sessions left without a job.
+
+        Returns the number of sessions that were given a new job.
+        """
+        self._handle_expired(self.job_store.requeue_expired_leases())
+        active_session_ids = self.job_store.list_active_session_ids()
+        swept = 0
+        session_store = self.research_service.session_store
+        for session in session_store.list_sessions_by_status(UNFINISHED_STATUSES):
+            if session.session_id in active_session_ids:
+                continue
+            session_store.update_session(
+                session.session_id, ResearchSessionUpdate(status="pending")
+            )
+            self.job_store.enqueue_job(
+                JobCreate(session_id=session.session_id, max_attempts=self.max_attempts)
+            )
+            swept += 1
+        if swept:
+            logger.info("Re-queued %s stale research sessions", swept)
+        return swept
+
+    def _notify(self) -> None:
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _handle_expired(self, jobs: list[Job]) -> None:
+        for job in jobs:
+            if job.status == "failed":
+                self._mark_session_failed(job.session_id)
+
+    def _mark_session_failed(self, session_id: str) -> None:
+        self.research_service.session_store.update_session(
+            session_id, ResearchSessionUpdate(status="failed")
+        )
+
+    async def _worker(self, worker_id: str) -> None:
+        assert self._wakeup is not None
+        wakeup = self._wakeup
+        while True:
+            wakeup.clear()
+            job = await self.store_executor.run(
+                self.job_store.claim_job, worker_id, self.lease_seconds
+            )
+            if job is None:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), self.poll_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._process(job, worker_id)
+
+    async def _process(self, job: Job, worker_id: str) -> None:
+        heartbeat = asyncio.create_task(self._heartbeat(job, worker_id))
+        try:
+            await self.research_service.arun_session(job.session_id)
+        except Exception as exc:
+            logger.exception("Research job %s failed", job.job_id)
+            failed = await self.store_executor.run(
+                self.job_store.fail_job, job.job_id, worker_id, str(exc)
+            )
+            if failed is not None and failed.status == "failed":
+                await self.store_executor.run(self._mark_session_failed, job.session_id)
+            else:
+                self._notify()
+        else:
+            await self.store_executor.run(
+                self.job_store.complete_job, job.job_id, worker_id
+            )
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, job: Job, worker_id: str) -> None:
+        interval = max(self.lease_seconds / 3, 0.1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                held = await self.store_executor.run(
+                    self.job_store.heartbeat, job.job_id, worker_id, self.lease_seconds
+                )
+            except Exception:
+                logger.warning("Heartbeat failed for job %s", job.job_id, exc_info=True)
+                continue
+            if not held:
+                logger.warning("Lost lease on job %s", job.job_id)
+                return
+
+    async def _maintenance(self) -> None:
+        interval = max(self.lease_seconds / 2, self.poll_interval_seconds)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                expired = await self.store_executor.run(
+                    self.job_store.requeue_expired_leases
+                )
+                await self.store_executor.run(self._handle_expired, expired)
+            except Exception:
+                logger.exception("Job lease maintenance failed")
+                continue
+            if expired:
+                self._notify()
+            try:
+                await self.store_executor.run(self.purge_finished)
+            except Exception:
+                logger.exception("Job retention purge failed")
+
+    def purge_finished(self) -> int:
+        """Delete completed and failed jobs older than the retention period."""
+        purged = self.job_store.purge_finished_jobs(
+            int(time.time()) - self.retention_seconds
+        )
+        if purged:
+            logger.info("Purged %s finished research jobs", purged)
+        return purged
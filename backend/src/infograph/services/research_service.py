@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+
+from infograph.core.blocking_executor import BlockingExecutor
+from infograph.core.schemas.research_session import (
+    ResearchSession,
+    ResearchSessionUpdate,
+)
+from infograph.core.schemas.source import Source, SourceCreate
+from infograph.services.infographic_service import (
+    InfographicService,
+    InfographicServiceError,
+)
+from infograph.services.search_service import SearchService, SearchServiceError
+from infograph.settings import settings
+from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
+from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
+
+
+@dataclass
+class ResearchService:
+    """Service running the search and infographic pipeline for a session.
+
+    The pipeline is a coroutine: the search is awaited on the search
+    service's async HTTP client, while store writes and rendering run on
+    ``executor``.
+    """
+
+    session_store: SessionStoreDuckDB
+    source_store: SourceStoreDuckDB
+    search_service: SearchService
+    infographic_service: InfographicService
+    executor: BlockingExecutor = field(
+        default_factory=lambda: BlockingExecutor(
+            "research", settings.research_worker_count
+        )
+    )
+
+    async def arun_session(self, session_id: str) -> ResearchSession | None:
+        """Move a session through searching, generating and completion.
+
+        Failures are recorded on the session as the ``failed`` status rather
+        than raised, so callers running this in the background only need to
+        handle unexpected errors. Re-running a session replaces its sources,
+        which keeps retried jobs idempotent. A session deleted while it runs
+        stops the pipeline at its next write and returns None.
+        """
+        run = self.executor.run
+        session = await run(self._set_status, session_id, "searching")
+        if session is None:
+            return None
+        try:
+            sources = await self.search_service.asearch_sources(
+                session.session_id,
+                session.prompt,
+            )
+            stored_sources = await run(self._replace_sources, session_id, sources)
+            if stored_sources is None:
+                return None
+            session = await run(self._set_status, session_id, "generating")
+            if session is None:
+                return None
+            await run(
+                self.infographic_service.generate_infographic,
+                session=session,
+                sources=stored_sources,
+            )
+        except (SearchServiceError, InfographicServiceError):
+            return await run(self._set_status, session_id, "failed")
+        return await run(self._set_status, session_id, "completed")
+
+    def run_session(self, session_id: str) -> ResearchSession | None:
+        """Blocking ``arun_session`` for callers without an event loop."""
+        return asyncio.run(self.arun_session(session_id))
+
+    def _replace_sources(
+        self, session_id: str, sources: list[SourceCreate]
+    ) -> list[Source] | None:
+        """Replace a session's sources; None if the session was deleted."""
+        with self.source_store.client.transaction():
+            if not self.session_store.lock_session(session_id):
+                return None
+            self.source_store.delete_sources_for_session(session_id)
+            return self.source_store.create_sources_bulk(sources)
+
+    def _set_status(self, session_id: str, status: str) -> ResearchSession | None:
+        return self.session_store.update_session(
+            session_id,
+            ResearchSessionUpdate(status=status),
+        )
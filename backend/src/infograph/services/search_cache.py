@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Awaitable, Callable
+
+from infograph.core.blocking_executor import BlockingExecutor
+from infograph.core.cache import TTLCache
+from infograph.core.schemas.search_cache import SearchCacheEntry
+from infograph.settings import settings
+from infograph.stores.duckdb.search_cache_store_duckdb import SearchCacheStoreDuckDB
+
+logger = logging.getLogger(__name__)
+
+SearchPayload = list[dict[str, Any]]
+
+
+def normalize_query(query: str) -> str:
+    """Canonical form of a query: NFKC, case-folded, single-spaced."""
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+def search_cache_key(query: str, max_results: int) -> str:
+    raw = f"{normalize_query(query)}\x00{max_results}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SearchCache:
+    """Two-level cache of search results with stale-while-revalidate.
+
+    Entries are fresh for ``ttl_seconds`` and then servable as stale for a
+    further ``stale_seconds``: a stale hit returns immediately and refreshes
+    the entry in the background. Lookups check an in-memory LRU first, then
+    the ``search_cache`` table, which survives restarts and is shared by
+    every process using the database.
+
+    ``aget_or_fetch`` is the asyncio counterpart: table reads and writes run
+    on ``executor`` and stale entries are refreshed in a task on the loop.
+
+    Empty result lists are never cached: a rate-limit or anti-bot page
+    parses to zero results, and caching it would starve every session with
+    that prompt for the whole TTL. An empty refresh keeps the previous entry.
+
+    Rows stay in the table for ``fallback_retention_seconds`` (at least the
+    stale window) so ``aget_expired`` still has something to serve when
+    upstream search fails long after an entry stopped being servable.
+    """
+
+    store: SearchCacheStoreDuckDB
+    ttl_seconds: float = field(default_factory=lambda: settings.search_cache_ttl_seconds)
+    stale_seconds: float = field(
+        default_factory=lambda: settings.search_cache_stale_seconds
+    )
+    fallback_retention_seconds: float = field(
+        default_factory=lambda: settings.search_cache_fallback_retention_seconds
+    )
+    memory_entries: int = field(
+        default_factory=lambda: settings.search_cache_memory_entries
+    )
+    purge_every: int = 100
+    refresh_workers: int = 2
+    clock: Callable[[], float] = time.time
+    executor: BlockingExecutor | None = None
+    _memory: TTLCache[str, SearchCacheEntry] = field(init=False, repr=False)
+    _refresh_pool: ThreadPoolExecutor = field(init=False, repr=False)
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+    _refreshing: set[str] = field(default_factory=set, init=False, repr=False)
+    _refresh_tasks: set[asyncio.Task] = field(default_factory=set, init=False, repr=False)
+    _writes: int = field(default=0, init=False, repr=False)
+    _counters: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Memory entries live until the end of the stale window; freshness is
+        # judged from fetched_at, like entries read from the table.
+        self._memory = TTLCache(
+            max_entries=self.memory_entries,
+            ttl_seconds=self.ttl_seconds + self.stale_seconds,
+        )
+        self._refresh_pool = ThreadPoolExecutor(
+            max_workers=self.refresh_workers, thread_name_prefix="search-refresh"
+        )
+        self._counters = dict.fromkeys(
+            (
+                "memory_hits",
+                "store_hits",
+                "misses",
+                "stale_hits",
+                "refreshes",
+                "refresh_failures",
+                "expired_served",
+                "empty_not_cached",
+            ),
+            0,
+        )
+
+    def get_or_fetch(
+        self,
+        query: str,
+        max_results: int,
+        fetch: Callable[[], SearchPayload],
+    ) -> SearchPayload:
+        """Return cached results, calling ``fetch`` on a miss."""
+        key = search_cache_key(query, max_results)
+        entry = self._memory_lookup(key)
+        if entry is None:
+            entry = self._remember(key, self.store.get_entry(key))
+        freshness = self._freshness(entry)
+        if freshness == "fresh":
+            return entry.results
+        if freshness == "stale":
+            self._refresh_in_background(key, query, max_results, fetch)
+            return entry.results
+        self._count("misses")
+        return self._fetch_and_store(key, query, max_results, fetch)
+
+    async def aget_or_fetch(
+        self,
+        query: str,
+        max_results: int,
+        fetch: Callable[[], Awaitable[SearchPayload]],
+    ) -> SearchPayload:
+        """Async ``get_or_fetch``; ``fetch`` is awaited on a miss."""
+        key = search_cache_key(query, max_results)
+        entry = self._memory_lookup(key)
+        if entry is None:
+            entry = self._remember(key, await self._blocking(self.store.get_entry, key))
+        freshness = self._freshness(entry)
+        if freshness == "fresh":
+            return entry.results
+        if freshness == "stale":
+            self._refresh_task(key, query, max_results, fetch)
+            return entry.results
+        self._count("misses")
+        return await self._afetch_and_store(key, query, max_results, fetch)
+
+    async def aget_expired(self, query: str, max_results: int) -> SearchPayload | None:
+        """Return whatever is cached for the query, however old.
+
+        A last resort for when upstream search is failing: expired results
+        beat none. Entries are purged from the table only after
+        ``fallback_retention_seconds``.
+        """
+        key = search_cache_key(query, max_results)
+        entry = self._memory.get(key)
+        if entry is None:
+            entry = await self._blocking(self.store.get_entry, key)
+        if entry is None or not entry.results:
+            return None
+        self._count("expired_served")
+        return entry.results
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            refreshing = len(self._refreshing)
+        lookups = counters["memory_hits"] + counters["store_hits"] + counters["misses"]
+        hits = counters["memory_hits"] + counters["store_hits"]
+        return {
+            **counters,
+            "refreshing": refreshing,
+            "memory_entries": len(self._memory),
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        self._refresh_pool.shutdown(wait=False, cancel_futures=True)
+        for task in list(self._refresh_tasks):
+            task.cancel()
+
+    def _memory_lookup(self, key: str) -> SearchCacheEntry | None:
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._count("memory_hits")
+        return entry
+
+    def _remember(
+        self, key: str, entry: SearchCacheEntry | None
+    ) -> SearchCacheEntry | None:
+        if entry is not None:
+            self._count("store_hits")
+            self._memory.set(key, entry)
+        return entry
+
+    def _freshness(self, entry: SearchCacheEntry | None) -> str | None:
+        # Empty entries written by older versions count as misses.
+        if entry is None or not entry.results:
+            return None
+        age = self.clock() - entry.fetched_at
+        if age < self.ttl_seconds:
+            return "fresh"
+        if age < self.ttl_seconds + self.stale_seconds:
+            self._count("stale_hits")
+            return "stale"
+        return None
+
+    def _new_entry(
+        self, key: str, query: str, max_results: int, results: SearchPayload
+    ) -> SearchCacheEntry:
+        entry = SearchCacheEntry(
+            cache_key=key,
+            query=normalize_query(query),
+            max_results=max_results,
+            results=results,
+            fetched_at=int(self.clock()),
+        )
+        self._memory.set(key, entry)
+        return entry
+
+    def _persist(self, entry: SearchCacheEntry) -> None:
+        self.store.put_entry(entry)
+        self._maybe_purge()
+
+    def _fetch_and_store(
+        self,
+        key: str,
+        query: str,
+        max_results: int,
+        fetch: Callable[[], SearchPayload],
+    ) -> SearchPayload:
+        results = fetch()
+        if not results:
+            self._count("empty_not_cached")
+            return results
+        self._persist(self._new_entry(key, query, max_results, results))
+        return results
+
+    async def _afetch_and_store(
+        self,
+        key: str,
+        query: str,
+        max_results: int,
+        fetch: Callable[[], Awaitable[SearchPayload]],
+    ) -> SearchPayload:
+        results = await fetch()
+        if not results:
+            self._count("empty_not_cached")
+            return results
+        entry = self._new_entry(key, query, max_results, results)
+        await self._blocking(self._persist, entry)
+        return results
+
+    async def _blocking(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self.executor is None:
+            return await asyncio.to_thread(fn, *args)
+        return await self.executor.run(fn, *args)
+
+    def _claim_refresh(self, key: str) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _refresh_task(
+        self,
+        key: str,
+        query: str,
+        max_results: int,
+        fetch: Callable[[], Awaitable[SearchPayload]],
+    ) -> None:
+        if not self._claim_refresh(key):
+            return
+
+        async def run() -> None:
+            try:
+                await self._afetch_and_store(key, query, max_results, fetch)
+                self._count("refreshes")
+            except Exception:
+                self._count("refresh_failures")
+                logger.warning("Background search refresh failed", exc_info=True)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        task = asyncio.create_task(run(), name="search-refresh")
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    def _refresh_in_background(
+        self,
+        key: str,
+        query: str,
+        max_results: int,
+        fetch: Callable[[], SearchPayload],
+    ) -> None:
+        if not self._claim_refresh(key):
+            return
+
+        def run() -> None:
+            try:
+                self._fetch_and_store(key, query, max_results, fetch)
+                self._count("refreshes")
+            except Exception:
+                self._count("refresh_failures")
+                logger.warning("Background search refresh failed", exc_info=True)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        try:
+            self._refresh_pool.submit(run)
+        except RuntimeError:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _maybe_purge(self) -> None:
+        with self._lock:
+            self._writes += 1
+            due = self._writes % self.purge_every == 0
+        if due:
+            retention = max(
+                self.ttl_seconds + self.stale_seconds, self.fallback_retention_seconds
+            )
+            cutoff = int(self.clock() - retention)
+            self.store.delete_entries_before(cutoff)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
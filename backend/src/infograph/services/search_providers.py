@@ -0,0 +1,506 @@
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from html import unescape
+from html.parser import HTMLParser
+from typing import Any, Callable, Iterable
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+import httpx
+
+from infograph.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from infograph.core.latency import LatencyWindow
+from infograph.settings import settings
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedResult:
+    """Parsed search result fields."""
+
+    title: str
+    url: str
+    snippet: str
+
+
+class _DuckDuckGoParser(HTMLParser):
+    """Lightweight HTML parser for DuckDuckGo search results.
+
+    The original ``html.parser`` implementation, kept as the reference that
+    ``DuckDuckGoStreamParser`` is tested and benchmarked against.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._results: list[ParsedResult] = []
+        self._current: dict[str, str] = {}
+        self._capture_title = False
+        self._capture_snippet = False
+
+    @property
+    def results(self) -> list[ParsedResult]:
+        return self._results
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attrs_dict = {key: value or "" for key, value in attrs}
+        classes = set(attrs_dict.get("class", "").split())
+
+        if tag == "a" and {"result__a", "result-link", "result__url"}.intersection(classes):
+            self._flush_current()
+            self._current = {
+                "title": "",
+                "url": attrs_dict.get("href", ""),
+                "snippet": "",
+            }
+            self._capture_title = True
+            return
+
+        if tag in {"div", "span", "a"} and {
+            "result__snippet",
+            "result-snippet",
+        }.intersection(classes):
+            self._capture_snippet = True
+
+    def handle_data(self, data: str) -> None:
+        if self._capture_title:
+            self._current["title"] = f"{self._current.get('title', '')}{data}".strip()
+        if self._capture_snippet:
+            self._current["snippet"] = (
+                f"{self._current.get('snippet', '')}{data}".strip()
+            )
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "a" and self._capture_title:
+            self._capture_title = False
+        if tag in {"div", "span", "a"} and self._capture_snippet:
+            self._capture_snippet = False
+            self._flush_current(require_snippet=False)
+
+    def close(self) -> None:
+        self._flush_current()
+        super().close()
+
+    def _flush_current(self, require_snippet: bool = True) -> None:
+        if not self._current:
+            return
+        title = self._current.get("title", "").strip()
+        url = self._current.get("url", "").strip()
+        snippet = self._current.get("snippet", "").strip()
+        if title and url and (snippet or not require_snippet):
+            self._results.append(
+                ParsedResult(title=title, url=url, snippet=snippet or "")
+            )
+        self._current = {}
+        self._capture_title = False
+        self._capture_snippet = False
+
+
+_TITLE_CLASSES = frozenset({"result__a", "result-link", "result__url"})
+_SNIPPET_CLASSES = frozenset({"result__snippet", "result-snippet"})
+_TAG = re.compile(
+    r"<(/?)([a-zA-Z][^\s/>]*)((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>"
+)
+_CLASS_ATTR = re.compile(
+    r"""(?:^|\s)class\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I
+)
+_HREF_ATTR = re.compile(
+    r"""(?:^|\s)href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I
+)
+_RAW_TEXT_END = {
+    "script": re.compile(r"</script", re.I),
+    "style": re.compile(r"</style", re.I),
+}
+# A tag still unterminated after this many characters is treated as text.
+_MAX_TAG_LENGTH = 8192
+
+
+def _attribute(pattern: re.Pattern[str], raw: str) -> str:
+    match = pattern.search(raw)
+    if match is None:
+        return ""
+    return unescape(match.group(1) or match.group(2) or match.group(3) or "")
+
+
+class DuckDuckGoStreamParser:
+    """Incremental parser for DuckDuckGo result pages.
+
+    Accepts the page in arbitrary chunks via ``feed`` and stops consuming
+    input once ``limit`` results are complete, so callers can stop reading
+    the response. Tags are matched with one regex and attributes are only
+    parsed on ``a``/``div``/``span`` tags that mention a class, instead of
+    for every tag, and only when the tag could carry a result class.
+    Results match ``_DuckDuckGoParser``'s, with relative
+    URLs resolved against ``base_url``.
+    """
+
+    def __init__(self, base_url: str, limit: int | None = None) -> None:
+        self.base_url = base_url
+        self.limit = limit
+        self.results: list[ParsedResult] = []
+        self._buffer = ""
+        self._raw_text_end: re.Pattern[str] | None = None
+        self._title: str | None = None
+        self._url = ""
+        self._snippet = ""
+        self._capture_title = False
+        self._capture_snippet = False
+
+    @property
+    def done(self) -> bool:
+        return self.limit is not None and len(self.results) >= self.limit
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk; return True once no more input is needed."""
+        if not self.done:
+            self._buffer += chunk
+            self._parse(final=False)
+        return self.done
+
+    def close(self) -> list[ParsedResult]:
+        if not self.done:
+            self._parse(final=True)
+            self._flush(require_snippet=True)
+        self._buffer = ""
+        return self.results[: self.limit] if self.limit is not None else self.results
+
+    def _parse(self, final: bool) -> None:
+        buffer = self._buffer
+        pos, end = 0, len(buffer)
+        while pos < end and not self.done:
+            if self._raw_text_end is not None:
+                match = self._raw_text_end.search(buffer, pos)
+                if match is None:
+                    pos = end if final else max(pos, end - 8)
+                    break
+                self._raw_text_end = None
+                pos = match.start()
+            lt = buffer.find("<", pos)
+            if lt < 0:
+                if not final:
+                    break
+                self._data(buffer[pos:])
+                pos = end
+                break
+            if lt > pos:
+                if self._capture_title or self._capture_snippet:
+                    self._data(buffer[pos:lt])
+                pos = lt
+            consumed = self._markup(buffer, lt, final)
+            if consumed < 0:
+                break
+            pos = consumed
+        self._buffer = buffer[pos:]
+
+    def _markup(self, buffer: str, lt: int, final: bool) -> int:
+        """Handle markup at ``lt``; return the new position, -1 if incomplete."""
+        if buffer.startswith("<!--", lt):
+            close = buffer.find("-->", lt + 4)
+            if close >= 0:
+                return close + 3
+            return len(buffer) if final else -1
+        nxt = buffer[lt + 1 : lt + 2]
+        if nxt in ("!", "?"):
+            close = buffer.find(">", lt)
+            if close >= 0:
+                return close + 1
+            return len(buffer) if final else -1
+        if not nxt and not final:
+            return -1
+        if not (nxt.isalpha() or nxt == "/"):
+            self._data("<")
+            return lt + 1
+        match = _TAG.match(buffer, lt)
+        if match is None:
+            if not final and len(buffer) - lt < _MAX_TAG_LENGTH:
+                return -1
+            self._data("<")
+            return lt + 1
+        closing, tag, raw = match.groups()
+        tag = tag.lower()
+        if closing:
+            self._end_tag(tag)
+        else:
+            self._start_tag(tag, raw)
+        return match.end()
+
+    def _start_tag(self, tag: str, raw: str) -> None:
+        if tag in _RAW_TEXT_END:
+            self._raw_text_end = _RAW_TEXT_END[tag]
+            return
+        # Every class of interest contains "result"; most tags are rejected
+        # without parsing their attributes.
+        if tag not in ("a", "div", "span") or "result" not in raw:
+            return
+        classes = set(_attribute(_CLASS_ATTR, raw).split())
+        if tag == "a" and not classes.isdisjoint(_TITLE_CLASSES):
+            self._flush(require_snippet=True)
+            self._title, self._snippet = "", ""
+            self._url = _attribute(_HREF_ATTR, raw)
+            self._capture_title = True
+        elif not classes.isdisjoint(_SNIPPET_CLASSES):
+            self._capture_snippet = True
+
+    def _end_tag(self, tag: str) -> None:
+        if tag == "a" and self._capture_title:
+            self._capture_title = False
+        if tag in ("div", "span", "a") and self._capture_snippet:
+            self._capture_snippet = False
+            self._flush(require_snippet=False)
+
+    def _data(self, data: str) -> None:
+        if not (self._capture_title or self._capture_snippet):
+            return
+        data = unescape(data)
+        # Pieces are stripped as they are joined, as _DuckDuckGoParser does.
+        if self._capture_title:
+            self._title = f"{self._title or ''}{data}".strip()
+        if self._capture_snippet:
+            self._snippet = f"{self._snippet}{data}".strip()
+
+    def _flush(self, require_snippet: bool) -> None:
+        if self._title is None:
+            return
+        title, url = self._title.strip(), self._url.strip()
+        if title and url and (self._snippet or not require_snippet):
+            self.results.append(
+                ParsedResult(
+                    title=title,
+                    url=_absolute_url(url, self.base_url),
+                    snippet=self._snippet,
+                )
+            )
+        self._title, self._url, self._snippet = None, "", ""
+        self._capture_title = self._capture_snippet = False
+
+
+def parse_duckduckgo_html(
+    html: str, base_url: str, limit: int | None = None
+) -> list[ParsedResult]:
+    """Parse DuckDuckGo HTML (or lite) results, resolving relative links."""
+    parser = DuckDuckGoStreamParser(base_url, limit)
+    parser.feed(html)
+    return parser.close()
+
+
+def _absolute_url(url: str, base_url: str) -> str:
+    if url.startswith("http://") or url.startswith("https://"):
+        return url
+    return urljoin(base_url, url)
+
+
+_TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src"}
+
+
+def canonical_url(url: str) -> str:
+    """Key used to recognise the same page returned by different engines.
+
+    Unwraps DuckDuckGo redirect links, lower-cases scheme and host, drops a
+    leading ``www.``, default ports, fragments, tracking parameters and
+    trailing slashes, and sorts the remaining query parameters.
+    """
+    parts = urlsplit(url.strip())
+    if parts.path.startswith("/l/"):
+        target = dict(parse_qsl(parts.query)).get("uddg")
+        if target:
+            parts = urlsplit(target)
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key not in _TRACKING_PARAMS and not key.startswith("utm_")
+        )
+    )
+    scheme = "https" if parts.scheme in ("http", "https") else parts.scheme
+    return urlunsplit((scheme, host, parts.path.rstrip("/"), query, ""))
+
+
+def merge_results(
+    ranked_lists: Iterable[list[ParsedResult]], rank_constant: int = 60
+) -> list[ParsedResult]:
+    """Merge per-provider rankings with reciprocal rank fusion.
+
+    Duplicates (same canonical URL) collapse into the first occurrence and
+    accumulate score, so pages several engines agree on rise to the top.
+    Ties keep provider order.
+    """
+    scores: dict[str, float] = {}
+    firsts: dict[str, ParsedResult] = {}
+    order: dict[str, tuple[int, int]] = {}
+    for provider_index, results in enumerate(ranked_lists):
+        for rank, result in enumerate(results):
+            key = canonical_url(result.url)
+            scores[key] = scores.get(key, 0.0) + 1.0 / (rank_constant + rank + 1)
+            if key not in firsts:
+                firsts[key] = result
+                order[key] = (rank, provider_index)
+    merged = sorted(scores, key=lambda key: (-scores[key], order[key]))
+    return [firsts[key] for key in merged]
+
+
+class SearchProvider(ABC):
+    """A search engine queried by ``SearchService``."""
+
+    name: str
+
+    @abstractmethod
+    async def search(
+        self, query: str, limit: int, client: httpx.AsyncClient
+    ) -> list[ParsedResult]:
+        """Return up to ``limit`` results, best first."""
+
+
+@dataclass
+class DuckDuckGoProvider(SearchProvider):
+    """DuckDuckGo's HTML endpoints."""
+
+    name: str = "duckduckgo"
+    base_url: str = "https://duckduckgo.com/html/"
+    timeout_seconds: float = 10.0
+
+    async def search(
+        self, query: str, limit: int, client: httpx.AsyncClient
+    ) -> list[ParsedResult]:
+        parser = DuckDuckGoStreamParser(self.base_url, limit)
+        async with client.stream(
+            "GET", self.base_url, params={"q": query}, timeout=self.timeout_seconds
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_text():
+                if parser.feed(chunk):
+                    break
+        return parser.close()
+
+
+@dataclass
+class HedgePolicy:
+    """When to send a provider a second, hedged request.
+
+    The delay is the provider's recent ``quantile`` latency, floored at
+    ``min_delay_seconds``; ``default_delay_seconds`` applies until
+    ``min_samples`` latencies have been observed.
+    """
+
+    enabled: bool = field(default_factory=lambda: settings.search_hedge_enabled)
+    quantile: float = 0.95
+    min_delay_seconds: float = field(
+        default_factory=lambda: settings.search_hedge_min_delay_seconds
+    )
+    default_delay_seconds: float = field(
+        default_factory=lambda: settings.search_hedge_default_delay_seconds
+    )
+    min_samples: int = 20
+
+    def delay(self, latency: LatencyWindow) -> float:
+        observed = latency.quantile(self.quantile)
+        if observed is None or len(latency) < self.min_samples:
+            return self.default_delay_seconds
+        return max(self.min_delay_seconds, observed)
+
+
+@dataclass
+class GuardedProvider(SearchProvider):
+    """Wraps a provider with a circuit breaker and hedged requests.
+
+    Calls are refused with ``CircuitOpenError`` while the breaker is open.
+    Otherwise, if the first request has not answered within the hedge
+    delay, or fails before it, a second request is sent and the first
+    success wins; the loser is cancelled. Breaker outcomes and latencies
+    are recorded per call, not per request.
+    """
+
+    provider: SearchProvider
+    breaker: CircuitBreaker
+    hedge: HedgePolicy = field(default_factory=HedgePolicy)
+    latency: LatencyWindow = field(default_factory=LatencyWindow)
+    _hedges: int = field(default=0, init=False, repr=False)
+    _hedge_wins: int = field(default=0, init=False, repr=False)
+
+    @property
+    def name(self) -> str:  # type: ignore[override]
+        return self.provider.name
+
+    async def search(
+        self, query: str, limit: int, client: httpx.AsyncClient
+    ) -> list[ParsedResult]:
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"Circuit open for search provider {self.name}")
+        started = time.perf_counter()
+        try:
+            results = await self._hedged(query, limit, client)
+        except asyncio.CancelledError:
+            self.breaker.record_cancelled()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        self.latency.record(time.perf_counter() - started)
+        return results
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "breaker": self.breaker.metrics(),
+            "latency": self.latency.metrics(),
+            "hedge_delay_ms": round(self.hedge.delay(self.latency) * 1000, 3),
+            "hedges": self._hedges,
+            "hedge_wins": self._hedge_wins,
+        }
+
+    async def _hedged(
+        self, query: str, limit: int, client: httpx.AsyncClient
+    ) -> list[ParsedResult]:
+        first = asyncio.create_task(self.provider.search(query, limit, client))
+        pending = {first}
+        can_hedge = self.hedge.enabled
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self.hedge.delay(self.latency) if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is not first:
+                            self._hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+                if can_hedge:
+                    can_hedge = False
+                    self._hedges += 1
+                    pending.add(
+                        asyncio.create_task(self.provider.search(query, limit, client))
+                    )
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        assert error is not None
+        raise error
+
+
+PROVIDER_FACTORIES: dict[str, Callable[[], SearchProvider]] = {
+    "duckduckgo": DuckDuckGoProvider,
+    "duckduckgo_lite": lambda: DuckDuckGoProvider(
+        name="duckduckgo_lite", base_url="https://lite.duckduckgo.com/lite/"
+    ),
+}
+
+
+def build_providers(names: Iterable[str]) -> list[SearchProvider]:
+    """Instantiate providers by name; unknown names raise ``ValueError``."""
+    providers = []
+    for name in names:
+        factory = PROVIDER_FACTORIES.get(name.strip())
+        if factory is None:
+            raise ValueError(f"Unknown search provider: {name}")
+        providers.append(factory())
+    return providers
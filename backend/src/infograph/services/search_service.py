@@ -1,26 +1,36 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from html.parser import HTMLParser
-from typing import Callable, Iterable
-from urllib.parse import urljoin
+import asyncio
+import importlib.util
+import inspect
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Iterable
 
 import httpx
 
+from infograph.core.circuit_breaker import CircuitBreaker
 from infograph.core.schemas.source import SourceCreate
+from infograph.core.single_flight import SingleFlight, SingleFlightError
+from infograph.services.search_cache import SearchCache, search_cache_key
+from infograph.services.search_providers import (
+    GuardedProvider,
+    HedgePolicy,
+    ParsedResult,
+    SearchProvider,
+    build_providers,
+    merge_results,
+    parse_duckduckgo_html,
+)
+from infograph.settings import settings
 
+logger = logging.getLogger(__name__)
 
-class SearchServiceError(RuntimeError):
-    """Raised when web search fails."""
+USER_AGENT = "infograph-search/1.0"
 
 
-@dataclass(frozen=True)
-class ParsedResult:
-    """Parsed search result fields."""
-
-    title: str
-    url: str
-    snippet: str
+class SearchServiceError(RuntimeError):
+    """Raised when web search fails."""
 
 
 @dataclass(frozen=True)
@@ -33,103 +43,235 @@ class SearchResult:
     confidence: float
 
 
-class _DuckDuckGoParser(HTMLParser):
-    """Lightweight HTML parser for DuckDuckGo search results."""
-
-    def __init__(self) -> None:
-        super().__init__()
-        self._results: list[ParsedResult] = []
-        self._current: dict[str, str] = {}
-        self._capture_title = False
-        self._capture_snippet = False
-
-    @property
-    def results(self) -> list[ParsedResult]:
-        return self._results
-
-    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        attrs_dict = {key: value or "" for key, value in attrs}
-        classes = set(attrs_dict.get("class", "").split())
-
-        if tag == "a" and {"result__a", "result-link", "result__url"}.intersection(classes):
-            self._flush_current()
-            self._current = {
-                "title": "",
-                "url": attrs_dict.get("href", ""),
-                "snippet": "",
-            }
-            self._capture_title = True
-            return
-
-        if tag in {"div", "span", "a"} and {
-            "result__snippet",
-            "result-snippet",
-        }.intersection(classes):
-            self._capture_snippet = True
-
-    def handle_data(self, data: str) -> None:
-        if self._capture_title:
-            self._current["title"] = f"{self._current.get('title', '')}{data}".strip()
-        if self._capture_snippet:
-            self._current["snippet"] = (
-                f"{self._current.get('snippet', '')}{data}".strip()
-            )
+@dataclass
+class SearchService:
+    """Service for performing web searches and extracting sources.
 
-    def handle_endtag(self, tag: str) -> None:
-        if tag == "a" and self._capture_title:
-            self._capture_title = False
-        if tag in {"div", "span", "a"} and self._capture_snippet:
-            self._capture_snippet = False
-            self._flush_current(require_snippet=False)
-
-    def close(self) -> None:
-        self._flush_current()
-        super().close()
-
-    def _flush_current(self, require_snippet: bool = True) -> None:
-        if not self._current:
-            return
-        title = self._current.get("title", "").strip()
-        url = self._current.get("url", "").strip()
-        snippet = self._current.get("snippet", "").strip()
-        if title and url and (snippet or not require_snippet):
-            self._results.append(
-                ParsedResult(title=title, url=url, snippet=snippet or "")
-            )
-        self._current = {}
-        self._capture_title = False
-        self._capture_snippet = False
+    ``asearch`` fetches through one shared ``httpx.AsyncClient`` with
+    bounded, keep-alive connection pooling, so in-flight searches cost a
+    socket rather than a thread. The async client is created on first use
+    and must be released with ``aclose``.
 
+    Async searches fan out to every configured provider concurrently and
+    merge their results by canonical URL. They return once ``quorum``
+    providers have answered, or at ``fanout_deadline_seconds`` if at least
+    one has, cancelling the stragglers. Each provider sits behind its own
+    circuit breaker and hedges slow requests (see ``GuardedProvider``), so
+    a failing provider is skipped immediately instead of costing
+    ``timeout_seconds``. When every provider fails, a cached result is
+    served regardless of age if ``serve_stale_on_failure`` is set.
 
-@dataclass
-class SearchService:
-    """Service for performing web searches and extracting sources."""
+    ``search`` is the blocking, single-provider path against ``base_url``.
+    """
 
     base_url: str = "https://duckduckgo.com/html/"
     timeout_seconds: float = 10.0
     max_results_default: int = 5
-    fetcher: Callable[[str], str] | None = None
+    fetcher: Callable[[str], str | Awaitable[str]] | None = None
     http_client: httpx.Client | None = None
+    async_http_client: httpx.AsyncClient | None = None
+    cache: SearchCache | None = None
+    single_flight: SingleFlight | None = None
+    max_connections: int = field(default_factory=lambda: settings.search_max_connections)
+    max_keepalive_connections: int = field(
+        default_factory=lambda: settings.search_max_keepalive_connections
+    )
+    keepalive_expiry_seconds: float = field(
+        default_factory=lambda: settings.search_keepalive_expiry_seconds
+    )
+    http2: bool = field(default_factory=lambda: settings.search_http2)
+    providers: list[SearchProvider] = field(
+        default_factory=lambda: build_providers(settings.search_providers.split(","))
+    )
+    quorum: int = field(default_factory=lambda: settings.search_quorum)
+    fanout_deadline_seconds: float = field(
+        default_factory=lambda: settings.search_fanout_deadline_seconds
+    )
+    hedge: HedgePolicy = field(default_factory=HedgePolicy)
+    breaker_factory: Callable[[str], CircuitBreaker] = CircuitBreaker
+    serve_stale_on_failure: bool = field(
+        default_factory=lambda: settings.search_serve_stale_on_failure
+    )
+    _guarded: list[GuardedProvider] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        if self.http_client is None:
-            self.http_client = httpx.Client(
-                headers={"User-Agent": "infograph-search/1.0"}
+        self._guarded = [
+            GuardedProvider(
+                provider=provider,
+                breaker=self.breaker_factory(provider.name),
+                hedge=self.hedge,
             )
+            for provider in self.providers
+        ]
 
     def close(self) -> None:
         if self.http_client is not None:
             self.http_client.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    async def aclose(self) -> None:
+        """Close the async client as well as everything ``close`` releases."""
+        if self.async_http_client is not None:
+            await self.async_http_client.aclose()
+            self.async_http_client = None
+        self.close()
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry_seconds,
+        )
+
+    def _get_http_client(self) -> httpx.Client:
+        if self.http_client is None:
+            self.http_client = httpx.Client(
+                headers={"User-Agent": USER_AGENT}, limits=self._limits()
+            )
+        return self.http_client
+
+    def _get_async_http_client(self) -> httpx.AsyncClient:
+        if self.async_http_client is None:
+            http2 = self.http2
+            if http2 and importlib.util.find_spec("h2") is None:
+                logger.warning("HTTP/2 requested but h2 is not installed; using HTTP/1.1")
+                http2 = False
+            self.async_http_client = httpx.AsyncClient(
+                headers={"User-Agent": USER_AGENT},
+                limits=self._limits(),
+                http2=http2,
+            )
+        return self.async_http_client
 
     def search(self, query: str, max_results: int | None = None) -> list[SearchResult]:
         """Run a web search and return ranked results."""
         if not query or not query.strip():
             raise SearchServiceError("Query cannot be empty")
-        html = self.fetcher(query) if self.fetcher else self._fetch_html(query)
-        parsed = self.parse_results(html)
         limit = max_results or self.max_results_default
+        if self.cache is None:
+            return self._search_coalesced(query, limit)
+        payload = self.cache.get_or_fetch(
+            query,
+            limit,
+            lambda: [asdict(result) for result in self._search_coalesced(query, limit)],
+        )
+        return [SearchResult(**item) for item in payload]
+
+    def _search_coalesced(self, query: str, limit: int) -> list[SearchResult]:
+        """Share one upstream search between concurrent identical queries."""
+        if self.single_flight is None:
+            return self._search_uncached(query, limit)
+        try:
+            results = self.single_flight.do(
+                search_cache_key(query, limit),
+                lambda: self._search_uncached(query, limit),
+            )
+        except SingleFlightError as exc:
+            raise SearchServiceError(str(exc)) from exc
+        return list(results)
+
+    async def _asearch_coalesced(self, query: str, limit: int) -> list[SearchResult]:
+        if self.single_flight is None:
+            return await self._asearch_uncached(query, limit)
+        try:
+            results = await self.single_flight.ado(
+                search_cache_key(query, limit),
+                lambda: self._asearch_uncached(query, limit),
+            )
+        except SingleFlightError as exc:
+            raise SearchServiceError(str(exc)) from exc
+        return list(results)
+
+    def _search_uncached(self, query: str, limit: int) -> list[SearchResult]:
+        html = self.fetcher(query) if self.fetcher else self._fetch_html(query)
+        return self._assign_confidence(self.parse_results(html, limit))
+
+    async def _asearch_uncached(self, query: str, limit: int) -> list[SearchResult]:
+        if self.fetcher is None:
+            parsed = merge_results(await self._fan_out(query, limit))
+        else:
+            html = self.fetcher(query)
+            if inspect.isawaitable(html):
+                html = await html
+            parsed = self.parse_results(html, limit)
         return self._assign_confidence(parsed[:limit])
 
+    async def _fan_out(self, query: str, limit: int) -> list[list[ParsedResult]]:
+        """Query providers concurrently; return the rankings that arrived."""
+        if not self._guarded:
+            raise SearchServiceError("No search providers configured")
+        client = self._get_async_http_client()
+        tasks = {
+            asyncio.create_task(
+                provider.search(query, limit, client), name=f"search-{provider.name}"
+            ): index
+            for index, provider in enumerate(self._guarded)
+        }
+        quorum = max(1, min(self.quorum, len(tasks)))
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results: dict[int, list[ParsedResult]] = {}
+        error: Exception | None = None
+        pending = set(tasks)
+        try:
+            while pending and len(results) < quorum:
+                # Past the deadline, partial results win over waiting longer;
+                # with nothing yet, wait up to the full request timeout.
+                budget = self.fanout_deadline_seconds if results else self.timeout_seconds
+                timeout = started + budget - loop.time()
+                if timeout <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    provider = self._guarded[tasks[task]]
+                    try:
+                        results[tasks[task]] = task.result()
+                    except Exception as exc:
+                        error = exc
+                        logger.warning(
+                            "Search provider %s failed: %s", provider.name, exc
+                        )
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        if not results:
+            raise SearchServiceError("Search request failed") from error
+        return [results[index] for index in sorted(results)]
+
+    async def asearch(
+        self, query: str, max_results: int | None = None
+    ) -> list[SearchResult]:
+        """Run a web search without blocking the event loop."""
+        if not query or not query.strip():
+            raise SearchServiceError("Query cannot be empty")
+        limit = max_results or self.max_results_default
+        if self.cache is None:
+            return await self._asearch_coalesced(query, limit)
+
+        async def fetch() -> list[dict]:
+            results = await self._asearch_coalesced(query, limit)
+            return [asdict(result) for result in results]
+
+        try:
+            payload = await self.cache.aget_or_fetch(query, limit, fetch)
+        except SearchServiceError:
+            if not self.serve_stale_on_failure:
+                raise
+            payload = await self.cache.aget_expired(query, limit)
+            if payload is None:
+                raise
+            logger.warning("Search failed; serving expired cached results")
+        return [SearchResult(**item) for item in payload]
+
+    def provider_metrics(self) -> dict[str, Any]:
+        """Breaker state, latency and hedging counters per provider."""
+        return {provider.name: provider.metrics() for provider in self._guarded}
+
     def search_sources(
         self, session_id: str, query: str, max_results: int | None = None
     ) -> list[SourceCreate]:
@@ -137,6 +279,13 @@ class SearchService:
         results = self.search(query, max_results=max_results)
         return self.results_to_sources(session_id, results)
 
+    async def asearch_sources(
+        self, session_id: str, query: str, max_results: int | None = None
+    ) -> list[SourceCreate]:
+        """Async ``search_sources``."""
+        results = await self.asearch(query, max_results=max_results)
+        return self.results_to_sources(session_id, results)
+
     def results_to_sources(
         self, session_id: str, results: Iterable[SearchResult]
     ) -> list[SourceCreate]:
@@ -152,27 +301,13 @@ class SearchService:
             for result in results
         ]
 
-    def parse_results(self, html: str) -> list[ParsedResult]:
-        """Parse HTML search results into structured data."""
-        parser = _DuckDuckGoParser()
-        parser.feed(html)
-        parser.close()
-        results = [
-            ParsedResult(
-                title=result.title.strip(),
-                url=self._normalize_url(result.url),
-                snippet=result.snippet.strip(),
-            )
-            for result in parser.results
-            if result.title.strip() and result.url.strip()
-        ]
-        return results
+    def parse_results(self, html: str, limit: int | None = None) -> list[ParsedResult]:
+        """Parse HTML search results, stopping after ``limit`` if given."""
+        return parse_duckduckgo_html(html, self.base_url, limit)
 
     def _fetch_html(self, query: str) -> str:
-        if self.http_client is None:
-            raise SearchServiceError("HTTP client not initialized")
         try:
-            response = self.http_client.get(
+            response = self._get_http_client().get(
                 self.base_url,
                 params={"q": query},
                 timeout=self.timeout_seconds,
@@ -195,8 +330,3 @@ class SearchService:
                 )
             )
         return ranked
-
-    def _normalize_url(self, url: str) -> str:
-        if url.startswith("http://") or url.startswith("https://"):
-            return url
-        return urljoin(self.base_url, url)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Callable
+
+from PIL import ImageFont
+
+Font = ImageFont.FreeTypeFont | ImageFont.ImageFont
+
+
+class FontMetrics:
+    """A font with cached per-glyph advances.
+
+    Text widths are sums of glyph advances, looked up once per character
+    and then served from a table, so measuring a word never calls into
+    FreeType. Kerning is ignored, which is exact for Pillow's default font.
+    """
+
+    def __init__(self, font: Font) -> None:
+        self.font = font
+        self._advances: dict[str, float] = {}
+        self._lock = Lock()
+        ascent, descent = font.getmetrics()
+        self.line_height = max(1, ascent + descent)
+
+    def text_width(self, text: str) -> float:
+        advances = self._advances
+        missing = set(text).difference(advances)
+        if missing:
+            with self._lock:
+                for char in missing:
+                    advances[char] = self.font.getlength(char)
+        return sum(map(advances.__getitem__, text))
+
+
+class FontRegistry:
+    """Named fonts, each loaded once per process on first use."""
+
+    def __init__(self, loaders: dict[str, Callable[[], Font]]) -> None:
+        self._loaders = loaders
+        self._metrics: dict[str, FontMetrics] = {}
+        self._lock = Lock()
+
+    def get(self, name: str) -> FontMetrics:
+        metrics = self._metrics.get(name)
+        if metrics is None:
+            with self._lock:
+                metrics = self._metrics.get(name)
+                if metrics is None:
+                    metrics = FontMetrics(self._loaders[name]())
+                    self._metrics[name] = metrics
+        return metrics
+
+    def preload(self) -> None:
+        for name in self._loaders:
+            self.get(name)
+
+
+default_font_registry = FontRegistry(
+    {"title": ImageFont.load_default, "body": ImageFont.load_default}
+)
+
+
+def preload_fonts() -> None:
+    """Load the default fonts; used as the render worker initializer."""
+    default_font_registry.preload()
+
+
+def wrap_text(text: str, metrics: FontMetrics, max_width: float) -> list[str]:
+    """Greedily wrap ``text`` to ``max_width`` in one pass over its words.
+
+    Paragraph breaks are kept, and a word wider than the line gets a line
+    to itself rather than being split.
+    """
+    space = metrics.text_width(" ")
+    lines: list[str] = []
+    for paragraph in text.splitlines():
+        words = paragraph.split()
+        if not words:
+            lines.append("")
+            continue
+        current = [words[0]]
+        width = metrics.text_width(words[0])
+        for word in words[1:]:
+            word_width = metrics.text_width(word)
+            if width + space + word_width <= max_width:
+                current.append(word)
+                width += space + word_width
+            else:
+                lines.append(" ".join(current))
+                current = [word]
+                width = word_width
+        lines.append(" ".join(current))
+    return lines
@@ -14,10 +14,177 @@ class SystemSettings(BaseModel):
         default_factory=lambda: _get_env("DATABASE_PATH", "/workspace/data/duckdb"),
         description="Directory for DuckDB database files",
     )
+    duckdb_max_concurrency: int = Field(
+        default_factory=lambda: int(_get_env("DUCKDB_MAX_CONCURRENCY", "8")),
+        description="Maximum number of threads running DuckDB statements at once",
+    )
+    auth_executor_workers: int = Field(
+        default_factory=lambda: int(_get_env("AUTH_EXECUTOR_WORKERS", "4")),
+        description="Threads available for blocking Google token verification",
+    )
     infographic_path: str = Field(
         default_factory=lambda: _get_env("INFOGRAPHIC_PATH", "/workspace/data/infographics"),
         description="Directory for infographic image storage",
     )
+    infographic_reclaim_interval_seconds: float = Field(
+        default_factory=lambda: float(
+            _get_env("INFOGRAPHIC_RECLAIM_INTERVAL_SECONDS", "300")
+        ),
+        description="Seconds between sweeps for orphaned infographic files",
+    )
+    infographic_reclaim_batch_size: int = Field(
+        default_factory=lambda: int(_get_env("INFOGRAPHIC_RECLAIM_BATCH_SIZE", "200")),
+        description="Files checked against the database per reclaim batch",
+    )
+    infographic_orphan_grace_seconds: float = Field(
+        default_factory=lambda: float(
+            _get_env("INFOGRAPHIC_ORPHAN_GRACE_SECONDS", "600")
+        ),
+        description="Minimum file age before an unreferenced image is deleted",
+    )
+    research_worker_count: int = Field(
+        default_factory=lambda: int(_get_env("RESEARCH_WORKER_COUNT", "2")),
+        description="Number of background workers running research sessions",
+    )
+    render_workers: int = Field(
+        default_factory=lambda: int(_get_env("RENDER_WORKERS", "2")),
+        description="Worker processes rendering infographics (0 renders in-process)",
+    )
+    render_queue_size: int = Field(
+        default_factory=lambda: int(_get_env("RENDER_QUEUE_SIZE", "16")),
+        description="Render jobs that may wait for a worker before rejecting",
+    )
+    render_timeout_seconds: float = Field(
+        default_factory=lambda: float(_get_env("RENDER_TIMEOUT_SECONDS", "30")),
+        description="Seconds a render job may take before its worker is killed",
+    )
+    fast_json_responses: bool = Field(
+        default_factory=lambda: _get_env("FAST_JSON_RESPONSES", "true").lower()
+        == "true",
+        description="Serve opted-in list endpoints straight from store rows",
+    )
+    ndjson_batch_size: int = Field(
+        default_factory=lambda: int(_get_env("NDJSON_BATCH_SIZE", "500")),
+        description="Rows fetched per batch when streaming NDJSON list responses",
+    )
+    job_lease_seconds: int = Field(
+        default_factory=lambda: int(_get_env("JOB_LEASE_SECONDS", "60")),
+        description="Seconds a claimed job stays leased without a heartbeat",
+    )
+    job_poll_interval_seconds: float = Field(
+        default_factory=lambda: float(_get_env("JOB_POLL_INTERVAL_SECONDS", "1.0")),
+        description="Seconds idle workers wait before polling the job queue",
+    )
+    job_max_attempts: int = Field(
+        default_factory=lambda: int(_get_env("JOB_MAX_ATTEMPTS", "3")),
+        description="Attempts before a research job is marked failed",
+    )
+    job_retention_seconds: int = Field(
+        default_factory=lambda: int(_get_env("JOB_RETENTION_SECONDS", "604800")),
+        description="Seconds completed and failed jobs are kept before purging",
+    )
+    user_cache_max_entries: int = Field(
+        default_factory=lambda: int(_get_env("USER_CACHE_MAX_ENTRIES", "4096")),
+        description="Maximum number of authenticated users kept in memory",
+    )
+    user_cache_ttl_seconds: float = Field(
+        default_factory=lambda: float(_get_env("USER_CACHE_TTL_SECONDS", "60")),
+        description="Seconds a cached user is served without a database lookup",
+    )
+    search_cache_ttl_seconds: float = Field(
+        default_factory=lambda: float(_get_env("SEARCH_CACHE_TTL_SECONDS", "3600")),
+        description="Seconds cached search results are served as fresh",
+    )
+    search_cache_stale_seconds: float = Field(
+        default_factory=lambda: float(_get_env("SEARCH_CACHE_STALE_SECONDS", "86400")),
+        description="Seconds past the TTL that stale results are served while refreshing",
+    )
+    search_cache_fallback_retention_seconds: float = Field(
+        default_factory=lambda: float(
+            _get_env("SEARCH_CACHE_FALLBACK_RETENTION_SECONDS", "2592000")
+        ),
+        description="Seconds cached results are kept to serve when every search provider fails",
+    )
+    search_cache_memory_entries: int = Field(
+        default_factory=lambda: int(_get_env("SEARCH_CACHE_MEMORY_ENTRIES", "512")),
+        description="Search cache entries kept in the in-memory LRU",
+    )
+    search_max_connections: int = Field(
+        default_factory=lambda: int(_get_env("SEARCH_MAX_CONNECTIONS", "50")),
+        description="Maximum concurrent connections from the search HTTP client",
+    )
+    search_max_keepalive_connections: int = Field(
+        default_factory=lambda: int(_get_env("SEARCH_MAX_KEEPALIVE_CONNECTIONS", "10")),
+        description="Idle keep-alive connections kept by the search HTTP client",
+    )
+    search_keepalive_expiry_seconds: float = Field(
+        default_factory=lambda: float(_get_env("SEARCH_KEEPALIVE_EXPIRY_SECONDS", "30")),
+        description="Seconds an idle search connection is kept open",
+    )
+    search_http2: bool = Field(
+        default_factory=lambda: _get_env("SEARCH_HTTP2", "false").lower() == "true",
+        description="Use HTTP/2 for search requests when the h2 package is installed",
+    )
+    search_providers: str = Field(
+        default_factory=lambda: _get_env("SEARCH_PROVIDERS", "duckduckgo"),
+        description="Comma-separated search providers queried concurrently",
+    )
+    search_quorum: int = Field(
+        default_factory=lambda: int(_get_env("SEARCH_QUORUM", "2")),
+        description="Provider responses that end a search fan-out early",
+    )
+    search_fanout_deadline_seconds: float = Field(
+        default_factory=lambda: float(_get_env("SEARCH_FANOUT_DEADLINE_SECONDS", "3")),
+        description="Seconds before a fan-out returns with partial provider results",
+    )
+    search_hedge_enabled: bool = Field(
+        default_factory=lambda: _get_env("SEARCH_HEDGE_ENABLED", "true").lower()
+        == "true",
+        description="Send a second provider request when the first is slow",
+    )
+    search_hedge_min_delay_seconds: float = Field(
+        default_factory=lambda: float(
+            _get_env("SEARCH_HEDGE_MIN_DELAY_SECONDS", "0.25")
+        ),
+        description="Lower bound on the p95-based hedge delay",
+    )
+    search_hedge_default_delay_seconds: float = Field(
+        default_factory=lambda: float(
+            _get_env("SEARCH_HEDGE_DEFAULT_DELAY_SECONDS", "2.0")
+        ),
+        description="Hedge delay used until enough latency samples exist",
+    )
+    search_breaker_failure_rate: float = Field(
+        default_factory=lambda: float(_get_env("SEARCH_BREAKER_FAILURE_RATE", "0.5")),
+        description="Provider failure rate that opens its circuit breaker",
+    )
+    search_breaker_min_calls: int = Field(
+        default_factory=lambda: int(_get_env("SEARCH_BREAKER_MIN_CALLS", "10")),
+        description="Calls recorded before a breaker may open",
+    )
+    search_breaker_window: int = Field(
+        default_factory=lambda: int(_get_env("SEARCH_BREAKER_WINDOW", "20")),
+        description="Recent calls considered for a breaker's failure rate",
+    )
+    search_breaker_open_seconds: float = Field(
+        default_factory=lambda: float(_get_env("SEARCH_BREAKER_OPEN_SECONDS", "30")),
+        description="Seconds an open breaker refuses calls before a trial",
+    )
+    search_serve_stale_on_failure: bool = Field(
+        default_factory=lambda: _get_env("SEARCH_SERVE_STALE_ON_FAILURE", "true").lower()
+        == "true",
+        description="Serve expired cached results when every provider fails",
+    )
+    search_single_flight_max_waiters: int = Field(
+        default_factory=lambda: int(_get_env("SEARCH_SINGLE_FLIGHT_MAX_WAITERS", "64")),
+        description="Callers allowed to wait on one in-flight identical search",
+    )
+    search_single_flight_timeout_seconds: float = Field(
+        default_factory=lambda: float(
+            _get_env("SEARCH_SINGLE_FLIGHT_TIMEOUT_SECONDS", "30")
+        ),
+        description="Seconds a caller waits on an in-flight identical search",
+    )
     jwt_secret: str = Field(
         default_factory=lambda: _get_env("JWT_SECRET", "change-me"),
         description="JWT signing secret",
@@ -26,6 +193,11 @@ class SystemSettings(BaseModel):
         default_factory=lambda: _get_env("GOOGLE_CLIENT_ID", ""),
         description="Google OAuth client ID",
     )
+    metrics_endpoint_enabled: bool = Field(
+        default_factory=lambda: _get_env("METRICS_ENDPOINT_ENABLED", "false").lower()
+        == "true",
+        description="Mount the unauthenticated internal /metrics endpoint",
+    )
     log_level: str = Field(
         default_factory=lambda: _get_env("LOG_LEVEL", "info"),
         description="Log level",
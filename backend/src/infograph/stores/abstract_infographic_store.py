@@ -17,5 +17,9 @@ class AbstractInfographicStore(ABC):
         """Fetch an infographic for a session."""
 
     @abstractmethod
-    def delete_infographic(self, session_id: str) -> None:
-        """Delete infographic for a session."""
+    def delete_infographic(self, session_id: str) -> list[str]:
+        """Delete infographic for a session; return the released image paths."""
+
+    @abstractmethod
+    def filter_referenced_image_paths(self, image_paths: list[str]) -> set[str]:
+        """Return the subset of image paths still referenced by an infographic."""
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from infograph.core.schemas.job import Job, JobCreate
+
+
+class AbstractJobStore(ABC):
+    """Abstract store for leased background jobs."""
+
+    @abstractmethod
+    def enqueue_job(self, job_create: JobCreate) -> Job:
+        """Add a job to the queue."""
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> Job | None:
+        """Fetch a job by ID."""
+
+    @abstractmethod
+    def claim_job(self, worker_id: str, lease_seconds: int) -> Job | None:
+        """Claim the oldest queued job for a worker, or return None."""
+
+    @abstractmethod
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: int) -> bool:
+        """Extend a lease; return False if the worker no longer holds it."""
+
+    @abstractmethod
+    def complete_job(self, job_id: str, worker_id: str) -> bool:
+        """Mark a claimed job as completed."""
+
+    @abstractmethod
+    def fail_job(self, job_id: str, worker_id: str, error: str) -> Job | None:
+        """Re-queue a claimed job, or fail it once attempts are exhausted."""
+
+    @abstractmethod
+    def requeue_expired_leases(self) -> list[Job]:
+        """Re-queue running jobs whose lease has expired."""
+
+    @abstractmethod
+    def purge_finished_jobs(self, updated_before: int) -> int:
+        """Delete completed or failed jobs last updated before a timestamp."""
+
+    @abstractmethod
+    def list_active_session_ids(self) -> set[str]:
+        """Return session IDs with a queued or running job."""
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Any, Iterator
 
 from infograph.core.schemas.message import Message, MessageCreate
+from infograph.core.schemas.page import Page
 
 
 class AbstractMessageStore(ABC):
@@ -16,6 +18,24 @@ class AbstractMessageStore(ABC):
     def list_messages(self, session_id: str) -> list[Message]:
         """List messages for a session."""
 
+    @abstractmethod
+    def list_messages_page(
+        self, session_id: str, limit: int, cursor: str | None = None
+    ) -> Page[Message]:
+        """List a session's messages oldest first, starting after a cursor."""
+
+    @abstractmethod
+    def list_message_records_page(
+        self, session_id: str, limit: int, cursor: str | None = None
+    ) -> dict[str, Any]:
+        """Like ``list_messages_page``, as plain dicts without validation."""
+
+    @abstractmethod
+    def iter_message_records(
+        self, session_id: str, cursor: str | None = None, batch_size: int = 500
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Stream every message after a cursor as batches of plain dicts."""
+
     @abstractmethod
     def delete_messages_for_session(self, session_id: str) -> None:
         """Delete messages for a session."""
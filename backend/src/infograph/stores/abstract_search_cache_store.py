@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from infograph.core.schemas.search_cache import SearchCacheEntry
+
+
+class AbstractSearchCacheStore(ABC):
+    """Abstract store for cached search results."""
+
+    @abstractmethod
+    def get_entry(self, cache_key: str) -> SearchCacheEntry | None:
+        """Fetch a cache entry by key."""
+
+    @abstractmethod
+    def put_entry(self, entry: SearchCacheEntry) -> None:
+        """Insert or replace a cache entry."""
+
+    @abstractmethod
+    def delete_entries_before(self, fetched_before: int) -> int:
+        """Delete entries fetched before a timestamp; return how many."""
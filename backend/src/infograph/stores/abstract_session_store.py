@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Any, Iterator
 
+from infograph.core.schemas.page import Page
 from infograph.core.schemas.research_session import (
     ResearchSession,
     ResearchSessionCreate,
@@ -26,6 +28,32 @@ class AbstractSessionStore(ABC):
     def list_sessions(self, user_id: str, limit: int, offset: int) -> list[ResearchSession]:
         """List sessions for a user."""
 
+    @abstractmethod
+    def list_sessions_page(
+        self, user_id: str, limit: int, cursor: str | None = None
+    ) -> Page[ResearchSession]:
+        """List a user's sessions newest first, starting after a cursor."""
+
+    @abstractmethod
+    def list_session_records_page(
+        self, user_id: str, limit: int, cursor: str | None = None
+    ) -> dict[str, Any]:
+        """Like ``list_sessions_page``, as plain dicts without validation."""
+
+    @abstractmethod
+    def iter_session_records(
+        self, user_id: str, cursor: str | None = None, batch_size: int = 500
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Stream every session after a cursor as batches of plain dicts."""
+
+    @abstractmethod
+    def list_sessions_by_status(self, statuses: list[str]) -> list[ResearchSession]:
+        """List sessions in any of the given statuses."""
+
+    @abstractmethod
+    def lock_session(self, session_id: str) -> bool:
+        """Claim a session for the current transaction; False if it is gone."""
+
     @abstractmethod
     def update_session(
         self, session_id: str, session_update: ResearchSessionUpdate
@@ -35,3 +63,10 @@ class AbstractSessionStore(ABC):
     @abstractmethod
     def delete_session(self, session_id: str) -> None:
         """Delete a session."""
+
+    @abstractmethod
+    def delete_session_cascade(self, session_id: str) -> list[str]:
+        """Atomically delete a session and everything that belongs to it.
+
+        Returns the image paths of the deleted infographics.
+        """
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Any, Iterator
 
 from infograph.core.schemas.source import Source, SourceCreate
 
@@ -12,10 +13,24 @@ class AbstractSourceStore(ABC):
     def create_source(self, source_create: SourceCreate) -> Source:
         """Create a source."""
 
+    @abstractmethod
+    def create_sources_bulk(self, source_creates: list[SourceCreate]) -> list[Source]:
+        """Create many sources at once, in input order."""
+
     @abstractmethod
     def list_sources(self, session_id: str) -> list[Source]:
         """List sources for a session."""
 
+    @abstractmethod
+    def list_source_records(self, session_id: str) -> list[dict[str, Any]]:
+        """List sources for a session as plain dicts, without validation."""
+
+    @abstractmethod
+    def iter_source_records(
+        self, session_id: str, batch_size: int = 500
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Stream a session's sources as batches of plain dicts."""
+
     @abstractmethod
     def delete_sources_for_session(self, session_id: str) -> None:
         """Delete sources for a session."""
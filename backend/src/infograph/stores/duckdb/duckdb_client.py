@@ -1,25 +1,48 @@
 from __future__ import annotations
 
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from threading import Lock
-from typing import Any
+from typing import Any, Callable, Iterator, Sequence
 
 import duckdb
 
 from infograph.settings import settings
+from infograph.stores.duckdb.duckdb_connection_registry import (
+    DuckDBConnectionRegistry,
+    connection_registry,
+)
+
+
+SCHEMA_VERSIONS_TABLE = "schema_versions"
+
+# A schema migration: one SQL statement, or a function of the client for
+# data fix-ups that need more than one.
+Migration = str | Callable[["DuckDBClient"], None]
 
 
 class DuckDBClient:
-    """Simple DuckDB client with table creation caching."""
+    """Simple DuckDB client with table creation caching.
 
-    def __init__(self, db_name: str = "infograph") -> None:
+    Clients are lightweight handles: every client for the same database file
+    shares one underlying connection from the process-wide registry.
+    """
+
+    def __init__(
+        self,
+        db_name: str = "infograph",
+        registry: DuckDBConnectionRegistry | None = None,
+    ) -> None:
         self.db_name = db_name
         self.db_path = self._get_db_path()
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn = duckdb.connect(str(self.db_path))
+        self.registry = registry or connection_registry
         self._lock = Lock()
         self._table_locks: dict[str, Lock] = {}
-        self._created_tables: set[str] = set()
+
+    @property
+    def conn(self) -> duckdb.DuckDBPyConnection:
+        return self.registry.connection(self.db_path)
 
     def _get_db_path(self) -> Path:
         suffix = "_test" if settings.is_test else ""
@@ -32,7 +55,7 @@ class DuckDBClient:
             return self._table_locks[table_name]
 
     def execute(self, query: str, parameters: tuple[Any, ...] | None = None) -> None:
-        with self.conn.cursor() as cursor:
+        with self.registry.cursor(self.db_path) as cursor:
             if parameters is None:
                 cursor.execute(query)
             else:
@@ -43,7 +66,7 @@ class DuckDBClient:
         query: str,
         parameters: tuple[Any, ...] | None = None,
     ) -> tuple[Any, ...] | None:
-        with self.conn.cursor() as cursor:
+        with self.registry.cursor(self.db_path) as cursor:
             if parameters is None:
                 cursor.execute(query)
             else:
@@ -55,18 +78,113 @@ class DuckDBClient:
         query: str,
         parameters: tuple[Any, ...] | None = None,
     ) -> list[tuple[Any, ...]]:
-        with self.conn.cursor() as cursor:
+        with self.registry.cursor(self.db_path) as cursor:
             if parameters is None:
                 cursor.execute(query)
             else:
                 cursor.execute(query, parameters)
             return cursor.fetchall()
 
+    def stream_records(
+        self,
+        query: str,
+        parameters: tuple[Any, ...] | None = None,
+        batch_size: int = 500,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield the query's rows as dicts, at most ``batch_size`` at a time.
+
+        Rows are pulled with ``fetchmany`` from a dedicated cursor, so only
+        one batch is held in Python at once and the batches may be fetched
+        from different threads. A concurrency slot is held per batch, not
+        for the whole stream; closing the generator closes the cursor.
+        """
+        cursor = self.registry.open_cursor(self.db_path)
+        try:
+            with self.registry.slot():
+                if parameters is None:
+                    cursor.execute(query)
+                else:
+                    cursor.execute(query, parameters)
+                columns = [column[0] for column in cursor.description]
+            while True:
+                with self.registry.slot():
+                    rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield [dict(zip(columns, row)) for row in rows]
+        finally:
+            cursor.close()
+
     def ensure_table(self, table_name: str, create_sql: str) -> None:
-        if table_name in self._created_tables:
+        created_tables = self.registry.created_tables(self.db_path)
+        if table_name in created_tables:
             return
         with self._get_table_lock(table_name):
-            if table_name in self._created_tables:
+            if table_name in created_tables:
                 return
             self.execute(create_sql)
-            self._created_tables.add(table_name)
+            created_tables.add(table_name)
+
+    def ensure_schema(self, table_name: str, migrations: Sequence[Migration]) -> None:
+        """Bring a table up to date by applying its pending migrations.
+
+        ``migrations[i]`` upgrades the table to version ``i + 1``; the applied
+        version is tracked per table in ``schema_versions``, so existing
+        database files pick up statements added after they were created.
+        Each migration runs in its own transaction.
+        """
+        created_tables = self.registry.created_tables(self.db_path)
+        key = f"{table_name}@{len(migrations)}"
+        if key in created_tables:
+            return
+        with self._get_table_lock(table_name):
+            if key in created_tables:
+                return
+            self.ensure_table(
+                SCHEMA_VERSIONS_TABLE,
+                f"""
+                CREATE TABLE IF NOT EXISTS {SCHEMA_VERSIONS_TABLE} (
+                    table_name VARCHAR PRIMARY KEY,
+                    version INTEGER NOT NULL,
+                    updated_at BIGINT NOT NULL
+                )
+                """,
+            )
+            row = self.fetchone(
+                f"SELECT version FROM {SCHEMA_VERSIONS_TABLE} WHERE table_name = ?",
+                (table_name,),
+            )
+            version = row[0] if row else 0
+            for target, migration in enumerate(migrations[version:], start=version + 1):
+                with self.transaction():
+                    if callable(migration):
+                        migration(self)
+                    else:
+                        self.execute(migration)
+                    self.execute(
+                        f"INSERT OR REPLACE INTO {SCHEMA_VERSIONS_TABLE} VALUES (?, ?, ?)",
+                        (table_name, target, int(time.time())),
+                    )
+            created_tables.add(key)
+
+    def schema_version(self, table_name: str) -> int:
+        """Return the applied schema version for a table (0 if untracked)."""
+        row = self.fetchone(
+            f"SELECT version FROM {SCHEMA_VERSIONS_TABLE} WHERE table_name = ?",
+            (table_name,),
+        )
+        return row[0] if row else 0
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group statements issued by this thread into one transaction."""
+        with self.registry.transaction(self.db_path):
+            yield
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Defer ``callback`` until this thread's transaction commits, if any."""
+        self.registry.after_commit(self.db_path, callback)
+
+    def close(self) -> None:
+        """Checkpoint and close the shared connection for this database."""
+        self.registry.close(self.db_path)
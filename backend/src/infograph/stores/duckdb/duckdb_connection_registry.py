@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from pathlib import Path
+from threading import BoundedSemaphore, Lock, get_ident, local
+from typing import Callable, Iterator
+
+import duckdb
+
+from infograph.settings import settings
+
+
+class DuckDBConnectionRegistry:
+    """Process-wide registry of shared DuckDB connections.
+
+    One root connection is opened per database file. Callers never use the
+    root connection directly; each thread gets its own cursor (a DuckDB
+    connection sharing the same database instance), and the number of threads
+    running statements concurrently is bounded by a semaphore.
+    """
+
+    def __init__(self, max_concurrency: int | None = None) -> None:
+        self.max_concurrency = max_concurrency or settings.duckdb_max_concurrency
+        self._lock = Lock()
+        self._connections: dict[Path, duckdb.DuckDBPyConnection] = {}
+        self._cursors: dict[tuple[Path, int], duckdb.DuckDBPyConnection] = {}
+        self._created_tables: dict[Path, set[str]] = {}
+        self._semaphore = BoundedSemaphore(self.max_concurrency)
+        self._local = local()
+
+    def connection(self, db_path: Path) -> duckdb.DuckDBPyConnection:
+        """Return the shared root connection for a database file."""
+        with self._lock:
+            conn = self._connections.get(db_path)
+            if conn is None:
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = duckdb.connect(str(db_path))
+                self._connections[db_path] = conn
+                self._created_tables[db_path] = set()
+            return conn
+
+    def created_tables(self, db_path: Path) -> set[str]:
+        """Return the set of tables already ensured for a database file."""
+        self.connection(db_path)
+        return self._created_tables[db_path]
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one of the concurrency slots for the duration of the block.
+
+        Nested use from the same thread re-uses the slot that is already held,
+        so a thread inside a transaction cannot deadlock against itself.
+        """
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            self._semaphore.acquire()
+        self._local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            if depth == 0:
+                self._semaphore.release()
+
+    @contextmanager
+    def cursor(self, db_path: Path) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Yield the calling thread's cursor, holding a concurrency slot."""
+        with self.slot():
+            yield self._thread_cursor(db_path)
+
+    def open_cursor(self, db_path: Path) -> duckdb.DuckDBPyConnection:
+        """Open a dedicated cursor that the caller must close.
+
+        Unlike the per-thread cursors it may be used from several threads in
+        turn, so a result can be consumed across executor calls without
+        other statements on those threads replacing it.
+        """
+        return self.connection(db_path).cursor()
+
+    @contextmanager
+    def transaction(self, db_path: Path) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Run the calling thread's statements for a database in one transaction.
+
+        Nested calls join the outermost transaction. Callbacks registered
+        with ``after_commit`` run once the outermost transaction commits.
+        """
+        active = self._active_transactions()
+        if db_path in active:
+            with self.cursor(db_path) as cursor:
+                yield cursor
+            return
+        callbacks: list[Callable[[], None]] = []
+        with self.cursor(db_path) as cursor:
+            cursor.execute("BEGIN TRANSACTION")
+            active[db_path] = callbacks
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            else:
+                cursor.execute("COMMIT")
+            finally:
+                active.pop(db_path, None)
+        for callback in callbacks:
+            callback()
+
+    def after_commit(self, db_path: Path, callback: Callable[[], None]) -> None:
+        """Run ``callback`` once the calling thread's transaction commits.
+
+        Runs it immediately outside a transaction; drops it on rollback.
+        """
+        callbacks = self._active_transactions().get(db_path)
+        if callbacks is None:
+            callback()
+        else:
+            callbacks.append(callback)
+
+    def close(self, db_path: Path) -> None:
+        """Checkpoint and close every connection for a database file."""
+        with self._lock:
+            conn = self._connections.pop(db_path, None)
+            self._created_tables.pop(db_path, None)
+            cursors = [
+                self._cursors.pop(key)
+                for key in list(self._cursors)
+                if key[0] == db_path
+            ]
+        for cursor in cursors:
+            cursor.close()
+        if conn is not None:
+            conn.execute("CHECKPOINT")
+            conn.close()
+
+    def close_all(self) -> None:
+        """Checkpoint and close all registered databases."""
+        with self._lock:
+            db_paths = list(self._connections)
+        for db_path in db_paths:
+            self.close(db_path)
+
+    def _active_transactions(self) -> dict[Path, list[Callable[[], None]]]:
+        active = getattr(self._local, "transactions", None)
+        if active is None:
+            active = {}
+            self._local.transactions = active
+        return active
+
+    def _thread_cursor(self, db_path: Path) -> duckdb.DuckDBPyConnection:
+        key = (db_path, get_ident())
+        cursor = self._cursors.get(key)
+        if cursor is not None:
+            return cursor
+        conn = self.connection(db_path)
+        with self._lock:
+            cursor = self._cursors.get(key)
+            if cursor is None:
+                cursor = conn.cursor()
+                self._cursors[key] = cursor
+            return cursor
+
+
+connection_registry = DuckDBConnectionRegistry()
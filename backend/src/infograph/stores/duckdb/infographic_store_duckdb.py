@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import json
 import time
 import uuid
 
+from infograph.core.event_bus import EventBus, SessionEvent, default_event_bus
 from infograph.core.schemas.infographic import Infographic, InfographicCreate
 from infograph.stores.abstract_infographic_store import AbstractInfographicStore
 from infograph.stores.duckdb.duckdb_client import DuckDBClient
@@ -15,20 +17,27 @@ class InfographicStoreDuckDB(AbstractInfographicStore):
 
     client: DuckDBClient
     table_name: str = "infographics"
+    event_bus: EventBus = field(default_factory=lambda: default_event_bus)
 
     def __post_init__(self) -> None:
-        self.client.ensure_table(
+        self.client.ensure_schema(
             self.table_name,
-            """
-            CREATE TABLE IF NOT EXISTS infographics (
-                infographic_id VARCHAR PRIMARY KEY,
-                session_id VARCHAR NOT NULL,
-                image_path VARCHAR NOT NULL,
-                template_type VARCHAR NOT NULL,
-                layout_data JSON NOT NULL,
-                created_at BIGINT NOT NULL
-            )
-            """,
+            [
+                """
+                CREATE TABLE IF NOT EXISTS infographics (
+                    infographic_id VARCHAR PRIMARY KEY,
+                    session_id VARCHAR NOT NULL,
+                    image_path VARCHAR NOT NULL,
+                    template_type VARCHAR NOT NULL,
+                    layout_data JSON NOT NULL,
+                    created_at BIGINT NOT NULL
+                )
+                """,
+                "CREATE INDEX IF NOT EXISTS idx_infographics_session_id "
+                "ON infographics (session_id)",
+                "CREATE INDEX IF NOT EXISTS idx_infographics_image_path "
+                "ON infographics (image_path)",
+            ],
         )
 
     def create_infographic(self, infographic_create: InfographicCreate) -> Infographic:
@@ -48,7 +57,7 @@ class InfographicStoreDuckDB(AbstractInfographicStore):
                 created_at,
             ),
         )
-        return Infographic(
+        infographic = Infographic(
             infographic_id=infographic_id,
             session_id=infographic_create.session_id,
             image_path=infographic_create.layout_data.get("image_path", ""),
@@ -56,6 +65,15 @@ class InfographicStoreDuckDB(AbstractInfographicStore):
             layout_data=infographic_create.layout_data,
             created_at=created_at,
         )
+        event = SessionEvent(
+            session_id=infographic.session_id,
+            event="infographic",
+            data=infographic.model_dump(),
+        )
+        # Inside generate_infographic's transaction: readers must be able to
+        # fetch the row, and a rolled-back row must never be announced.
+        self.client.after_commit(lambda: self.event_bus.publish(event))
+        return infographic
 
     def get_infographic(self, session_id: str) -> Infographic | None:
         row = self.client.fetchone(
@@ -68,8 +86,22 @@ class InfographicStoreDuckDB(AbstractInfographicStore):
         )
         return self._row_to_infographic(row)
 
-    def delete_infographic(self, session_id: str) -> None:
-        self.client.execute("DELETE FROM infographics WHERE session_id = ?", (session_id,))
+    def delete_infographic(self, session_id: str) -> list[str]:
+        rows = self.client.fetchall(
+            "DELETE FROM infographics WHERE session_id = ? RETURNING image_path",
+            (session_id,),
+        )
+        return [row[0] for row in rows]
+
+    def filter_referenced_image_paths(self, image_paths: list[str]) -> set[str]:
+        if not image_paths:
+            return set()
+        rows = self.client.fetchall(
+            "SELECT DISTINCT image_path FROM infographics WHERE image_path IN "
+            f"({', '.join('?' * len(image_paths))})",
+            tuple(image_paths),
+        )
+        return {row[0] for row in rows}
 
     @staticmethod
     def _row_to_infographic(row: tuple | None) -> Infographic | None:
@@ -80,6 +112,6 @@ class InfographicStoreDuckDB(AbstractInfographicStore):
             session_id=row[1],
             image_path=row[2],
             template_type=row[3],
-            layout_data=row[4],
+            layout_data=json.loads(row[4]) if isinstance(row[4], str) else row[4],
             created_at=row[5],
         )
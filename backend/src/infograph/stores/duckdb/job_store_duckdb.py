@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+import uuid
+
+import duckdb
+
+from infograph.core.schemas.job import Job, JobCreate
+from infograph.stores.abstract_job_store import AbstractJobStore
+from infograph.stores.duckdb.duckdb_client import DuckDBClient
+
+
+_JOB_COLUMNS = (
+    "job_id, session_id, job_type, status, attempts, max_attempts, "
+    "worker_id, lease_expires_at, last_error, created_at, updated_at"
+)
+
+
+@dataclass
+class JobStoreDuckDB(AbstractJobStore):
+    """DuckDB implementation for leased background jobs.
+
+    Claims are a single conditional ``UPDATE ... RETURNING``; when two workers
+    race for the same row DuckDB raises a write conflict for the loser, which
+    is reported as "nothing claimed" so the job is never processed twice.
+    """
+
+    client: DuckDBClient
+    table_name: str = "jobs"
+
+    def __post_init__(self) -> None:
+        self.client.ensure_schema(
+            self.table_name,
+            [
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id VARCHAR PRIMARY KEY,
+                    session_id VARCHAR NOT NULL,
+                    job_type VARCHAR NOT NULL,
+                    status VARCHAR NOT NULL,
+                    attempts INTEGER NOT NULL,
+                    max_attempts INTEGER NOT NULL,
+                    worker_id VARCHAR,
+                    lease_expires_at BIGINT,
+                    last_error VARCHAR,
+                    created_at BIGINT NOT NULL,
+                    updated_at BIGINT NOT NULL
+                )
+                """,
+                "CREATE INDEX IF NOT EXISTS idx_jobs_session_id ON jobs (session_id)",
+            ],
+        )
+
+    def enqueue_job(self, job_create: JobCreate) -> Job:
+        job_id = str(uuid.uuid4())
+        timestamp = int(time.time())
+        self.client.execute(
+            """
+            INSERT INTO jobs (job_id, session_id, job_type, status, attempts, max_attempts, created_at, updated_at)
+            VALUES (?, ?, ?, 'queued', 0, ?, ?, ?)
+            """,
+            (
+                job_id,
+                job_create.session_id,
+                job_create.job_type,
+                job_create.max_attempts,
+                timestamp,
+                timestamp,
+            ),
+        )
+        return Job(
+            job_id=job_id,
+            session_id=job_create.session_id,
+            job_type=job_create.job_type,
+            status="queued",
+            attempts=0,
+            max_attempts=job_create.max_attempts,
+            created_at=timestamp,
+            updated_at=timestamp,
+        )
+
+    def get_job(self, job_id: str) -> Job | None:
+        row = self.client.fetchone(
+            f"SELECT {_JOB_COLUMNS} FROM jobs WHERE job_id = ?",
+            (job_id,),
+        )
+        return self._row_to_job(row)
+
+    def claim_job(self, worker_id: str, lease_seconds: int) -> Job | None:
+        timestamp = int(time.time())
+        try:
+            row = self.client.fetchone(
+                f"""
+                UPDATE jobs
+                SET status = 'running', worker_id = ?, lease_expires_at = ?,
+                    attempts = attempts + 1, updated_at = ?
+                WHERE job_id = (
+                    SELECT job_id FROM jobs
+                    WHERE status = 'queued'
+                    ORDER BY created_at, job_id
+                    LIMIT 1
+                )
+                AND status = 'queued'
+                RETURNING {_JOB_COLUMNS}
+                """,
+                (worker_id, timestamp + lease_seconds, timestamp),
+            )
+        except duckdb.TransactionException:
+            return None
+        return self._row_to_job(row)
+
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: int) -> bool:
+        timestamp = int(time.time())
+        row = self.client.fetchone(
+            """
+            UPDATE jobs
+            SET lease_expires_at = ?, updated_at = ?
+            WHERE job_id = ? AND worker_id = ? AND status = 'running'
+            RETURNING job_id
+            """,
+            (timestamp + lease_seconds, timestamp, job_id, worker_id),
+        )
+        return row is not None
+
+    def complete_job(self, job_id: str, worker_id: str) -> bool:
+        row = self.client.fetchone(
+            """
+            UPDATE jobs
+            SET status = 'completed', lease_expires_at = NULL, updated_at = ?
+            WHERE job_id = ? AND worker_id = ? AND status = 'running'
+            RETURNING job_id
+            """,
+            (int(time.time()), job_id, worker_id),
+        )
+        return row is not None
+
+    def fail_job(self, job_id: str, worker_id: str, error: str) -> Job | None:
+        row = self.client.fetchone(
+            f"""
+            UPDATE jobs
+            SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END,
+                worker_id = NULL, lease_expires_at = NULL, last_error = ?, updated_at = ?
+            WHERE job_id = ? AND worker_id = ? AND status = 'running'
+            RETURNING {_JOB_COLUMNS}
+            """,
+            (error, int(time.time()), job_id, worker_id),
+        )
+        return self._row_to_job(row)
+
+    def requeue_expired_leases(self) -> list[Job]:
+        timestamp = int(time.time())
+        rows = self.client.fetchall(
+            f"""
+            UPDATE jobs
+            SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END,
+                worker_id = NULL, lease_expires_at = NULL,
+                last_error = 'Lease expired', updated_at = ?
+            WHERE status = 'running' AND lease_expires_at < ?
+            RETURNING {_JOB_COLUMNS}
+            """,
+            (timestamp, timestamp),
+        )
+        return [self._row_to_job(row) for row in rows if row is not None]
+
+    def purge_finished_jobs(self, updated_before: int) -> int:
+        rows = self.client.fetchall(
+            """
+            DELETE FROM jobs
+            WHERE status IN ('completed', 'failed') AND updated_at < ?
+            RETURNING job_id
+            """,
+            (updated_before,),
+        )
+        return len(rows)
+
+    def list_active_session_ids(self) -> set[str]:
+        rows = self.client.fetchall(
+            "SELECT DISTINCT session_id FROM jobs WHERE status IN ('queued', 'running')"
+        )
+        return {row[0] for row in rows}
+
+    @staticmethod
+    def _row_to_job(row: tuple | None) -> Job | None:
+        if row is None:
+            return None
+        return Job(
+            job_id=row[0],
+            session_id=row[1],
+            job_type=row[2],
+            status=row[3],
+            attempts=row[4],
+            max_attempts=row[5],
+            worker_id=row[6],
+            lease_expires_at=row[7],
+            last_error=row[8],
+            created_at=row[9],
+            updated_at=row[10],
+        )
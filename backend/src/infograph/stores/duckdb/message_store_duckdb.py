@@ -2,12 +2,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import time
+from typing import Any, Iterator
 import uuid
 
+from infograph.core.cursor import decode_cursor, encode_cursor
+from infograph.core.fast_json import records
 from infograph.core.schemas.message import Message, MessageCreate
+from infograph.core.schemas.page import Page
 from infograph.stores.abstract_message_store import AbstractMessageStore
 from infograph.stores.duckdb.duckdb_client import DuckDBClient
 
+MESSAGE_COLUMNS = ("message_id", "session_id", "role", "content", "created_at")
+
 
 @dataclass
 class MessageStoreDuckDB(AbstractMessageStore):
@@ -17,17 +23,21 @@ class MessageStoreDuckDB(AbstractMessageStore):
     table_name: str = "messages"
 
     def __post_init__(self) -> None:
-        self.client.ensure_table(
+        self.client.ensure_schema(
             self.table_name,
-            """
-            CREATE TABLE IF NOT EXISTS messages (
-                message_id VARCHAR PRIMARY KEY,
-                session_id VARCHAR NOT NULL,
-                role VARCHAR NOT NULL,
-                content VARCHAR NOT NULL,
-                created_at BIGINT NOT NULL
-            )
-            """,
+            [
+                """
+                CREATE TABLE IF NOT EXISTS messages (
+                    message_id VARCHAR PRIMARY KEY,
+                    session_id VARCHAR NOT NULL,
+                    role VARCHAR NOT NULL,
+                    content VARCHAR NOT NULL,
+                    created_at BIGINT NOT NULL
+                )
+                """,
+                "CREATE INDEX IF NOT EXISTS idx_messages_session_created "
+                "ON messages (session_id, created_at)",
+            ],
         )
 
     def create_message(self, message_create: MessageCreate) -> Message:
@@ -66,9 +76,55 @@ class MessageStoreDuckDB(AbstractMessageStore):
         )
         return [self._row_to_message(row) for row in rows if row is not None]
 
+    def list_messages_page(
+        self, session_id: str, limit: int, cursor: str | None = None
+    ) -> Page[Message]:
+        rows, next_cursor = self._fetch_messages_page(session_id, limit, cursor)
+        messages = [self._row_to_message(row) for row in rows]
+        return Page[Message](items=messages, next_cursor=next_cursor)
+
+    def list_message_records_page(
+        self, session_id: str, limit: int, cursor: str | None = None
+    ) -> dict[str, Any]:
+        rows, next_cursor = self._fetch_messages_page(session_id, limit, cursor)
+        return {"items": records(MESSAGE_COLUMNS, rows), "next_cursor": next_cursor}
+
+    def iter_message_records(
+        self, session_id: str, cursor: str | None = None, batch_size: int = 500
+    ) -> Iterator[list[dict[str, Any]]]:
+        # Built eagerly so a bad cursor fails before any output is produced.
+        query, parameters = self._messages_query(session_id, cursor)
+        return self.client.stream_records(query, parameters, batch_size)
+
     def delete_messages_for_session(self, session_id: str) -> None:
         self.client.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
 
+    def _fetch_messages_page(
+        self, session_id: str, limit: int, cursor: str | None
+    ) -> tuple[list[tuple[Any, ...]], str | None]:
+        query, parameters = self._messages_query(session_id, cursor)
+        rows = self.client.fetchall(f"{query} LIMIT ?", parameters + (limit + 1,))
+        if len(rows) <= limit:
+            return rows, None
+        last = rows[limit - 1]
+        return rows[:limit], encode_cursor(last[4], last[0])
+
+    @staticmethod
+    def _messages_query(session_id: str, cursor: str | None) -> tuple[str, tuple]:
+        parameters: tuple = (session_id,)
+        after = ""
+        if cursor is not None:
+            created_at, message_id = decode_cursor(cursor)
+            after = "AND (created_at > ? OR (created_at = ? AND message_id > ?))"
+            parameters += (created_at, created_at, message_id)
+        query = f"""
+            SELECT {", ".join(MESSAGE_COLUMNS)}
+            FROM messages
+            WHERE session_id = ? {after}
+            ORDER BY created_at ASC, message_id ASC
+            """
+        return query, parameters
+
     @staticmethod
     def _row_to_message(row: tuple | None) -> Message | None:
         if row is None:
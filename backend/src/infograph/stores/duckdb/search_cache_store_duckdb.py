@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+
+from infograph.core.schemas.search_cache import SearchCacheEntry
+from infograph.stores.abstract_search_cache_store import AbstractSearchCacheStore
+from infograph.stores.duckdb.duckdb_client import DuckDBClient
+
+
+@dataclass
+class SearchCacheStoreDuckDB(AbstractSearchCacheStore):
+    """DuckDB implementation for cached search results."""
+
+    client: DuckDBClient
+    table_name: str = "search_cache"
+
+    def __post_init__(self) -> None:
+        self.client.ensure_schema(
+            self.table_name,
+            [
+                """
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    cache_key VARCHAR PRIMARY KEY,
+                    query VARCHAR NOT NULL,
+                    max_results INTEGER NOT NULL,
+                    results JSON NOT NULL,
+                    fetched_at BIGINT NOT NULL
+                )
+                """,
+            ],
+        )
+
+    def get_entry(self, cache_key: str) -> SearchCacheEntry | None:
+        row = self.client.fetchone(
+            """
+            SELECT cache_key, query, max_results, results, fetched_at
+            FROM search_cache
+            WHERE cache_key = ?
+            """,
+            (cache_key,),
+        )
+        return self._row_to_entry(row)
+
+    def put_entry(self, entry: SearchCacheEntry) -> None:
+        self.client.execute(
+            """
+            INSERT OR REPLACE INTO search_cache (cache_key, query, max_results, results, fetched_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                entry.cache_key,
+                entry.query,
+                entry.max_results,
+                json.dumps(entry.results),
+                entry.fetched_at,
+            ),
+        )
+
+    def delete_entries_before(self, fetched_before: int) -> int:
+        rows = self.client.fetchall(
+            "DELETE FROM search_cache WHERE fetched_at < ? RETURNING cache_key",
+            (fetched_before,),
+        )
+        return len(rows)
+
+    @staticmethod
+    def _row_to_entry(row: tuple | None) -> SearchCacheEntry | None:
+        if row is None:
+            return None
+        return SearchCacheEntry(
+            cache_key=row[0],
+            query=row[1],
+            max_results=row[2],
+            results=json.loads(row[3]) if isinstance(row[3], str) else row[3],
+            fetched_at=row[4],
+        )
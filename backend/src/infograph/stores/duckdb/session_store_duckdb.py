@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import time
+from typing import Any, Iterator
 import uuid
 
+from infograph.core.cursor import decode_cursor, encode_cursor
+from infograph.core.event_bus import EventBus, SessionEvent, default_event_bus
+from infograph.core.fast_json import records
+from infograph.core.schemas.page import Page
 from infograph.core.schemas.research_session import (
     ResearchSession,
     ResearchSessionCreate,
@@ -12,6 +17,19 @@ from infograph.core.schemas.research_session import (
 from infograph.stores.abstract_session_store import AbstractSessionStore
 from infograph.stores.duckdb.duckdb_client import DuckDBClient
 
+# Tables keyed by session_id that are removed with their session. Tables that
+# were never created in this database are skipped.
+CASCADE_TABLES = ("messages", "sources", "infographics", "jobs")
+
+SESSION_COLUMNS = (
+    "session_id",
+    "user_id",
+    "prompt",
+    "status",
+    "created_at",
+    "updated_at",
+)
+
 
 @dataclass
 class SessionStoreDuckDB(AbstractSessionStore):
@@ -19,20 +37,25 @@ class SessionStoreDuckDB(AbstractSessionStore):
 
     client: DuckDBClient
     table_name: str = "research_sessions"
+    event_bus: EventBus = field(default_factory=lambda: default_event_bus)
 
     def __post_init__(self) -> None:
-        self.client.ensure_table(
+        self.client.ensure_schema(
             self.table_name,
-            """
-            CREATE TABLE IF NOT EXISTS research_sessions (
-                session_id VARCHAR PRIMARY KEY,
-                user_id VARCHAR NOT NULL,
-                prompt VARCHAR NOT NULL,
-                status VARCHAR NOT NULL,
-                created_at BIGINT NOT NULL,
-                updated_at BIGINT NOT NULL
-            )
-            """,
+            [
+                """
+                CREATE TABLE IF NOT EXISTS research_sessions (
+                    session_id VARCHAR PRIMARY KEY,
+                    user_id VARCHAR NOT NULL,
+                    prompt VARCHAR NOT NULL,
+                    status VARCHAR NOT NULL,
+                    created_at BIGINT NOT NULL,
+                    updated_at BIGINT NOT NULL
+                )
+                """,
+                "CREATE INDEX IF NOT EXISTS idx_research_sessions_user_created "
+                "ON research_sessions (user_id, created_at)",
+            ],
         )
 
     def create_session(
@@ -81,6 +104,58 @@ class SessionStoreDuckDB(AbstractSessionStore):
         )
         return [self._row_to_session(row) for row in rows if row is not None]
 
+    def list_sessions_page(
+        self, user_id: str, limit: int, cursor: str | None = None
+    ) -> Page[ResearchSession]:
+        rows, next_cursor = self._fetch_sessions_page(user_id, limit, cursor)
+        sessions = [self._row_to_session(row) for row in rows]
+        return Page[ResearchSession](items=sessions, next_cursor=next_cursor)
+
+    def list_session_records_page(
+        self, user_id: str, limit: int, cursor: str | None = None
+    ) -> dict[str, Any]:
+        rows, next_cursor = self._fetch_sessions_page(user_id, limit, cursor)
+        return {"items": records(SESSION_COLUMNS, rows), "next_cursor": next_cursor}
+
+    def iter_session_records(
+        self, user_id: str, cursor: str | None = None, batch_size: int = 500
+    ) -> Iterator[list[dict[str, Any]]]:
+        # Built eagerly so a bad cursor fails before any output is produced.
+        query, parameters = self._sessions_query(user_id, cursor)
+        return self.client.stream_records(query, parameters, batch_size)
+
+    def list_sessions_by_status(self, statuses: list[str]) -> list[ResearchSession]:
+        if not statuses:
+            return []
+        placeholders = ", ".join("?" for _ in statuses)
+        rows = self.client.fetchall(
+            f"""
+            SELECT session_id, user_id, prompt, status, created_at, updated_at
+            FROM research_sessions
+            WHERE status IN ({placeholders})
+            ORDER BY created_at ASC
+            """,
+            tuple(statuses),
+        )
+        return [self._row_to_session(row) for row in rows if row is not None]
+
+    def lock_session(self, session_id: str) -> bool:
+        """Claim a session's row for the calling thread's transaction.
+
+        Returns False when the session no longer exists. While the claim is
+        held a concurrent ``delete_session_cascade`` conflicts instead of
+        committing around rows written in the same transaction.
+        """
+        row = self.client.fetchone(
+            """
+            UPDATE research_sessions SET status = status
+            WHERE session_id = ?
+            RETURNING session_id
+            """,
+            (session_id,),
+        )
+        return row is not None
+
     def update_session(
         self, session_id: str, session_update: ResearchSessionUpdate
     ) -> ResearchSession | None:
@@ -97,7 +172,7 @@ class SessionStoreDuckDB(AbstractSessionStore):
             """,
             (status, updated_at, session_id),
         )
-        return ResearchSession(
+        session = ResearchSession(
             session_id=existing.session_id,
             user_id=existing.user_id,
             prompt=existing.prompt,
@@ -105,10 +180,74 @@ class SessionStoreDuckDB(AbstractSessionStore):
             created_at=existing.created_at,
             updated_at=updated_at,
         )
+        self.event_bus.publish(
+            SessionEvent(session_id=session_id, event="status", data=session.model_dump())
+        )
+        return session
 
     def delete_session(self, session_id: str) -> None:
         self.client.execute("DELETE FROM research_sessions WHERE session_id = ?", (session_id,))
 
+    def delete_session_cascade(self, session_id: str) -> list[str]:
+        image_paths: list[str] = []
+        with self.client.transaction():
+            existing = {
+                row[0]
+                for row in self.client.fetchall(
+                    "SELECT table_name FROM duckdb_tables() WHERE table_name IN "
+                    f"({', '.join('?' * len(CASCADE_TABLES))})",
+                    CASCADE_TABLES,
+                )
+            }
+            for table in CASCADE_TABLES:
+                if table not in existing:
+                    continue
+                if table == "infographics":
+                    rows = self.client.fetchall(
+                        "DELETE FROM infographics WHERE session_id = ? RETURNING image_path",
+                        (session_id,),
+                    )
+                    image_paths.extend(row[0] for row in rows if row[0])
+                else:
+                    self.client.execute(
+                        f"DELETE FROM {table} WHERE session_id = ?", (session_id,)
+                    )
+            self.delete_session(session_id)
+            # Ends open event streams for the session; see SessionRouter.
+            event = SessionEvent(
+                session_id=session_id, event="deleted", data={"session_id": session_id}
+            )
+            self.client.after_commit(lambda: self.event_bus.publish(event))
+        return image_paths
+
+    def _fetch_sessions_page(
+        self, user_id: str, limit: int, cursor: str | None
+    ) -> tuple[list[tuple[Any, ...]], str | None]:
+        query, parameters = self._sessions_query(user_id, cursor)
+        rows = self.client.fetchall(f"{query} LIMIT ?", parameters + (limit + 1,))
+        if len(rows) <= limit:
+            return rows, None
+        last = rows[limit - 1]
+        return rows[:limit], encode_cursor(last[4], last[0])
+
+    @staticmethod
+    def _sessions_query(user_id: str, cursor: str | None) -> tuple[str, tuple]:
+        # Keyset pagination: seek past the last (created_at, session_id) seen,
+        # so every page costs the same regardless of depth.
+        parameters: tuple = (user_id,)
+        after = ""
+        if cursor is not None:
+            created_at, session_id = decode_cursor(cursor)
+            after = "AND (created_at < ? OR (created_at = ? AND session_id < ?))"
+            parameters += (created_at, created_at, session_id)
+        query = f"""
+            SELECT {", ".join(SESSION_COLUMNS)}
+            FROM research_sessions
+            WHERE user_id = ? {after}
+            ORDER BY created_at DESC, session_id DESC
+            """
+        return query, parameters
+
     @staticmethod
     def _row_to_session(row: tuple | None) -> ResearchSession | None:
         if row is None:
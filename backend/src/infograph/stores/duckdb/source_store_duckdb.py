@@ -1,13 +1,26 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import time
+from typing import Any, Iterator
 import uuid
 
+from infograph.core.event_bus import EventBus, SessionEvent, default_event_bus
+from infograph.core.fast_json import records
 from infograph.core.schemas.source import Source, SourceCreate
 from infograph.stores.abstract_source_store import AbstractSourceStore
 from infograph.stores.duckdb.duckdb_client import DuckDBClient
 
+SOURCE_COLUMNS = (
+    "source_id",
+    "session_id",
+    "title",
+    "url",
+    "snippet",
+    "confidence",
+    "fetched_at",
+)
+
 
 @dataclass
 class SourceStoreDuckDB(AbstractSourceStore):
@@ -15,21 +28,27 @@ class SourceStoreDuckDB(AbstractSourceStore):
 
     client: DuckDBClient
     table_name: str = "sources"
+    bulk_batch_size: int = 500
+    event_bus: EventBus = field(default_factory=lambda: default_event_bus)
 
     def __post_init__(self) -> None:
-        self.client.ensure_table(
+        self.client.ensure_schema(
             self.table_name,
-            """
-            CREATE TABLE IF NOT EXISTS sources (
-                source_id VARCHAR PRIMARY KEY,
-                session_id VARCHAR NOT NULL,
-                title VARCHAR NOT NULL,
-                url VARCHAR NOT NULL,
-                snippet VARCHAR NOT NULL,
-                confidence DOUBLE NOT NULL,
-                fetched_at BIGINT NOT NULL
-            )
-            """,
+            [
+                """
+                CREATE TABLE IF NOT EXISTS sources (
+                    source_id VARCHAR PRIMARY KEY,
+                    session_id VARCHAR NOT NULL,
+                    title VARCHAR NOT NULL,
+                    url VARCHAR NOT NULL,
+                    snippet VARCHAR NOT NULL,
+                    confidence DOUBLE NOT NULL,
+                    fetched_at BIGINT NOT NULL
+                )
+                """,
+                "CREATE INDEX IF NOT EXISTS idx_sources_session_id "
+                "ON sources (session_id)",
+            ],
         )
 
     def create_source(self, source_create: SourceCreate) -> Source:
@@ -50,7 +69,7 @@ class SourceStoreDuckDB(AbstractSourceStore):
                 fetched_at,
             ),
         )
-        return Source(
+        source = Source(
             source_id=source_id,
             session_id=source_create.session_id,
             title=source_create.title,
@@ -59,21 +78,91 @@ class SourceStoreDuckDB(AbstractSourceStore):
             confidence=source_create.confidence,
             fetched_at=fetched_at,
         )
+        self.client.after_commit(lambda: self._publish([source]))
+        return source
+
+    def create_sources_bulk(self, source_creates: list[SourceCreate]) -> list[Source]:
+        """Insert sources with multi-row INSERTs inside a single transaction.
+
+        The returned sources are built from the inserted values, so no
+        re-query is needed. Events are published only after the commit of
+        the outermost transaction, which may be the caller's.
+        """
+        fetched_at = int(time.time())
+        sources = [
+            Source(
+                source_id=str(uuid.uuid4()),
+                fetched_at=fetched_at,
+                **source_create.model_dump(),
+            )
+            for source_create in source_creates
+        ]
+        if not sources:
+            return []
+        with self.client.transaction():
+            for start in range(0, len(sources), self.bulk_batch_size):
+                batch = sources[start : start + self.bulk_batch_size]
+                placeholders = ", ".join(["(?, ?, ?, ?, ?, ?, ?)"] * len(batch))
+                parameters = tuple(
+                    value
+                    for source in batch
+                    for value in (
+                        source.source_id,
+                        source.session_id,
+                        source.title,
+                        source.url,
+                        source.snippet,
+                        source.confidence,
+                        source.fetched_at,
+                    )
+                )
+                self.client.execute(
+                    f"""
+                    INSERT INTO sources (source_id, session_id, title, url, snippet, confidence, fetched_at)
+                    VALUES {placeholders}
+                    """,
+                    parameters,
+                )
+            self.client.after_commit(lambda: self._publish(sources))
+        return sources
 
     def list_sources(self, session_id: str) -> list[Source]:
-        rows = self.client.fetchall(
-            """
-            SELECT source_id, session_id, title, url, snippet, confidence, fetched_at
+        rows = self._fetch_sources(session_id)
+        return [self._row_to_source(row) for row in rows if row is not None]
+
+    def list_source_records(self, session_id: str) -> list[dict[str, Any]]:
+        return records(SOURCE_COLUMNS, self._fetch_sources(session_id))
+
+    def iter_source_records(
+        self, session_id: str, batch_size: int = 500
+    ) -> Iterator[list[dict[str, Any]]]:
+        return self.client.stream_records(*self._sources_query(session_id), batch_size)
+
+    def delete_sources_for_session(self, session_id: str) -> None:
+        self.client.execute("DELETE FROM sources WHERE session_id = ?", (session_id,))
+
+    def _publish(self, sources: list[Source]) -> None:
+        for source in sources:
+            self.event_bus.publish(
+                SessionEvent(
+                    session_id=source.session_id, event="source", data=source.model_dump()
+                )
+            )
+
+    def _fetch_sources(self, session_id: str) -> list[tuple[Any, ...]]:
+        return self.client.fetchall(*self._sources_query(session_id))
+
+    @staticmethod
+    def _sources_query(session_id: str) -> tuple[str, tuple]:
+        return (
+            f"""
+            SELECT {", ".join(SOURCE_COLUMNS)}
             FROM sources
             WHERE session_id = ?
             ORDER BY fetched_at DESC
             """,
             (session_id,),
         )
-        return [self._row_to_source(row) for row in rows if row is not None]
-
-    def delete_sources_for_session(self, session_id: str) -> None:
-        self.client.execute("DELETE FROM sources WHERE session_id = ?", (session_id,))
 
     @staticmethod
     def _row_to_source(row: tuple | None) -> Source | None:
@@ -1,13 +1,60 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import logging
 import time
 import uuid
 
+from infograph.core.cache import TTLCache
 from infograph.core.schemas.user import User, UserCreate
+from infograph.settings import settings
 from infograph.stores.abstract_user_store import AbstractUserStore
 from infograph.stores.duckdb.duckdb_client import DuckDBClient
 
+logger = logging.getLogger(__name__)
+
+# Shared by every store instance so an update through one invalidates the
+# entry read through another. Keys include the database path.
+default_user_cache: TTLCache[tuple[str, str], User] = TTLCache(
+    max_entries=settings.user_cache_max_entries,
+    ttl_seconds=settings.user_cache_ttl_seconds,
+)
+
+
+def merge_duplicate_google_ids(client: DuckDBClient) -> None:
+    """Collapse users sharing a google_id into the earliest one.
+
+    Racing first logins could create several rows per Google account before
+    google_id was unique. Their sessions move to the kept user so no history
+    is lost, then the duplicate rows are dropped.
+    """
+    rows = client.fetchall(
+        """
+        SELECT user_id, first_value(user_id) OVER (
+            PARTITION BY google_id ORDER BY created_at, user_id
+        )
+        FROM users
+        """
+    )
+    merges = [(duplicate, kept) for duplicate, kept in rows if duplicate != kept]
+    if not merges:
+        return
+    logger.warning(
+        "Merging %d duplicate users: %s",
+        len(merges),
+        ", ".join(f"{duplicate} -> {kept}" for duplicate, kept in merges),
+    )
+    has_sessions = client.fetchone(
+        "SELECT 1 FROM duckdb_tables() WHERE table_name = 'research_sessions'"
+    )
+    for duplicate, kept in merges:
+        if has_sessions:
+            client.execute(
+                "UPDATE research_sessions SET user_id = ? WHERE user_id = ?",
+                (kept, duplicate),
+            )
+        client.execute("DELETE FROM users WHERE user_id = ?", (duplicate,))
+
 
 @dataclass
 class UserStoreDuckDB(AbstractUserStore):
@@ -15,20 +62,28 @@ class UserStoreDuckDB(AbstractUserStore):
 
     client: DuckDBClient
     table_name: str = "users"
+    cache: TTLCache[tuple[str, str], User] = field(
+        default_factory=lambda: default_user_cache
+    )
 
     def __post_init__(self) -> None:
-        self.client.ensure_table(
+        self.client.ensure_schema(
             self.table_name,
-            """
-            CREATE TABLE IF NOT EXISTS users (
-                user_id VARCHAR PRIMARY KEY,
-                email VARCHAR NOT NULL,
-                name VARCHAR NOT NULL,
-                google_id VARCHAR NOT NULL,
-                created_at BIGINT NOT NULL,
-                updated_at BIGINT NOT NULL
-            )
-            """,
+            [
+                """
+                CREATE TABLE IF NOT EXISTS users (
+                    user_id VARCHAR PRIMARY KEY,
+                    email VARCHAR NOT NULL,
+                    name VARCHAR NOT NULL,
+                    google_id VARCHAR NOT NULL,
+                    created_at BIGINT NOT NULL,
+                    updated_at BIGINT NOT NULL
+                )
+                """,
+                merge_duplicate_google_ids,
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_users_google_id "
+                "ON users (google_id)",
+            ],
         )
 
     def create_user(self, user_create: UserCreate) -> User:
@@ -51,6 +106,11 @@ class UserStoreDuckDB(AbstractUserStore):
         )
 
     def get_user_by_id(self, user_id: str) -> User | None:
+        key = self._cache_key(user_id)
+        user = self.cache.get(key)
+        if user is not None:
+            return user
+        generation = self.cache.generation()
         row = self.client.fetchone(
             """
             SELECT user_id, email, name, google_id, created_at, updated_at
@@ -59,7 +119,10 @@ class UserStoreDuckDB(AbstractUserStore):
             """,
             (user_id,),
         )
-        return self._row_to_user(row)
+        user = self._row_to_user(row)
+        if user is not None:
+            self.cache.set(key, user, generation)
+        return user
 
     def get_user_by_google_id(self, google_id: str) -> User | None:
         row = self.client.fetchone(
@@ -82,6 +145,7 @@ class UserStoreDuckDB(AbstractUserStore):
             """,
             (user.email, user.name, user.google_id, updated_at, user.user_id),
         )
+        self.cache.invalidate(self._cache_key(user.user_id))
         return User(
             user_id=user.user_id,
             email=user.email,
@@ -93,6 +157,10 @@ class UserStoreDuckDB(AbstractUserStore):
 
     def delete_user(self, user_id: str) -> None:
         self.client.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
+        self.cache.invalidate(self._cache_key(user_id))
+
+    def _cache_key(self, user_id: str) -> tuple[str, str]:
+        return (str(self.client.db_path), user_id)
 
     @staticmethod
     def _row_to_user(row: tuple | None) -> User | None:
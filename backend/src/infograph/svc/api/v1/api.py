@@ -1,10 +1,47 @@
 from fastapi import APIRouter
 
+from infograph.core.blocking_executor import BlockingExecutor
+from infograph.core.metrics import MetricsRegistry
+from infograph.core.single_flight import SingleFlight
+
+from infograph.services.infographic_file_reclaimer import InfographicFileReclaimer
+from infograph.services.infographic_service import InfographicService
+from infograph.services.render_engine import RenderEngine
+from infograph.services.research_job_runner import ResearchJobRunner
+from infograph.services.research_service import ResearchService
+from infograph.services.search_cache import SearchCache
+from infograph.services.search_service import SearchService
+from infograph.services.text_layout import preload_fonts
+from infograph.settings import settings
+from infograph.stores.duckdb.duckdb_client import DuckDBClient
+from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
+from infograph.stores.duckdb.job_store_duckdb import JobStoreDuckDB
+from infograph.stores.duckdb.search_cache_store_duckdb import SearchCacheStoreDuckDB
+from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
+from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
 from infograph.svc.api.v1.routers.auth_router import AuthRouter
 from infograph.svc.api.v1.routers.health_router import HealthRouter
+from infograph.svc.api.v1.routers.metrics_router import MetricsRouter
 from infograph.svc.api.v1.routers.infographic_router import InfographicRouter
 from infograph.svc.api.v1.routers.session_router import SessionRouter
 from infograph.svc.api.v1.routers.source_router import SourceRouter
+from infograph.svc.auth import get_auth_manager
+
+
+TEST_SEARCH_HTML = """
+<html>
+<body>
+  <div class="results">
+    <a class="result__a" href="https://example.com/alpha">Alpha Title</a>
+    <span class="result__snippet">Alpha snippet text.</span>
+  </div>
+  <div class="results">
+    <a class="result__a" href="/beta">Beta Title</a>
+    <span class="result__snippet">Beta snippet text.</span>
+  </div>
+</body>
+</html>
+"""
 
 
 class ServiceAPIRouter(APIRouter):
@@ -13,17 +50,137 @@ class ServiceAPIRouter(APIRouter):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
+        self.client = DuckDBClient(db_name="infograph")
+        self.db_executor = BlockingExecutor("db", settings.duckdb_max_concurrency)
+        self.auth_executor = BlockingExecutor("auth", settings.auth_executor_workers)
+        self.research_executor = BlockingExecutor(
+            "research", settings.research_worker_count
+        )
+        self.reclaimer_executor = BlockingExecutor("reclaimer", 1)
+        # Threads waiting on image variant renders; sized to the render
+        # engine's capacity so overflow is rejected by the engine at once.
+        self.render_executor = BlockingExecutor(
+            "render", max(1, settings.render_workers + settings.render_queue_size)
+        )
+        self.metrics = MetricsRegistry()
+        for executor in (
+            self.db_executor,
+            self.auth_executor,
+            self.research_executor,
+            self.reclaimer_executor,
+            self.render_executor,
+        ):
+            self.metrics.register(f"executor.{executor.name}", executor.metrics)
+        self.auth_manager = get_auth_manager(self.client, executor=self.db_executor)
+        auth_service = self.auth_manager.auth_service
+        self.metrics.register("cache.users", auth_service.user_store.cache.metrics)
+        self.metrics.register("cache.google_certs", auth_service.token_verifier.metrics)
+        test_fetcher = (lambda _query: TEST_SEARCH_HTML) if settings.is_test else None
+        self.search_service = SearchService(
+            fetcher=test_fetcher,
+            cache=SearchCache(
+                store=SearchCacheStoreDuckDB(client=self.client),
+                executor=self.db_executor,
+            ),
+            single_flight=SingleFlight(
+                max_waiters=settings.search_single_flight_max_waiters,
+                timeout_seconds=settings.search_single_flight_timeout_seconds,
+            ),
+        )
+        self.metrics.register("cache.search", self.search_service.cache.metrics)
+        self.metrics.register(
+            "search.single_flight", self.search_service.single_flight.metrics
+        )
+        self.metrics.register("search.providers", self.search_service.provider_metrics)
+        self.render_engine = (
+            RenderEngine(initializer=preload_fonts)
+            if settings.render_workers > 0
+            else None
+        )
+        if self.render_engine is not None:
+            self.metrics.register("render.engine", self.render_engine.metrics)
+        infographic_service = InfographicService(
+            infographic_store=InfographicStoreDuckDB(client=self.client),
+            render_engine=self.render_engine,
+            session_store=SessionStoreDuckDB(client=self.client),
+        )
+        self.metrics.register("cache.renders", infographic_service.metrics)
+        self.job_runner = ResearchJobRunner(
+            research_service=ResearchService(
+                session_store=SessionStoreDuckDB(client=self.client),
+                source_store=SourceStoreDuckDB(client=self.client),
+                search_service=self.search_service,
+                infographic_service=infographic_service,
+                executor=self.research_executor,
+            ),
+            job_store=JobStoreDuckDB(client=self.client),
+            store_executor=self.db_executor,
+        )
+        self.reclaimer = InfographicFileReclaimer(
+            infographic_store=InfographicStoreDuckDB(client=self.client),
+            executor=self.reclaimer_executor,
+        )
+        self.metrics.register("reclaimer.infographics", self.reclaimer.metrics)
+
         health_router = HealthRouter()
         super().include_router(health_router, tags=["Health"])
+        if settings.metrics_endpoint_enabled:
+            metrics_router = MetricsRouter(metrics=self.metrics)
+            super().include_router(
+                metrics_router, tags=["Internal"], include_in_schema=False
+            )
 
-        auth_router = AuthRouter()
+        auth_router = AuthRouter(
+            client=self.client,
+            auth_manager=self.auth_manager,
+            executor=self.db_executor,
+            verify_executor=self.auth_executor,
+        )
         super().include_router(auth_router, tags=["Auth"])
 
-        session_router = SessionRouter()
+        session_router = SessionRouter(
+            job_runner=self.job_runner,
+            client=self.client,
+            auth_manager=self.auth_manager,
+            executor=self.db_executor,
+            reclaimer=self.reclaimer,
+        )
         super().include_router(session_router, tags=["Sessions"])
 
-        source_router = SourceRouter()
+        source_router = SourceRouter(
+            client=self.client,
+            auth_manager=self.auth_manager,
+            executor=self.db_executor,
+        )
         super().include_router(source_router, tags=["Sources"])
 
-        infographic_router = InfographicRouter()
+        infographic_router = InfographicRouter(
+            client=self.client,
+            auth_manager=self.auth_manager,
+            executor=self.db_executor,
+            render_engine=self.render_engine,
+            render_executor=self.render_executor,
+        )
         super().include_router(infographic_router, tags=["Infographics"])
+
+    async def startup(self) -> None:
+        """Start background workers owned by the API."""
+        await self.job_runner.start()
+        await self.reclaimer.start()
+
+    async def shutdown(self) -> None:
+        """Stop background workers and release shared resources."""
+        await self.reclaimer.stop()
+        await self.job_runner.stop()
+        for executor in (
+            self.render_executor,
+            self.reclaimer_executor,
+            self.research_executor,
+            self.auth_executor,
+            self.db_executor,
+        ):
+            executor.shutdown()
+        if self.render_engine is not None:
+            self.render_engine.shutdown()
+        await self.search_service.aclose()
+        self.client.close()
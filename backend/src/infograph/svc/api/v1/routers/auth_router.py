@@ -5,10 +5,15 @@ from dataclasses import dataclass
 from fastapi import Depends, HTTPException
 from pydantic import BaseModel
 
+from infograph.core.blocking_executor import AsyncFacade, BlockingExecutor
 from infograph.core.schemas.user import User
-from infograph.services.auth_service import AuthService, AuthServiceError
+from infograph.services.auth_service import (
+    AuthService,
+    AuthServiceError,
+    AuthUnavailableError,
+)
+from infograph.settings import settings
 from infograph.stores.duckdb.duckdb_client import DuckDBClient
-from infograph.stores.duckdb.user_store_duckdb import UserStoreDuckDB
 from infograph.svc.api_router_base import APIRouterBase
 from infograph.svc.auth import AuthManager, get_auth_manager
 
@@ -29,20 +34,34 @@ class AuthRouter(APIRouterBase):
     auth_service: AuthService
     auth_manager: AuthManager
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        client: DuckDBClient | None = None,
+        auth_manager: AuthManager | None = None,
+        executor: BlockingExecutor | None = None,
+        verify_executor: BlockingExecutor | None = None,
+    ) -> None:
         super().__init__()
-        user_store = UserStoreDuckDB(client=DuckDBClient(db_name="infograph"))
-        self.auth_service = AuthService(user_store=user_store)
-        self.auth_manager = get_auth_manager()
+        self.auth_manager = auth_manager or get_auth_manager(client)
+        self.auth_service = self.auth_manager.auth_service
+        users = AsyncFacade(self.auth_service, executor or self.auth_manager.executor)
+        verifier = AsyncFacade(
+            self.auth_service,
+            verify_executor or BlockingExecutor("auth", settings.auth_executor_workers),
+        )
 
         @self.post("/auth/google", response_model=AuthResponse)
         async def google_login(payload: GoogleTokenRequest) -> AuthResponse:
             """Exchange Google credential for JWT token."""
             try:
-                google_payload = self.auth_service.verify_google_token(payload.credential)
-                user = self.auth_service.get_or_create_user(google_payload)
+                google_payload = await verifier.verify_google_token(payload.credential)
+                user = await users.get_or_create_user(google_payload)
                 token = self.auth_service.issue_token(user)
                 return AuthResponse(user=user, token=token)
+            except AuthUnavailableError as exc:
+                raise HTTPException(
+                    status_code=503, detail=str(exc), headers={"Retry-After": "30"}
+                ) from exc
             except AuthServiceError as exc:
                 raise HTTPException(status_code=401, detail=str(exc)) from exc
 
@@ -2,13 +2,28 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Literal
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Query, Request, Response
 from fastapi.responses import FileResponse
 
+from infograph.core.blocking_executor import AsyncFacade, BlockingExecutor
+from infograph.core.http_cache import (
+    IMMUTABLE,
+    REVALIDATE,
+    cache_headers,
+    is_not_modified,
+    not_modified,
+    strong_etag,
+)
 from infograph.core.schemas.infographic import Infographic
 from infograph.core.schemas.user import User
-from infograph.services.infographic_service import InfographicService
+from infograph.services.infographic_service import (
+    IMAGE_FORMATS,
+    InfographicService,
+    InfographicServiceError,
+)
+from infograph.services.render_engine import RenderEngine
 from infograph.settings import settings
 from infograph.stores.duckdb.duckdb_client import DuckDBClient
 from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
@@ -26,52 +41,147 @@ class InfographicRouter(APIRouterBase):
     auth_manager: AuthManager
     infographic_service: InfographicService
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        client: DuckDBClient | None = None,
+        auth_manager: AuthManager | None = None,
+        executor: BlockingExecutor | None = None,
+        render_engine: RenderEngine | None = None,
+        render_executor: BlockingExecutor | None = None,
+    ) -> None:
         super().__init__()
-        client = DuckDBClient(db_name="infograph")
+        client = client or DuckDBClient(db_name="infograph")
         self.session_store = SessionStoreDuckDB(client=client)
         self.infographic_store = InfographicStoreDuckDB(client=client)
-        self.auth_manager = get_auth_manager()
+        self.auth_manager = auth_manager or get_auth_manager(client)
         self.infographic_service = InfographicService(
             infographic_store=self.infographic_store,
             output_dir=Path(settings.infographic_path),
+            render_engine=render_engine,
         )
+        executor = executor or self.auth_manager.executor
+        sessions = AsyncFacade(self.session_store, executor)
+        infographics = AsyncFacade(self.infographic_service, executor)
+        # Variant renders can take up to the render timeout; keep them off the
+        # executor that serves every DuckDB request.
+        renders = AsyncFacade(self.infographic_service, render_executor or executor)
 
-        @self.get("/sessions/{session_id}/infographic", response_model=Infographic)
-        async def get_infographic(
-            session_id: str,
-            calling_user: User = Depends(self.auth_manager.get_user_from_request),
-        ) -> Infographic:
-            """Get infographic metadata for a session."""
-            session = self.session_store.get_session(session_id)
+        async def owned_infographic(session_id: str, user: User) -> Infographic:
+            session = await sessions.get_session(session_id)
             if session is None:
                 raise HTTPException(status_code=404, detail="Session not found")
-            if session.user_id != calling_user.user_id:
+            if session.user_id != user.user_id:
                 raise HTTPException(status_code=403, detail="Not authorized")
-            infographic = self.infographic_service.get_infographic(session_id)
+            infographic = await infographics.get_infographic(session_id)
             if infographic is None:
                 raise HTTPException(status_code=404, detail="Infographic not found")
             return infographic
 
-        @self.get("/sessions/{session_id}/infographic/image")
-        async def get_infographic_image(
-            session_id: str,
-            calling_user: User = Depends(self.auth_manager.get_user_from_request),
+        async def image_response(
+            infographic: Infographic,
+            size: str,
+            image_format: str,
+            headers: dict[str, str],
         ) -> FileResponse:
-            """Return the infographic image file."""
-            session = self.session_store.get_session(session_id)
-            if session is None:
-                raise HTTPException(status_code=404, detail="Session not found")
-            if session.user_id != calling_user.user_id:
-                raise HTTPException(status_code=403, detail="Not authorized")
-            infographic = self.infographic_service.get_infographic(session_id)
-            if infographic is None:
-                raise HTTPException(status_code=404, detail="Infographic not found")
-            image_path = Path(infographic.image_path)
-            if not image_path.exists():
+            try:
+                image_path = await renders.image_variant(
+                    infographic.image_path, size, image_format
+                )
+            except InfographicServiceError as exc:
+                raise HTTPException(
+                    status_code=503,
+                    detail="Image is not available yet",
+                    headers={"Retry-After": "5"},
+                ) from exc
+            if image_path is None:
                 raise HTTPException(status_code=404, detail="Image not found")
             return FileResponse(
                 image_path,
-                media_type="image/png",
+                media_type=IMAGE_FORMATS[image_format],
                 filename=image_path.name,
+                headers=headers,
+            )
+
+        @self.get("/sessions/{session_id}/infographic", response_model=Infographic)
+        async def get_infographic(
+            session_id: str,
+            request: Request,
+            response: Response,
+            calling_user: User = Depends(self.auth_manager.get_user_from_request),
+        ) -> Infographic | Response:
+            """Get infographic metadata for a session.
+
+            Regenerating an infographic creates a new row, so its id is a
+            strong validator for the metadata.
+            """
+            infographic = await owned_infographic(session_id, calling_user)
+            headers = cache_headers(
+                strong_etag("infographic", infographic.infographic_id),
+                REVALIDATE,
+                infographic.created_at,
+            )
+            if is_not_modified(request, headers["ETag"], infographic.created_at):
+                return not_modified(headers)
+            response.headers.update(headers)
+            return infographic
+
+        @self.get("/sessions/{session_id}/infographic/image")
+        async def get_infographic_image(
+            session_id: str,
+            request: Request,
+            size: Literal["full", "thumb"] = Query("full"),
+            image_format: Literal["png", "webp"] = Query("png", alias="format"),
+            calling_user: User = Depends(self.auth_manager.get_user_from_request),
+        ) -> Response:
+            """Return the infographic image, optionally as a thumbnail or WebP.
+
+            Variants are generated on first request and cached on disk. The
+            image behind this URL changes when the infographic is
+            regenerated, so clients revalidate; for long-lived caching use
+            the content-addressed URL below with ``layout_data.content_key``.
+            """
+            infographic = await owned_infographic(session_id, calling_user)
+            headers = cache_headers(
+                _image_etag(infographic_content_key(infographic), size, image_format),
+                REVALIDATE,
+                infographic.created_at,
             )
+            if is_not_modified(request, headers["ETag"], infographic.created_at):
+                return not_modified(headers)
+            return await image_response(infographic, size, image_format, headers)
+
+        @self.get("/sessions/{session_id}/infographic/images/{content_key}")
+        async def get_infographic_image_by_key(
+            session_id: str,
+            content_key: str,
+            request: Request,
+            size: Literal["full", "thumb"] = Query("full"),
+            image_format: Literal["png", "webp"] = Query("png", alias="format"),
+            calling_user: User = Depends(self.auth_manager.get_user_from_request),
+        ) -> Response:
+            """Return an infographic image by content key, cacheable forever.
+
+            The bytes behind a content key never change, so a client that
+            already holds them gets a 304 without any database or file access.
+            Otherwise the key must belong to the session's current
+            infographic.
+            """
+            headers = cache_headers(
+                _image_etag(content_key, size, image_format), IMMUTABLE
+            )
+            if is_not_modified(request, headers["ETag"]):
+                return not_modified(headers)
+            infographic = await owned_infographic(session_id, calling_user)
+            if infographic_content_key(infographic) != content_key:
+                raise HTTPException(status_code=404, detail="Image not found")
+            return await image_response(infographic, size, image_format, headers)
+
+
+def infographic_content_key(infographic: Infographic) -> str:
+    """Content key of an infographic's image; older rows use the file name."""
+    key = infographic.layout_data.get("content_key")
+    return key or Path(infographic.image_path).stem
+
+
+def _image_etag(content_key: str, size: str, image_format: str) -> str:
+    return f'"{content_key}.{size}.{image_format}"'
@@ -0,0 +1,19 @@
+from infograph.core.metrics import MetricsRegistry
+from infograph.svc.api_router_base import APIRouterBase
+
+
+class MetricsRouter(APIRouterBase):
+    """Internal runtime metrics router.
+
+    Unauthenticated, so it is only mounted when ``metrics_endpoint_enabled``
+    is set, for deployments that keep it off the public network.
+    """
+
+    def __init__(self, *args, metrics: MetricsRegistry | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = metrics or MetricsRegistry()
+
+        @self.get("/metrics")
+        async def get_metrics() -> dict:
+            """Return runtime metrics for executors and caches."""
+            return self.metrics.snapshot()
@@ -1,23 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import json
 from dataclasses import dataclass
-from typing import Literal
+from typing import AsyncIterator, Literal
 
-from fastapi import Depends, HTTPException
+import duckdb
+from fastapi import Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from infograph.core.blocking_executor import AsyncFacade, BlockingExecutor
+from infograph.core.cursor import InvalidCursorError
+from infograph.core.event_bus import SessionEvent
+from infograph.core.fast_json import FastJSONResponse
+from infograph.core.ndjson import NDJSON_MEDIA_TYPE, ndjson_response, wants_ndjson
 from infograph.core.schemas.message import Message, MessageCreate
+from infograph.core.schemas.page import Page
 from infograph.core.schemas.research_session import (
     ResearchSession,
     ResearchSessionCreate,
-    ResearchSessionUpdate,
 )
+from infograph.core.schemas.session_detail import DETAIL_PARTS, SessionDetail
 from infograph.core.schemas.user import User
-from infograph.services.infographic_service import (
-    InfographicService,
-    InfographicServiceError,
-)
-from infograph.services.search_service import SearchService, SearchServiceError
+from infograph.services.infographic_file_reclaimer import InfographicFileReclaimer
+from infograph.services.research_job_runner import ResearchJobRunner
 from infograph.settings import settings
 from infograph.stores.duckdb.duckdb_client import DuckDBClient
 from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
@@ -28,20 +35,30 @@ from infograph.svc.api_router_base import APIRouterBase
 from infograph.svc.auth import AuthManager, get_auth_manager
 
 
-TEST_SEARCH_HTML = """
-<html>
-<body>
-  <div class="results">
-    <a class="result__a" href="https://example.com/alpha">Alpha Title</a>
-    <span class="result__snippet">Alpha snippet text.</span>
-  </div>
-  <div class="results">
-    <a class="result__a" href="/beta">Beta Title</a>
-    <span class="result__snippet">Beta snippet text.</span>
-  </div>
-</body>
-</html>
-"""
+TERMINAL_STATUSES = {"completed", "failed"}
+
+
+def _format_sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _parse_include(include: str | None) -> set[str]:
+    if include is None:
+        return set(DETAIL_PARTS)
+    parts = {part.strip() for part in include.split(",") if part.strip()}
+    unknown = parts.difference(DETAIL_PARTS)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown include value(s): {', '.join(sorted(unknown))}",
+        )
+    return parts
+
+
+def _is_terminal(event: SessionEvent) -> bool:
+    if event.event == "deleted":
+        return True
+    return event.event == "status" and event.data.get("status") in TERMINAL_STATUSES
 
 
 class MessagePayload(BaseModel):
@@ -58,83 +75,81 @@ class SessionRouter(APIRouterBase):
     source_store: SourceStoreDuckDB
     infographic_store: InfographicStoreDuckDB
     auth_manager: AuthManager
-    search_service: SearchService
-    infographic_service: InfographicService
+    job_runner: ResearchJobRunner
+    reclaimer: InfographicFileReclaimer | None
+    fast_json: bool
+    event_keepalive_seconds: float = 15.0
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        job_runner: ResearchJobRunner,
+        client: DuckDBClient | None = None,
+        auth_manager: AuthManager | None = None,
+        executor: BlockingExecutor | None = None,
+        reclaimer: InfographicFileReclaimer | None = None,
+        fast_json: bool | None = None,
+    ) -> None:
         super().__init__()
-        client = DuckDBClient(db_name="infograph")
+        client = client or DuckDBClient(db_name="infograph")
         self.session_store = SessionStoreDuckDB(client=client)
         self.message_store = MessageStoreDuckDB(client=client)
         self.source_store = SourceStoreDuckDB(client=client)
         self.infographic_store = InfographicStoreDuckDB(client=client)
-        self.auth_manager = get_auth_manager()
-        test_fetcher = (lambda _query: TEST_SEARCH_HTML) if settings.is_test else None
-        self.search_service = SearchService(fetcher=test_fetcher)
-        self.infographic_service = InfographicService(
-            infographic_store=self.infographic_store,
-        )
+        self.auth_manager = auth_manager or get_auth_manager(client)
+        self.job_runner = job_runner
+        self.reclaimer = reclaimer
+        self.fast_json = settings.fast_json_responses if fast_json is None else fast_json
+        executor = executor or self.auth_manager.executor
+        sessions = AsyncFacade(self.session_store, executor)
+        messages = AsyncFacade(self.message_store, executor)
+        jobs = AsyncFacade(self.job_runner, executor)
 
-        @self.post("/sessions", response_model=ResearchSession)
+        @self.post("/sessions", response_model=ResearchSession, status_code=202)
         async def create_session(
             payload: ResearchSessionCreate,
             calling_user: User = Depends(self.auth_manager.get_user_from_request),
         ) -> ResearchSession:
-            """Create a new research session."""
-            session = self.session_store.create_session(calling_user.user_id, payload)
-            self.session_store.update_session(
-                session.session_id,
-                ResearchSessionUpdate(status="searching"),
-            )
+            """Create a research session and queue its research job."""
+            return await executor.run(self._create_session, calling_user.user_id, payload)
+
+        @self.get(
+            "/sessions",
+            response_model=Page[ResearchSession],
+            response_class=FastJSONResponse,
+            responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+        )
+        async def list_sessions(
+            request: Request,
+            limit: int = Query(10, ge=1, le=100),
+            cursor: str | None = None,
+            calling_user: User = Depends(self.auth_manager.get_user_from_request),
+        ) -> Page[ResearchSession]:
+            """List research sessions for the authenticated user, newest first.
+
+            Pass the returned ``next_cursor`` back as ``cursor`` to fetch the
+            next page; it is null on the last page. With ``Accept:
+            application/x-ndjson`` every session after ``cursor`` is
+            streamed instead, one per line, and ``limit`` is ignored.
+            """
             try:
-                sources = self.search_service.search_sources(
-                    session.session_id,
-                    session.prompt,
-                )
-                for source in sources:
-                    self.source_store.create_source(source)
-                self.session_store.update_session(
-                    session.session_id,
-                    ResearchSessionUpdate(status="generating"),
-                )
-                stored_sources = self.source_store.list_sources(session.session_id)
-                session = self.session_store.get_session(session.session_id) or session
-                try:
-                    self.infographic_service.generate_infographic(
-                        session=session,
-                        sources=stored_sources,
+                if wants_ndjson(request):
+                    return ndjson_response(
+                        self.session_store.iter_session_records(
+                            calling_user.user_id, cursor, settings.ndjson_batch_size
+                        ),
+                        executor,
                     )
-                except InfographicServiceError as exc:
-                    self.session_store.update_session(
-                        session.session_id,
-                        ResearchSessionUpdate(status="failed"),
+                if self.fast_json:
+                    return FastJSONResponse(
+                        await sessions.list_session_records_page(
+                            calling_user.user_id, limit, cursor
+                        )
                     )
-                    raise HTTPException(
-                        status_code=500, detail="Infographic generation failed"
-                    ) from exc
-
-                updated = self.session_store.update_session(
-                    session.session_id,
-                    ResearchSessionUpdate(status="completed"),
-                )
-                return updated or session
-            except SearchServiceError as exc:
-                self.session_store.update_session(
-                    session.session_id,
-                    ResearchSessionUpdate(status="failed"),
+                return await sessions.list_sessions_page(
+                    calling_user.user_id, limit, cursor
                 )
-                raise HTTPException(
-                    status_code=502, detail="Search request failed"
-                ) from exc
-
-        @self.get("/sessions", response_model=list[ResearchSession])
-        async def list_sessions(
-            limit: int = 10,
-            offset: int = 0,
-            calling_user: User = Depends(self.auth_manager.get_user_from_request),
-        ) -> list[ResearchSession]:
-            """List research sessions for the authenticated user."""
-            return self.session_store.list_sessions(calling_user.user_id, limit, offset)
+            except InvalidCursorError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
 
         @self.get("/sessions/{session_id}", response_model=ResearchSession)
         async def get_session(
@@ -142,28 +157,117 @@ class SessionRouter(APIRouterBase):
             calling_user: User = Depends(self.auth_manager.get_user_from_request),
         ) -> ResearchSession:
             """Get a research session by ID."""
-            session = self.session_store.get_session(session_id)
+            session = await sessions.get_session(session_id)
             if session is None:
                 raise HTTPException(status_code=404, detail="Session not found")
             if session.user_id != calling_user.user_id:
                 raise HTTPException(status_code=403, detail="Not authorized")
             return session
 
+        @self.get("/sessions/{session_id}/detail", response_model=SessionDetail)
+        async def get_session_detail(
+            session_id: str,
+            include: str | None = Query(
+                None,
+                description="Comma-separated parts to include: "
+                + ", ".join(DETAIL_PARTS)
+                + ". Defaults to all.",
+            ),
+            messages_limit: int = Query(50, ge=1, le=200),
+            calling_user: User = Depends(self.auth_manager.get_user_from_request),
+        ) -> SessionDetail:
+            """Get a session with its sources, messages and infographic.
+
+            Authorizes once and reads every part in one executor call and
+            one transaction, so the parts are consistent with each other.
+            ``messages`` is the first page; continue with the messages
+            endpoint and its ``next_cursor``.
+            """
+            return await executor.run(
+                self._load_detail,
+                session_id,
+                calling_user.user_id,
+                _parse_include(include),
+                messages_limit,
+            )
+
+        @self.get("/sessions/{session_id}/events")
+        async def stream_session_events(
+            session_id: str,
+            calling_user: User = Depends(self.auth_manager.get_user_from_request),
+        ) -> StreamingResponse:
+            """Stream status, source and infographic events as Server-Sent Events.
+
+            The stream starts with the current status and ends after the
+            session reaches a terminal status or is deleted; deletion is
+            announced with a ``deleted`` event.
+            """
+            session = await sessions.get_session(session_id)
+            if session is None:
+                raise HTTPException(status_code=404, detail="Session not found")
+            if session.user_id != calling_user.user_id:
+                raise HTTPException(status_code=403, detail="Not authorized")
+            # Subscribe before taking the snapshot so no transition is missed.
+            subscription = self.session_store.event_bus.subscribe(session_id)
+            snapshot = await sessions.get_session(session_id) or session
+
+            async def event_stream() -> AsyncIterator[str]:
+                try:
+                    yield _format_sse("status", snapshot.model_dump())
+                    if snapshot.status in TERMINAL_STATUSES:
+                        return
+                    while True:
+                        try:
+                            event = await subscription.get(
+                                timeout=self.event_keepalive_seconds
+                            )
+                        except asyncio.TimeoutError:
+                            # Backstop for a deletion whose event was missed.
+                            if await sessions.get_session(session_id) is None:
+                                yield _format_sse("deleted", {"session_id": session_id})
+                                return
+                            yield ": keep-alive\n\n"
+                            continue
+                        if event is None:
+                            return
+                        yield _format_sse(event.event, event.data)
+                        if _is_terminal(event):
+                            return
+                finally:
+                    subscription.close()
+
+            return StreamingResponse(
+                event_stream(),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+
         @self.delete("/sessions/{session_id}")
         async def delete_session(
             session_id: str,
             calling_user: User = Depends(self.auth_manager.get_user_from_request),
         ) -> dict:
-            """Delete a research session."""
-            session = self.session_store.get_session(session_id)
+            """Delete a research session and everything attached to it.
+
+            Image files are removed in the background once the rows are gone.
+            A delete that races the session's job writing its results is
+            refused with 409 and can simply be retried.
+            """
+            session = await sessions.get_session(session_id)
             if session is None:
                 raise HTTPException(status_code=404, detail="Session not found")
             if session.user_id != calling_user.user_id:
                 raise HTTPException(status_code=403, detail="Not authorized")
-            self.message_store.delete_messages_for_session(session_id)
-            self.source_store.delete_sources_for_session(session_id)
-            self.infographic_store.delete_infographic(session_id)
-            self.session_store.delete_session(session_id)
+            try:
+                image_paths = await sessions.delete_session_cascade(session_id)
+            except duckdb.TransactionException as exc:
+                raise HTTPException(
+                    status_code=409,
+                    detail="Session is being updated; retry the delete",
+                    headers={"Retry-After": "1"},
+                ) from exc
+            if self.reclaimer is not None:
+                self.reclaimer.schedule(image_paths)
             return {"success": True}
 
         @self.post("/sessions/{session_id}/messages", response_model=Message)
@@ -173,7 +277,7 @@ class SessionRouter(APIRouterBase):
             calling_user: User = Depends(self.auth_manager.get_user_from_request),
         ) -> Message:
             """Create a message in a session."""
-            session = self.session_store.get_session(session_id)
+            session = await sessions.get_session(session_id)
             if session is None:
                 raise HTTPException(status_code=404, detail="Session not found")
             if session.user_id != calling_user.user_id:
@@ -183,17 +287,74 @@ class SessionRouter(APIRouterBase):
                 role=payload.role,
                 content=payload.content,
             )
-            return self.message_store.create_message(message_create)
+            return await messages.create_message(message_create)
 
-        @self.get("/sessions/{session_id}/messages", response_model=list[Message])
+        @self.get(
+            "/sessions/{session_id}/messages",
+            response_model=Page[Message],
+            response_class=FastJSONResponse,
+            responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+        )
         async def list_messages(
             session_id: str,
+            request: Request,
+            limit: int = Query(50, ge=1, le=200),
+            cursor: str | None = None,
             calling_user: User = Depends(self.auth_manager.get_user_from_request),
-        ) -> list[Message]:
-            """List messages for a session."""
-            session = self.session_store.get_session(session_id)
+        ) -> Page[Message]:
+            """List messages for a session, oldest first, one page at a time.
+
+            With ``Accept: application/x-ndjson`` every message after
+            ``cursor`` is streamed instead, one per line.
+            """
+            session = await sessions.get_session(session_id)
             if session is None:
                 raise HTTPException(status_code=404, detail="Session not found")
             if session.user_id != calling_user.user_id:
                 raise HTTPException(status_code=403, detail="Not authorized")
-            return self.message_store.list_messages(session_id)
+            try:
+                if wants_ndjson(request):
+                    return ndjson_response(
+                        self.message_store.iter_message_records(
+                            session_id, cursor, settings.ndjson_batch_size
+                        ),
+                        executor,
+                    )
+                if self.fast_json:
+                    return FastJSONResponse(
+                        await messages.list_message_records_page(
+                            session_id, limit, cursor
+                        )
+                    )
+                return await messages.list_messages_page(session_id, limit, cursor)
+            except InvalidCursorError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    def _create_session(
+        self, user_id: str, payload: ResearchSessionCreate
+    ) -> ResearchSession:
+        # One transaction, so a crash cannot leave a session without its job.
+        with self.session_store.client.transaction():
+            session = self.session_store.create_session(user_id, payload)
+            self.job_runner.submit(session.session_id)
+        return session
+
+    def _load_detail(
+        self, session_id: str, user_id: str, include: set[str], messages_limit: int
+    ) -> SessionDetail:
+        with self.session_store.client.transaction():
+            session = self.session_store.get_session(session_id)
+            if session is None:
+                raise HTTPException(status_code=404, detail="Session not found")
+            if session.user_id != user_id:
+                raise HTTPException(status_code=403, detail="Not authorized")
+            detail = SessionDetail(session=session)
+            if "sources" in include:
+                detail.sources = self.source_store.list_sources(session_id)
+            if "messages" in include:
+                detail.messages = self.message_store.list_messages_page(
+                    session_id, messages_limit
+                )
+            if "infographic" in include:
+                detail.infographic = self.infographic_store.get_infographic(session_id)
+        return detail
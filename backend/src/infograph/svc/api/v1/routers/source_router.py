@@ -2,10 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 
+from infograph.core.blocking_executor import AsyncFacade, BlockingExecutor
+from infograph.core.fast_json import FastJSONResponse
+from infograph.core.ndjson import NDJSON_MEDIA_TYPE, ndjson_response, wants_ndjson
 from infograph.core.schemas.source import Source
 from infograph.core.schemas.user import User
+from infograph.settings import settings
 from infograph.stores.duckdb.duckdb_client import DuckDBClient
 from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
 from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
@@ -20,23 +24,53 @@ class SourceRouter(APIRouterBase):
     session_store: SessionStoreDuckDB
     source_store: SourceStoreDuckDB
     auth_manager: AuthManager
+    fast_json: bool
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        client: DuckDBClient | None = None,
+        auth_manager: AuthManager | None = None,
+        executor: BlockingExecutor | None = None,
+        fast_json: bool | None = None,
+    ) -> None:
         super().__init__()
-        client = DuckDBClient(db_name="infograph")
+        client = client or DuckDBClient(db_name="infograph")
         self.session_store = SessionStoreDuckDB(client=client)
         self.source_store = SourceStoreDuckDB(client=client)
-        self.auth_manager = get_auth_manager()
+        self.auth_manager = auth_manager or get_auth_manager(client)
+        self.fast_json = settings.fast_json_responses if fast_json is None else fast_json
+        executor = executor or self.auth_manager.executor
+        sessions = AsyncFacade(self.session_store, executor)
+        sources = AsyncFacade(self.source_store, executor)
 
-        @self.get("/sessions/{session_id}/sources", response_model=list[Source])
+        @self.get(
+            "/sessions/{session_id}/sources",
+            response_model=list[Source],
+            response_class=FastJSONResponse,
+            responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+        )
         async def list_sources(
             session_id: str,
+            request: Request,
             calling_user: User = Depends(self.auth_manager.get_user_from_request),
         ) -> list[Source]:
-            """List sources for a research session."""
-            session = self.session_store.get_session(session_id)
+            """List sources for a research session.
+
+            With ``Accept: application/x-ndjson`` the sources are streamed
+            one per line.
+            """
+            session = await sessions.get_session(session_id)
             if session is None:
                 raise HTTPException(status_code=404, detail="Session not found")
             if session.user_id != calling_user.user_id:
                 raise HTTPException(status_code=403, detail="Not authorized")
-            return self.source_store.list_sources(session_id)
+            if wants_ndjson(request):
+                return ndjson_response(
+                    self.source_store.iter_source_records(
+                        session_id, settings.ndjson_batch_size
+                    ),
+                    executor,
+                )
+            if self.fast_json:
+                return FastJSONResponse(await sources.list_source_records(session_id))
+            return await sources.list_sources(session_id)
@@ -1,3 +1,6 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -6,12 +9,23 @@ from infograph.svc.api.v1.api import ServiceAPIRouter
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
+    api_router = ServiceAPIRouter()
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        await api_router.startup()
+        try:
+            yield
+        finally:
+            await api_router.shutdown()
+
     app = FastAPI(
         title="Infograph API",
         description="Research Infograph Assistant API",
         version="1.0.0",
         docs_url="/api/docs",
         redoc_url="/api/redoc",
+        lifespan=lifespan,
     )
 
     app.add_middleware(
@@ -22,15 +36,11 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    api_router = ServiceAPIRouter()
     app.include_router(api_router, prefix="/api/v1")
 
     return app
 
 
-app = create_app()
-
-
 class APIService:
     """Wrapper for running the API service."""
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 from fastapi import Depends, HTTPException
@@ -8,8 +8,10 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 _bearer_scheme = HTTPBearer(auto_error=False)
 
+from infograph.core.blocking_executor import AsyncFacade, BlockingExecutor
 from infograph.core.schemas.user import User
 from infograph.services.auth_service import AuthService, AuthServiceError
+from infograph.settings import settings
 from infograph.stores.duckdb.duckdb_client import DuckDBClient
 from infograph.stores.duckdb.user_store_duckdb import UserStoreDuckDB
 
@@ -19,8 +21,14 @@ class AuthManager:
     """Authentication dependency provider."""
 
     auth_service: AuthService
+    executor: BlockingExecutor = field(
+        default_factory=lambda: BlockingExecutor("db", settings.duckdb_max_concurrency)
+    )
 
-    def get_user_from_request(
+    def __post_init__(self) -> None:
+        self.users = AsyncFacade(self.auth_service.user_store, self.executor)
+
+    async def get_user_from_request(
         self,
         credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer_scheme),
     ) -> User:
@@ -33,13 +41,18 @@ class AuthManager:
         user_id = payload.get("sub")
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token")
-        user = self.auth_service.user_store.get_user_by_id(user_id)
+        user = await self.users.get_user_by_id(user_id)
         if user is None:
             raise HTTPException(status_code=401, detail="User not found")
         return user
 
 
-def get_auth_manager() -> AuthManager:
-    user_store = UserStoreDuckDB(client=DuckDBClient(db_name="infograph"))
+def get_auth_manager(
+    client: DuckDBClient | None = None,
+    executor: BlockingExecutor | None = None,
+) -> AuthManager:
+    user_store = UserStoreDuckDB(client=client or DuckDBClient(db_name="infograph"))
     auth_service = AuthService(user_store=user_store)
-    return AuthManager(auth_service=auth_service)
+    if executor is None:
+        return AuthManager(auth_service=auth_service)
+    return AuthManager(auth_service=auth_service, executor=executor)
@@ -1,11 +1,36 @@
 import os
+import time
 
 import pytest
+from fastapi.testclient import TestClient
 
 from infograph.settings import settings
 from infograph.stores.duckdb.duckdb_client import DuckDBClient
 
 
+class FakeClock:
+    """Manually advanced stand-in for ``time.time`` or ``time.monotonic``."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def wait_for_session(
+    client: TestClient, session_id: str, headers: dict[str, str]
+) -> dict:
+    """Poll a session until its research job finishes or 10 seconds pass."""
+    deadline = time.monotonic() + 10
+    while True:
+        response = client.get(f"/api/v1/sessions/{session_id}", headers=headers)
+        session = response.json()
+        if session["status"] in {"completed", "failed"} or time.monotonic() > deadline:
+            return session
+        time.sleep(0.05)
+
+
 @pytest.fixture(autouse=True)
 def use_test_settings(tmp_path):
     settings.is_test = True
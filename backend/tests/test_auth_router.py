@@ -1,7 +1,13 @@
+import jwt
 from fastapi.testclient import TestClient
 
 from infograph.svc.api_service import create_app
 from infograph.services.auth_service import AuthService
+from infograph.services.google_token_verifier import (
+    CertificateFetchError,
+    GoogleTokenVerifier,
+)
+from infograph.settings import settings
 from infograph.stores.duckdb.duckdb_client import DuckDBClient
 from infograph.stores.duckdb.user_store_duckdb import UserStoreDuckDB
 
@@ -24,3 +30,19 @@ def test_issue_and_decode_token_round_trip() -> None:
 
     assert decoded["sub"] == user.user_id
     assert user.email == "user@example.com"
+
+
+def test_google_login_is_503_when_certificates_are_unavailable(monkeypatch) -> None:
+    def unavailable(self):
+        raise CertificateFetchError("Could not fetch certificates: HTTP 503")
+
+    monkeypatch.setattr(settings, "google_client_id", "client-id")
+    monkeypatch.setattr(GoogleTokenVerifier, "certs", unavailable)
+    credential = jwt.encode({"sub": "google-123"}, "secret", headers={"kid": "k1"})
+
+    response = TestClient(create_app()).post(
+        "/api/v1/auth/google", json={"credential": credential}
+    )
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "30"
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from fastapi.testclient import TestClient
+
+from infograph.core.blocking_executor import AsyncFacade, BlockingExecutor
+from infograph.settings import settings
+from infograph.svc.api_service import create_app
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.thread_names: list[str] = []
+
+    def record(self, value: int) -> int:
+        self.thread_names.append(threading.current_thread().name)
+        return value * 2
+
+
+def test_async_facade_runs_calls_on_executor_and_tracks_queue() -> None:
+    executor = BlockingExecutor("test", max_workers=1)
+    counter = Counter()
+    facade = AsyncFacade(counter, executor)
+
+    async def run() -> list[int]:
+        return await asyncio.gather(*(facade.record(value) for value in range(4)))
+
+    assert asyncio.run(run()) == [0, 2, 4, 6]
+    assert all(name.startswith("test-executor") for name in counter.thread_names)
+    metrics = executor.metrics()
+    assert metrics["completed"] == 4
+    assert metrics["queue_depth"] == 0
+    assert metrics["max_queue_depth"] >= 2
+    executor.shutdown()
+
+
+def test_metrics_endpoint_reports_executors(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "metrics_endpoint_enabled", True)
+    with TestClient(create_app()) as client:
+        client.get("/api/v1/auth/me", headers={"Authorization": "Bearer bad"})
+        response = client.get("/api/v1/metrics")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert {"executor.db", "executor.auth", "executor.research"} <= set(payload)
+    assert "avg_wait_ms" in payload["executor.db"]
@@ -0,0 +1,31 @@
+from infograph.core.cache import TTLCache
+from tests.conftest import FakeClock
+
+
+def test_ttl_cache_expires_and_evicts_least_recently_used() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_entries=2, ttl_seconds=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    clock.now += 11
+    assert cache.get("a") is None
+
+    metrics = cache.metrics()
+    assert metrics["hits"] == 2
+    assert metrics["misses"] == 2
+    assert metrics["evictions"] == 1
+    assert metrics["expirations"] == 1
+
+
+def test_ttl_cache_skips_set_after_concurrent_invalidation() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_entries=10, ttl_seconds=10)
+    generation = cache.generation()
+    cache.invalidate("a")
+    cache.set("a", 1, generation)
+
+    assert cache.get("a") is None
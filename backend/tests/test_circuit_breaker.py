@@ -0,0 +1,63 @@
+from infograph.core.circuit_breaker import CircuitBreaker
+from tests.conftest import FakeClock
+
+
+def _breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(
+        name="test",
+        failure_rate_threshold=0.5,
+        minimum_calls=4,
+        window_size=10,
+        open_seconds=30,
+        clock=clock,
+    )
+
+
+def test_breaker_opens_once_failure_rate_crosses_threshold() -> None:
+    breaker = _breaker(FakeClock())
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    assert breaker.metrics()["rejected"] == 1
+    assert breaker.metrics()["times_opened"] == 1
+
+
+def test_half_open_trial_closes_or_reopens_the_circuit() -> None:
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(4):
+        breaker.record_failure()
+
+    clock.now += 31
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now += 31
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.metrics()["failure_rate"] == 0.0
+
+
+def test_cancelled_trial_releases_its_slot() -> None:
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(4):
+        breaker.record_failure()
+    clock.now += 31
+
+    assert breaker.allow()
+    breaker.record_cancelled()
+
+    assert breaker.allow()
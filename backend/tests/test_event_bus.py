@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from infograph.core.event_bus import EventBus, SessionEvent
+
+
+def test_publish_from_thread_fans_out_to_subscribers() -> None:
+    bus = EventBus()
+
+    async def run() -> list[SessionEvent | None]:
+        first = bus.subscribe("session-1")
+        second = bus.subscribe("session-1")
+        other = bus.subscribe("session-2")
+        event = SessionEvent(
+            session_id="session-1", event="status", data={"status": "searching"}
+        )
+        thread = threading.Thread(target=bus.publish, args=(event,))
+        thread.start()
+        thread.join()
+        received = [await first.get(timeout=1), await second.get(timeout=1)]
+        assert other._queue.empty()
+        for subscription in (first, second, other):
+            subscription.close()
+        return received
+
+    received = asyncio.run(run())
+
+    assert [event.data["status"] for event in received] == ["searching", "searching"]
+    assert bus.subscriber_count("session-1") == 0
+
+
+def test_slow_subscriber_is_marked_overflowed() -> None:
+    bus = EventBus(max_queue=2)
+
+    async def run() -> SessionEvent | None:
+        subscription = bus.subscribe("session-1")
+        for index in range(3):
+            bus.publish(
+                SessionEvent(session_id="session-1", event="source", data={"index": index})
+            )
+        await asyncio.sleep(0)
+        return await subscription.get(timeout=1)
+
+    assert asyncio.run(run()) is None
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from infograph.core import fast_json
+from infograph.core.schemas.message import MessageCreate
+from infograph.core.schemas.research_session import ResearchSessionCreate
+from infograph.core.schemas.source import SourceCreate
+from infograph.services.auth_service import AuthService
+from infograph.settings import settings
+from infograph.stores.duckdb.duckdb_client import DuckDBClient
+from infograph.stores.duckdb.message_store_duckdb import MessageStoreDuckDB
+from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
+from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
+from infograph.stores.duckdb.user_store_duckdb import UserStoreDuckDB
+from infograph.svc.api_service import create_app
+
+SAMPLES = [
+    {"items": [], "next_cursor": None},
+    {"title": 'Ünïcødé — 日本語 "quoted" \\ / \n\t', "emoji": "🌍"},
+    {"confidence": 0.1, "third": 1 / 3, "negative": -2.5, "whole": 3.0},
+    {"ints": [0, -1, 2**53, 1_700_000_000], "flags": [True, False, None]},
+    [{"nested": {"deeper": [1, [2, [3]]]}}],
+]
+
+
+@pytest.mark.parametrize("encoder", ["orjson", "stdlib"])
+@pytest.mark.parametrize("value", SAMPLES)
+def test_dumps_matches_standard_json(monkeypatch, encoder, value) -> None:
+    if encoder == "stdlib":
+        monkeypatch.setattr(fast_json, "orjson", None)
+    elif fast_json.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    encoded = fast_json.dumps(value)
+
+    assert encoded == json.dumps(
+        value, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+@pytest.mark.parametrize("encoder", ["orjson", "stdlib"])
+def test_dumps_round_trips_exponent_floats(monkeypatch, encoder) -> None:
+    # orjson writes 1e300 where the standard library writes 1e+300.
+    if encoder == "stdlib":
+        monkeypatch.setattr(fast_json, "orjson", None)
+    elif fast_json.orjson is None:
+        pytest.skip("orjson is not installed")
+    value = {"big": 1e300, "small": 5e-324, "tiny": -1.5e-10}
+
+    assert json.loads(fast_json.dumps(value)) == value
+
+
+def _seed(client: DuckDBClient, user_id: str, session_id: str) -> None:
+    sessions = SessionStoreDuckDB(client=client)
+    messages = MessageStoreDuckDB(client=client)
+    for index in range(5):
+        sessions.create_session(user_id, ResearchSessionCreate(prompt=f"Prompt {index}"))
+        messages.create_message(
+            MessageCreate(session_id=session_id, role="user", content=f"Hi {index} ✓")
+        )
+    SourceStoreDuckDB(client=client).create_sources_bulk(
+        [
+            SourceCreate(
+                session_id=session_id,
+                title=f"Title {index}",
+                url=f"https://example.com/{index}",
+                snippet="Snippet",
+                confidence=index / 7,
+            )
+            for index in range(3)
+        ]
+    )
+
+
+def _walk(list_page, limit: int) -> list[dict]:
+    pages = []
+    cursor = None
+    while True:
+        page = list_page(limit, cursor)
+        if not isinstance(page, dict):
+            page = page.model_dump()
+        pages.append(page)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_store_records_match_models(duckdb_client) -> None:
+    _seed(duckdb_client, "user-1", "session-1")
+    sessions = SessionStoreDuckDB(client=duckdb_client)
+    messages = MessageStoreDuckDB(client=duckdb_client)
+    sources = SourceStoreDuckDB(client=duckdb_client)
+
+    assert sources.list_source_records("session-1") == [
+        source.model_dump() for source in sources.list_sources("session-1")
+    ]
+    session_pages = _walk(
+        lambda limit, cursor: sessions.list_session_records_page("user-1", limit, cursor),
+        2,
+    )
+    assert len(session_pages) == 3
+    assert session_pages == _walk(
+        lambda limit, cursor: sessions.list_sessions_page("user-1", limit, cursor), 2
+    )
+    message_pages = _walk(
+        lambda limit, cursor: messages.list_message_records_page(
+            "session-1", limit, cursor
+        ),
+        2,
+    )
+    assert len(message_pages) == 3
+    assert message_pages == _walk(
+        lambda limit, cursor: messages.list_messages_page("session-1", limit, cursor), 2
+    )
+
+
+def _get_all(client: TestClient, session_id: str, headers: dict[str, str]) -> list:
+    responses = [
+        client.get("/api/v1/sessions", params={"limit": 2}, headers=headers),
+        client.get(
+            f"/api/v1/sessions/{session_id}/messages",
+            params={"limit": 2},
+            headers=headers,
+        ),
+        client.get(f"/api/v1/sessions/{session_id}/sources", headers=headers),
+    ]
+    for response in responses:
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+    return [response.json() for response in responses]
+
+
+def test_fast_routes_match_model_routes(monkeypatch) -> None:
+    user_store = UserStoreDuckDB(client=DuckDBClient(db_name="infograph"))
+    auth_service = AuthService(user_store=user_store)
+    user = auth_service.get_or_create_user(
+        {"sub": "google-123", "email": "test@example.com", "name": "Tester"}
+    )
+    headers = {"Authorization": f"Bearer {auth_service.issue_token(user)}"}
+    session = SessionStoreDuckDB(client=DuckDBClient(db_name="infograph")).create_session(
+        user.user_id, ResearchSessionCreate(prompt="Owned")
+    )
+    _seed(DuckDBClient(db_name="infograph"), user.user_id, session.session_id)
+
+    monkeypatch.setattr(settings, "fast_json_responses", True)
+    fast = _get_all(TestClient(create_app()), session.session_id, headers)
+    monkeypatch.setattr(settings, "fast_json_responses", False)
+    validated = _get_all(TestClient(create_app()), session.session_id, headers)
+
+    assert fast == validated
+    assert fast[0]["next_cursor"] is not None
+    assert len(fast[2]) == 3
@@ -0,0 +1,187 @@
+import time
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from google.auth import crypt
+from google.auth import jwt as google_jwt
+
+from infograph.services.google_token_verifier import (
+    CertificateFetchError,
+    GoogleTokenVerifier,
+    HttpCertSource,
+    parse_max_age,
+)
+from tests.conftest import FakeClock
+
+AUDIENCE = "client-id.apps.googleusercontent.com"
+
+
+def _key_pair() -> tuple[str, str]:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+    return private_pem, public_pem
+
+
+def _token(private_pem: str, key_id: str, **claims) -> str:
+    now = int(time.time())
+    payload = {
+        "iss": "https://accounts.google.com",
+        "aud": AUDIENCE,
+        "sub": "google-123",
+        "email": "user@example.com",
+        "iat": now,
+        "exp": now + 300,
+        **claims,
+    }
+    signer = crypt.RSASigner.from_string(private_pem, key_id=key_id)
+    return google_jwt.encode(signer, payload).decode()
+
+
+class LocalCertSource:
+    def __init__(self, certs: dict[str, str], max_age: float | None = 3600) -> None:
+        self.certs = certs
+        self.max_age = max_age
+        self.fetches = 0
+
+    def fetch(self):
+        self.fetches += 1
+        return dict(self.certs), self.max_age
+
+
+class FailingCertSource(LocalCertSource):
+    def __init__(self, certs: dict[str, str], max_age: float | None = 3600) -> None:
+        super().__init__(certs, max_age)
+        self.failing = False
+
+    def fetch(self):
+        if self.failing:
+            self.fetches += 1
+            raise CertificateFetchError("Could not fetch certificates: HTTP 503")
+        return super().fetch()
+
+
+def test_parse_max_age() -> None:
+    assert parse_max_age("public, max-age=19271, must-revalidate") == 19271
+    assert parse_max_age("no-cache") is None
+    assert parse_max_age(None) is None
+
+
+def test_verify_caches_certificates_until_max_age() -> None:
+    private_pem, public_pem = _key_pair()
+    source = LocalCertSource({"k1": public_pem}, max_age=600)
+    clock = FakeClock()
+    verifier = GoogleTokenVerifier(
+        cert_source=source, clock=clock, refresh_margin_seconds=0
+    )
+    token = _token(private_pem, "k1")
+
+    assert verifier.verify(token, AUDIENCE)["sub"] == "google-123"
+    assert verifier.verify(token, AUDIENCE)["email"] == "user@example.com"
+    assert source.fetches == 1
+
+    clock.now += 601
+    verifier.verify(token, AUDIENCE)
+    assert source.fetches == 2
+
+
+def test_verify_rejects_wrong_audience_and_issuer() -> None:
+    private_pem, public_pem = _key_pair()
+    verifier = GoogleTokenVerifier(cert_source=LocalCertSource({"k1": public_pem}))
+
+    with pytest.raises(ValueError):
+        verifier.verify(_token(private_pem, "k1"), "other-client")
+    with pytest.raises(ValueError):
+        verifier.verify(_token(private_pem, "k1", iss="https://evil.example"), AUDIENCE)
+
+
+def test_unknown_key_id_forces_refresh_for_rotated_keys() -> None:
+    old_private, old_public = _key_pair()
+    new_private, new_public = _key_pair()
+    source = LocalCertSource({"old": old_public})
+    verifier = GoogleTokenVerifier(cert_source=source, min_refresh_interval_seconds=0)
+    verifier.verify(_token(old_private, "old"), AUDIENCE)
+
+    source.certs = {"old": old_public, "new": new_public}
+
+    assert verifier.verify(_token(new_private, "new"), AUDIENCE)["sub"] == "google-123"
+    assert source.fetches == 2
+
+
+def test_certificates_near_expiry_refresh_in_background() -> None:
+    private_pem, public_pem = _key_pair()
+    source = LocalCertSource({"k1": public_pem}, max_age=100)
+    clock = FakeClock()
+    verifier = GoogleTokenVerifier(
+        cert_source=source, clock=clock, refresh_margin_seconds=50
+    )
+    token = _token(private_pem, "k1")
+    verifier.verify(token, AUDIENCE)
+
+    clock.now += 60
+    verifier.verify(token, AUDIENCE)
+    deadline = time.monotonic() + 5
+    while source.fetches < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert source.fetches == 2
+    assert verifier.metrics()["expires_in_seconds"] == 100
+
+
+def test_http_cert_source_failures_are_not_token_errors() -> None:
+    class Response:
+        status = 503
+        data = b"unavailable"
+        headers: dict[str, str] = {}
+
+    source = HttpCertSource()
+    source._request = lambda *args, **kwargs: Response()
+
+    with pytest.raises(CertificateFetchError) as caught:
+        source.fetch()
+    assert not isinstance(caught.value, ValueError)
+
+
+def test_failed_refresh_keeps_serving_the_last_good_certificates() -> None:
+    private_pem, public_pem = _key_pair()
+    source = FailingCertSource({"k1": public_pem}, max_age=100)
+    clock = FakeClock()
+    verifier = GoogleTokenVerifier(
+        cert_source=source,
+        clock=clock,
+        refresh_margin_seconds=0,
+        min_refresh_interval_seconds=30,
+    )
+    token = _token(private_pem, "k1")
+    verifier.verify(token, AUDIENCE)
+
+    source.failing = True
+    clock.now += 101
+    assert verifier.verify(token, AUDIENCE)["sub"] == "google-123"
+    # The failed fetch is not retried on every request.
+    assert verifier.verify(token, AUDIENCE)["sub"] == "google-123"
+    assert source.fetches == 2
+    assert verifier.metrics()["failures"] == 1
+
+    clock.now += 31
+    source.failing = False
+    verifier.verify(token, AUDIENCE)
+    assert source.fetches == 3
+
+
+def test_cold_cache_fetch_failure_raises_certificate_fetch_error() -> None:
+    private_pem, public_pem = _key_pair()
+    source = FailingCertSource({"k1": public_pem})
+    source.failing = True
+    verifier = GoogleTokenVerifier(cert_source=source)
+
+    with pytest.raises(CertificateFetchError):
+        verifier.verify(_token(private_pem, "k1"), AUDIENCE)
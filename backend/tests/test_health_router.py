@@ -9,3 +9,10 @@ def test_health_check() -> None:
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_metrics_endpoint_is_not_mounted_by_default() -> None:
+    client = TestClient(create_app())
+    response = client.get("/api/v1/metrics")
+
+    assert response.status_code == 404
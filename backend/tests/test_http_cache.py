@@ -0,0 +1,35 @@
+from starlette.requests import Request
+
+from infograph.core.http_cache import etag_matches, http_date, is_not_modified
+
+
+def _request(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [
+                (key.replace("_", "-").lower().encode(), value.encode())
+                for key, value in headers.items()
+            ],
+        }
+    )
+
+
+def test_etag_matches_lists_weak_tags_and_wildcard() -> None:
+    assert etag_matches('"a", "b"', '"b"')
+    assert etag_matches('W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since() -> None:
+    stamp = 1_700_000_000
+    assert is_not_modified(_request(If_Modified_Since=http_date(stamp)), '"x"', stamp)
+    assert not is_not_modified(
+        _request(If_Modified_Since=http_date(stamp - 10)), '"x"', stamp
+    )
+    assert not is_not_modified(
+        _request(If_None_Match='"y"', If_Modified_Since=http_date(stamp)), '"x"', stamp
+    )
+    assert not is_not_modified(_request(If_Modified_Since="garbage"), '"x"', stamp)
+    assert not is_not_modified(_request(), '"x"', stamp)
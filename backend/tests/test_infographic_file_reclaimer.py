@@ -0,0 +1,67 @@
+import asyncio
+import os
+import time
+from pathlib import Path
+
+from infograph.core.schemas.infographic import InfographicCreate
+from infograph.services.infographic_file_reclaimer import InfographicFileReclaimer
+from infograph.settings import settings
+from infograph.stores.duckdb.duckdb_client import DuckDBClient
+from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
+
+
+def _write(path: Path, age_seconds: float = 0) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"png")
+    if age_seconds:
+        stamp = time.time() - age_seconds
+        os.utime(path, (stamp, stamp))
+    return path
+
+
+def _reclaimer(**kwargs) -> InfographicFileReclaimer:
+    store = InfographicStoreDuckDB(client=DuckDBClient(db_name="infograph"))
+    return InfographicFileReclaimer(infographic_store=store, **kwargs)
+
+
+def test_sweep_deletes_only_old_unreferenced_files() -> None:
+    reclaimer = _reclaimer(grace_seconds=60, batch_size=2)
+    output_dir = Path(settings.infographic_path)
+    kept = _write(output_dir / "kept.png", age_seconds=120)
+    reclaimer.infographic_store.create_infographic(
+        InfographicCreate(
+            session_id="session-1",
+            template_type="basic",
+            layout_data={"image_path": str(kept)},
+        )
+    )
+    orphans = [_write(output_dir / f"orphan-{i}.png", age_seconds=120) for i in range(3)]
+    fresh = _write(output_dir / "fresh.png")
+    kept_variant = _write(output_dir / "kept.thumb.webp", age_seconds=120)
+    orphans.append(_write(output_dir / "orphan-0.full.webp", age_seconds=120))
+
+    assert reclaimer.sweep() == 4
+
+    assert kept.exists()
+    assert kept_variant.exists()
+    assert fresh.exists()
+    assert not any(orphan.exists() for orphan in orphans)
+    assert reclaimer.metrics()["files_deleted"] == 4
+
+
+def test_scheduled_paths_are_reclaimed_in_background() -> None:
+    reclaimer = _reclaimer(interval_seconds=3600)
+    released = _write(Path(settings.infographic_path) / "released.png")
+
+    async def run() -> None:
+        await reclaimer.start()
+        reclaimer.schedule([str(released)])
+        deadline = time.monotonic() + 5
+        while released.exists() and time.monotonic() < deadline:
+            await asyncio.sleep(0.02)
+        await reclaimer.stop()
+
+    asyncio.run(run())
+
+    assert not released.exists()
+    reclaimer.executor.shutdown()
@@ -4,9 +4,15 @@ from fastapi.testclient import TestClient
 
 from infograph.core.schemas.user import User
 from infograph.services.auth_service import AuthService
+from infograph.services.infographic_service import (
+    InfographicService,
+    InfographicServiceError,
+)
 from infograph.stores.duckdb.duckdb_client import DuckDBClient
+from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
 from infograph.stores.duckdb.user_store_duckdb import UserStoreDuckDB
 from infograph.svc.api_service import create_app
+from tests.conftest import wait_for_session
 
 
 def _auth_headers() -> tuple[dict[str, str], User]:
@@ -19,30 +25,96 @@ def _auth_headers() -> tuple[dict[str, str], User]:
     return {"Authorization": f"Bearer {token}"}, user
 
 
-def test_get_infographic_and_image() -> None:
-    client = TestClient(create_app())
+def test_get_infographic_and_image(monkeypatch) -> None:
     headers, user = _auth_headers()
-    session_store = SessionStoreDuckDB(client=DuckDBClient(db_name="infograph"))
 
-    response = client.post(
-        "/api/v1/sessions",
-        json={"prompt": "Q"},
-        headers=headers,
-    )
-    assert response.status_code == 200
-    session_payload = response.json()
-    session_id = session_payload["session_id"]
+    with TestClient(create_app()) as client:
+        session_store = SessionStoreDuckDB(client=DuckDBClient(db_name="infograph"))
 
-    response = client.get(
-        f"/api/v1/sessions/{session_id}/infographic", headers=headers
-    )
-    assert response.status_code == 200
-    payload = response.json()
-    assert payload["session_id"] == session_id
-    assert payload["template_type"] == "basic"
+        response = client.post(
+            "/api/v1/sessions",
+            json={"prompt": "Q"},
+            headers=headers,
+        )
+        assert response.status_code == 202
+        session_payload = response.json()
+        session_id = session_payload["session_id"]
+        assert wait_for_session(client, session_id, headers)["status"] == "completed"
+        assert session_store.get_session(session_id).status == "completed"
 
-    image_response = client.get(
-        f"/api/v1/sessions/{session_id}/infographic/image", headers=headers
-    )
-    assert image_response.status_code == 200
-    assert image_response.headers["content-type"].startswith("image/png")
+        response = client.get(
+            f"/api/v1/sessions/{session_id}/infographic", headers=headers
+        )
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["session_id"] == session_id
+        assert payload["template_type"] == "basic"
+
+        image_response = client.get(
+            f"/api/v1/sessions/{session_id}/infographic/image", headers=headers
+        )
+        assert image_response.status_code == 200
+        assert image_response.headers["content-type"].startswith("image/png")
+
+        thumb_response = client.get(
+            f"/api/v1/sessions/{session_id}/infographic/image",
+            params={"size": "thumb", "format": "webp"},
+            headers=headers,
+        )
+        assert thumb_response.status_code == 200
+        assert thumb_response.headers["content-type"] == "image/webp"
+        assert len(thumb_response.content) < len(image_response.content)
+
+        bad_response = client.get(
+            f"/api/v1/sessions/{session_id}/infographic/image",
+            params={"size": "huge"},
+            headers=headers,
+        )
+        assert bad_response.status_code == 422
+
+        etag = image_response.headers["etag"]
+        assert image_response.headers["cache-control"] == "private, no-cache"
+        revalidated = client.get(
+            f"/api/v1/sessions/{session_id}/infographic/image",
+            headers={**headers, "If-None-Match": etag},
+        )
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+
+        metadata_etag = response.headers["etag"]
+        assert metadata_etag != etag
+        assert (
+            client.get(
+                f"/api/v1/sessions/{session_id}/infographic",
+                headers={**headers, "If-None-Match": metadata_etag},
+            ).status_code
+            == 304
+        )
+
+        content_key = payload["layout_data"]["content_key"]
+        keyed_url = f"/api/v1/sessions/{session_id}/infographic/images/{content_key}"
+        keyed = client.get(keyed_url, params={"format": "webp"}, headers=headers)
+        assert keyed.status_code == 200
+        assert "immutable" in keyed.headers["cache-control"]
+        assert (
+            client.get(
+                keyed_url,
+                params={"format": "webp"},
+                headers={**headers, "If-None-Match": keyed.headers["etag"]},
+            ).status_code
+            == 304
+        )
+        stale_key_url = f"/api/v1/sessions/{session_id}/infographic/images/{'0' * 64}"
+        assert client.get(stale_key_url, headers=headers).status_code == 404
+
+        def busy(*_args):
+            raise InfographicServiceError("Rendering failed: Render queue is full")
+
+        monkeypatch.setattr(InfographicService, "image_variant", busy)
+        unavailable = client.get(
+            f"/api/v1/sessions/{session_id}/infographic/image",
+            params={"size": "thumb"},
+            headers=headers,
+        )
+        assert unavailable.status_code == 503
+        assert unavailable.headers["retry-after"] == "5"
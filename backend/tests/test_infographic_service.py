@@ -1,20 +1,35 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from infograph.core.schemas.research_session import ResearchSession
+import pytest
+from PIL import Image
+
+from infograph.core.event_bus import EventBus, SessionEvent
+from infograph.core.schemas.research_session import (
+    ResearchSession,
+    ResearchSessionCreate,
+)
 from infograph.core.schemas.source import SourceCreate
-from infograph.services.infographic_service import InfographicService
+from infograph.services.infographic_service import (
+    InfographicService,
+    InfographicServiceError,
+)
+from infograph.services.render_engine import RenderEngine
 from infograph.stores.duckdb.duckdb_client import DuckDBClient
 from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
+from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
 from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
 
 
-def _session() -> ResearchSession:
+def _session(
+    session_id: str = "session-123", prompt: str = "Test prompt"
+) -> ResearchSession:
     return ResearchSession(
-        session_id="session-123",
+        session_id=session_id,
         user_id="user-1",
-        prompt="Test prompt",
+        prompt=prompt,
         status="generating",
         created_at=1,
         updated_at=1,
@@ -55,3 +70,123 @@ def test_generate_infographic_creates_metadata_and_image(tmp_path: Path) -> None
     stored = infographic_store.get_infographic("session-123")
     assert stored is not None
     assert stored.image_path == str(image_path)
+
+
+def test_identical_layouts_share_one_rendered_image(tmp_path: Path) -> None:
+    service = InfographicService(
+        infographic_store=InfographicStoreDuckDB(
+            client=DuckDBClient(db_name="infograph")
+        ),
+        output_dir=tmp_path / "infographics",
+    )
+
+    first = service.generate_infographic(session=_session("s1"), sources=[])
+    second = service.generate_infographic(session=_session("s2"), sources=[])
+    other = service.generate_infographic(session=_session("s3", "Other"), sources=[])
+
+    assert first.image_path == second.image_path != other.image_path
+    assert Path(first.image_path).stem == first.layout_data["content_key"]
+    assert service.metrics()["renders"] == 2
+    assert service.metrics()["reuses"] == 1
+    assert len(list((tmp_path / "infographics").iterdir())) == 2
+
+
+def test_image_is_deleted_with_its_last_reference(tmp_path: Path) -> None:
+    service = InfographicService(
+        infographic_store=InfographicStoreDuckDB(
+            client=DuckDBClient(db_name="infograph")
+        ),
+        output_dir=tmp_path / "infographics",
+    )
+    shared = Path(service.generate_infographic(_session("s1"), []).image_path)
+    service.generate_infographic(_session("s2"), [])
+
+    service.delete_infographic("s1")
+    assert shared.exists()
+
+    service.delete_infographic("s2")
+    assert not shared.exists()
+    assert service.metrics()["files_released"] == 1
+
+
+def test_regenerating_with_a_new_layout_releases_the_old_image(tmp_path: Path) -> None:
+    service = InfographicService(
+        infographic_store=InfographicStoreDuckDB(
+            client=DuckDBClient(db_name="infograph")
+        ),
+        output_dir=tmp_path / "infographics",
+    )
+    old = Path(service.generate_infographic(_session("s1", "Before"), []).image_path)
+
+    new = Path(service.generate_infographic(_session("s1", "After"), []).image_path)
+
+    assert new.exists()
+    assert not old.exists()
+
+
+def test_render_engine_failures_surface_as_service_errors(tmp_path: Path) -> None:
+    engine = RenderEngine(workers=1, max_queue=0)
+    engine.shutdown()
+    service = InfographicService(
+        infographic_store=InfographicStoreDuckDB(
+            client=DuckDBClient(db_name="infograph")
+        ),
+        output_dir=tmp_path / "infographics",
+        render_engine=engine,
+    )
+
+    with pytest.raises(InfographicServiceError):
+        service.generate_infographic(_session(), [])
+
+
+def test_image_variants_are_generated_once_and_released_with_the_image(
+    tmp_path: Path,
+) -> None:
+    service = InfographicService(
+        infographic_store=InfographicStoreDuckDB(
+            client=DuckDBClient(db_name="infograph")
+        ),
+        output_dir=tmp_path / "infographics",
+    )
+    original = Path(service.generate_infographic(_session(), []).image_path)
+
+    thumb = service.image_variant(str(original), "thumb", "webp")
+    assert service.image_variant(str(original), "thumb", "webp") == thumb
+    assert service.image_variant(str(original), "full", "png") == original
+
+    with Image.open(thumb) as image:
+        assert image.format == "WEBP"
+        assert image.size == (320, 180)
+    assert service.metrics()["variants"] == 1
+
+    service.delete_infographic("session-123")
+    assert not original.exists()
+    assert not thumb.exists()
+    assert service.image_variant(str(original), "thumb", "png") is None
+
+
+def test_infographic_event_is_published_after_commit(tmp_path: Path) -> None:
+    client = DuckDBClient(db_name="infograph")
+    seen: list[bool] = []
+
+    class VisibilityCheckingBus(EventBus):
+        def publish(self, event: SessionEvent) -> None:
+            # Read from another thread, i.e. outside the writing transaction.
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                stored = pool.submit(infographic_store.get_infographic, event.session_id)
+                seen.append(stored.result() is not None)
+
+    infographic_store = InfographicStoreDuckDB(
+        client=client, event_bus=VisibilityCheckingBus()
+    )
+    session_store = SessionStoreDuckDB(client=client)
+    session = session_store.create_session("user-1", ResearchSessionCreate(prompt="P"))
+    service = InfographicService(
+        infographic_store=infographic_store,
+        output_dir=tmp_path / "infographics",
+        session_store=session_store,
+    )
+
+    service.generate_infographic(session=session, sources=[])
+
+    assert seen == [True]
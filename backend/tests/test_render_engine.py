@@ -0,0 +1,76 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from infograph.services.infographic_renderer import RenderJob, render_basic
+from infograph.services.render_engine import (
+    RenderEngine,
+    RenderQueueFullError,
+    RenderTimeoutError,
+    RenderWorkerCrashedError,
+)
+
+
+def _pid() -> int:
+    return os.getpid()
+
+
+def _crash() -> None:
+    os._exit(1)
+
+
+def _sleep(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+def test_render_engine_renders_in_a_worker_process(tmp_path: Path) -> None:
+    engine = RenderEngine(workers=1, max_queue=1, timeout_seconds=60)
+    job = RenderJob(
+        layout_data={"title": "Tides", "bullets": ["Moon"], "source_count": 1},
+        output_path=str(tmp_path / "out.png"),
+    )
+    try:
+        assert engine.run(_pid) != os.getpid()
+        assert engine.run(render_basic, job) == job.output_path
+    finally:
+        engine.shutdown()
+
+    assert (tmp_path / "out.png").read_bytes().startswith(b"\x89PNG")
+    assert engine.metrics()["completed"] == 2
+
+
+def test_crashed_or_hung_workers_are_replaced() -> None:
+    engine = RenderEngine(workers=1, max_queue=0, timeout_seconds=5)
+    try:
+        first_pid = engine.run(_pid)
+        with pytest.raises(RenderWorkerCrashedError):
+            engine.run(_crash)
+        assert engine.run(_pid) != first_pid
+
+        engine.timeout_seconds = 0.5
+        with pytest.raises(RenderTimeoutError):
+            engine.run(_sleep, 30)
+        engine.timeout_seconds = 5
+        assert engine.run(_pid) > 0
+    finally:
+        engine.shutdown()
+
+    metrics = engine.metrics()
+    assert metrics["crashes"] == 1
+    assert metrics["timeouts"] == 1
+    assert metrics["pool_restarts"] == 2
+
+
+def test_full_queue_rejects_immediately() -> None:
+    engine = RenderEngine(workers=1, max_queue=0, timeout_seconds=5)
+    engine._slots.acquire()
+    try:
+        with pytest.raises(RenderQueueFullError):
+            engine.run(_pid)
+    finally:
+        engine._slots.release()
+        engine.shutdown()
+
+    assert engine.metrics()["rejected"] == 1
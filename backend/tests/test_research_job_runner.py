@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from infograph.core.schemas.job import JobCreate
+from infograph.core.schemas.research_session import (
+    ResearchSessionCreate,
+    ResearchSessionUpdate,
+)
+from infograph.services.infographic_service import InfographicService
+from infograph.services.research_job_runner import ResearchJobRunner
+from infograph.services.research_service import ResearchService
+from infograph.services.search_service import SearchService
+from infograph.stores.duckdb.duckdb_client import DuckDBClient
+from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
+from infograph.stores.duckdb.job_store_duckdb import JobStoreDuckDB
+from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
+from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
+
+
+HTML_WITH_RESULTS = """
+<div class="results">
+  <a class="result__a" href="https://example.com/alpha">Alpha Title</a>
+  <span class="result__snippet">Alpha snippet text.</span>
+</div>
+"""
+
+
+def _runner() -> ResearchJobRunner:
+    client = DuckDBClient(db_name="infograph")
+    return ResearchJobRunner(
+        research_service=ResearchService(
+            session_store=SessionStoreDuckDB(client=client),
+            source_store=SourceStoreDuckDB(client=client),
+            search_service=SearchService(fetcher=lambda _query: HTML_WITH_RESULTS),
+            infographic_service=InfographicService(
+                infographic_store=InfographicStoreDuckDB(client=client),
+            ),
+        ),
+        job_store=JobStoreDuckDB(client=client),
+        worker_count=2,
+        poll_interval_seconds=0.05,
+    )
+
+
+def test_recover_requeues_stale_sessions_and_workers_finish_them() -> None:
+    runner = _runner()
+    session_store = runner.research_service.session_store
+    stale = session_store.create_session("user-1", ResearchSessionCreate(prompt="Wind"))
+    session_store.update_session(
+        stale.session_id, ResearchSessionUpdate(status="searching")
+    )
+    queued = session_store.create_session("user-1", ResearchSessionCreate(prompt="Sun"))
+    runner.submit(queued.session_id)
+
+    async def run() -> None:
+        await runner.start()
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            statuses = {
+                session_store.get_session(session_id).status
+                for session_id in (stale.session_id, queued.session_id)
+            }
+            # The job is completed just after the session status is.
+            active = runner.job_store.list_active_session_ids()
+            if statuses == {"completed"} and not active:
+                break
+            await asyncio.sleep(0.05)
+        await runner.stop()
+
+    asyncio.run(run())
+
+    assert session_store.get_session(stale.session_id).status == "completed"
+    assert session_store.get_session(queued.session_id).status == "completed"
+    assert runner.job_store.list_active_session_ids() == set()
+
+
+def test_maintenance_purges_finished_jobs_past_retention() -> None:
+    runner = _runner()
+    runner.lease_seconds = 1
+    runner.retention_seconds = 3600
+    store = runner.job_store
+    old = store.enqueue_job(JobCreate(session_id="session-old"))
+    store.claim_job("worker-a", lease_seconds=30)
+    store.fail_job(old.job_id, "worker-a", "boom")
+    store.claim_job("worker-a", lease_seconds=30)
+    store.complete_job(old.job_id, "worker-a")
+    recent = store.enqueue_job(JobCreate(session_id="session-recent"))
+    store.claim_job("worker-a", lease_seconds=30)
+    store.complete_job(recent.job_id, "worker-a")
+    store.client.execute(
+        "UPDATE jobs SET updated_at = updated_at - 7200 WHERE job_id = ?",
+        (old.job_id,),
+    )
+
+    async def run() -> None:
+        await runner.start()
+        deadline = time.monotonic() + 5
+        while store.get_job(old.job_id) is not None and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        await runner.stop()
+
+    asyncio.run(run())
+
+    assert store.get_job(old.job_id) is None
+    assert store.get_job(recent.job_id) is not None
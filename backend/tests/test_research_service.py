@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from infograph.core.schemas.research_session import ResearchSessionCreate
+from infograph.services.infographic_service import InfographicService
+from infograph.services.research_service import ResearchService
+from infograph.services.search_service import SearchService, SearchServiceError
+from infograph.stores.duckdb.duckdb_client import DuckDBClient
+from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
+from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
+from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
+
+
+HTML_WITH_RESULTS = """
+<div class="results">
+  <a class="result__a" href="https://example.com/alpha">Alpha Title</a>
+  <span class="result__snippet">Alpha snippet text.</span>
+</div>
+"""
+
+
+def _research_service(fetcher) -> ResearchService:
+    client = DuckDBClient(db_name="infograph")
+    return ResearchService(
+        session_store=SessionStoreDuckDB(client=client),
+        source_store=SourceStoreDuckDB(client=client),
+        search_service=SearchService(fetcher=fetcher),
+        infographic_service=InfographicService(
+            infographic_store=InfographicStoreDuckDB(client=client),
+            session_store=SessionStoreDuckDB(client=client),
+        ),
+    )
+
+
+def test_run_session_completes_pipeline() -> None:
+    service = _research_service(lambda _query: HTML_WITH_RESULTS)
+    session = service.session_store.create_session(
+        "user-1", ResearchSessionCreate(prompt="Solar")
+    )
+
+    result = service.run_session(session.session_id)
+
+    assert result is not None
+    assert result.status == "completed"
+    assert len(service.source_store.list_sources(session.session_id)) == 1
+    infographic = service.infographic_service.get_infographic(session.session_id)
+    assert infographic is not None
+
+
+def test_run_session_marks_search_failures() -> None:
+    def failing_fetcher(_query: str) -> str:
+        raise SearchServiceError("boom")
+
+    service = _research_service(failing_fetcher)
+    session = service.session_store.create_session(
+        "user-1", ResearchSessionCreate(prompt="Solar")
+    )
+
+    result = service.run_session(session.session_id)
+
+    assert result is not None
+    assert result.status == "failed"
+
+
+def _leftover_rows(service: ResearchService, session_id: str) -> tuple[int, bool]:
+    sources = service.source_store.list_sources(session_id)
+    infographic = service.infographic_service.get_infographic(session_id)
+    return len(sources), infographic is not None
+
+
+def test_session_deleted_during_search_leaves_no_rows() -> None:
+    session_ids: list[str] = []
+
+    def fetcher(_query: str) -> str:
+        service.session_store.delete_session_cascade(session_ids[0])
+        return HTML_WITH_RESULTS
+
+    service = _research_service(fetcher)
+    session = service.session_store.create_session(
+        "user-1", ResearchSessionCreate(prompt="Solar")
+    )
+    session_ids.append(session.session_id)
+
+    assert service.run_session(session.session_id) is None
+    assert _leftover_rows(service, session.session_id) == (0, False)
+
+
+def test_session_deleted_during_render_leaves_no_rows() -> None:
+    service = _research_service(lambda _query: HTML_WITH_RESULTS)
+    session = service.session_store.create_session(
+        "user-1", ResearchSessionCreate(prompt="Solar")
+    )
+    infographics = service.infographic_service
+    run_renderer = infographics._run_renderer
+
+    def delete_then_render(*args):
+        service.session_store.delete_session_cascade(session.session_id)
+        return run_renderer(*args)
+
+    infographics._run_renderer = delete_then_render
+
+    assert service.run_session(session.session_id) is None
+    assert service.session_store.get_session(session.session_id) is None
+    assert _leftover_rows(service, session.session_id) == (0, False)
@@ -0,0 +1,132 @@
+import asyncio
+import time
+
+import httpx
+
+from infograph.services.search_cache import SearchCache, normalize_query
+from infograph.services.search_service import SearchService
+from infograph.stores.duckdb.duckdb_client import DuckDBClient
+from infograph.stores.duckdb.search_cache_store_duckdb import SearchCacheStoreDuckDB
+from tests.conftest import FakeClock
+from tests.test_search_service import HTML_WITH_RESULTS, DummyFetcher
+
+
+def _cache(clock: FakeClock, **kwargs) -> SearchCache:
+    store = SearchCacheStoreDuckDB(client=DuckDBClient(db_name="infograph"))
+    return SearchCache(
+        store=store, ttl_seconds=60, stale_seconds=600, clock=clock, **kwargs
+    )
+
+
+def test_normalize_query() -> None:
+    assert normalize_query("  Solar   POWER\t") == "solar power"
+
+
+def test_search_service_serves_equivalent_queries_from_cache() -> None:
+    fetcher = DummyFetcher(HTML_WITH_RESULTS)
+    service = SearchService(fetcher=fetcher, cache=_cache(FakeClock()))
+
+    first = service.search("Solar power", max_results=2)
+    second = service.search("  solar   POWER ", max_results=2)
+    service.search("solar power", max_results=1)
+
+    assert first == second
+    assert fetcher.calls == ["Solar power", "solar power"]
+    assert service.cache.metrics()["memory_hits"] == 1
+
+
+def test_cache_entries_survive_in_the_store() -> None:
+    clock = FakeClock()
+    _cache(clock).get_or_fetch("tides", 5, lambda: [{"title": "Tides"}])
+
+    fresh_cache = _cache(clock)
+    results = fresh_cache.get_or_fetch("tides", 5, lambda: [])
+
+    assert results == [{"title": "Tides"}]
+    assert fresh_cache.metrics()["store_hits"] == 1
+
+
+def test_stale_entries_are_served_while_revalidating() -> None:
+    clock = FakeClock()
+    cache = _cache(clock)
+    cache.get_or_fetch("tides", 5, lambda: [{"title": "Old"}])
+
+    clock.now += 120
+    assert cache.get_or_fetch("tides", 5, lambda: [{"title": "New"}]) == [
+        {"title": "Old"}
+    ]
+    deadline = time.monotonic() + 5
+    while cache.metrics()["refreshes"] < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert cache.get_or_fetch("tides", 5, lambda: []) == [{"title": "New"}]
+    assert cache.metrics()["stale_hits"] == 1
+
+    clock.now += 10_000
+    assert cache.get_or_fetch("tides", 5, lambda: [{"title": "Newest"}]) == [
+        {"title": "Newest"}
+    ]
+    cache.close()
+
+
+def test_empty_results_are_not_cached() -> None:
+    clock = FakeClock()
+    cache = _cache(clock)
+
+    assert cache.get_or_fetch("tides", 5, lambda: []) == []
+    assert cache.get_or_fetch("tides", 5, lambda: [{"title": "Tides"}]) == [
+        {"title": "Tides"}
+    ]
+    assert cache.metrics()["empty_not_cached"] == 1
+
+    clock.now += 120
+    assert cache.get_or_fetch("tides", 5, lambda: []) == [{"title": "Tides"}]
+    deadline = time.monotonic() + 5
+    while cache.metrics()["empty_not_cached"] < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # The empty refresh kept the earlier entry rather than replacing it.
+    assert cache.get_or_fetch("tides", 5, lambda: []) == [{"title": "Tides"}]
+    assert asyncio.run(cache.aget_expired("tides", 5)) == [{"title": "Tides"}]
+    assert asyncio.run(cache.aget_expired("unknown", 5)) is None
+
+    async def empty() -> list:
+        return []
+
+    assert asyncio.run(cache.aget_or_fetch("waves", 5, empty)) == []
+    assert asyncio.run(cache.aget_expired("waves", 5)) is None
+    cache.close()
+
+
+def test_purge_keeps_entries_for_the_failure_fallback() -> None:
+    clock = FakeClock()
+
+    def service(status: int, **cache_kwargs) -> SearchService:
+        transport = httpx.MockTransport(
+            lambda _request: httpx.Response(status, text=HTML_WITH_RESULTS)
+        )
+        return SearchService(
+            async_http_client=httpx.AsyncClient(transport=transport),
+            cache=_cache(clock, **cache_kwargs),
+            serve_stale_on_failure=True,
+        )
+
+    healthy = service(200, fallback_retention_seconds=86_400, purge_every=1)
+    # A fresh cache after the purge reads the table, not the memory LRU.
+    failing = service(503)
+
+    async def run() -> tuple[list, list]:
+        first = await healthy.asearch("solar", max_results=2)
+        # Well past the stale window; this write triggers a purge.
+        clock.now += 10_000
+        await healthy.asearch("wind", max_results=2)
+        await healthy.aclose()
+        try:
+            return first, await failing.asearch("solar", max_results=2)
+        finally:
+            await failing.aclose()
+
+    first, fallback = asyncio.run(run())
+
+    assert fallback == first
+    assert failing.cache.metrics()["expired_served"] == 1
@@ -0,0 +1,310 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from infograph.core.circuit_breaker import CircuitBreaker
+from infograph.services.search_providers import (
+    DuckDuckGoStreamParser,
+    HedgePolicy,
+    ParsedResult,
+    SearchProvider,
+    _absolute_url,
+    _DuckDuckGoParser,
+    build_providers,
+    canonical_url,
+    merge_results,
+    parse_duckduckgo_html,
+)
+from infograph.services.search_service import SearchService, SearchServiceError
+from tests.conftest import FakeClock
+from tests.test_search_cache import _cache
+from tests.test_search_service import HTML_WITH_RESULTS
+
+BASE_URL = "https://duckduckgo.com/html/"
+
+MESSY_PAGE = """<!DOCTYPE html>
+<HTML><head>
+<script>var tpl = '<a class="result__a" href="/fake">Fake</a>';</script>
+<style>.result__a > b { color: red }</style>
+</head><body>
+<!-- <a class="result__a" href="/commented">Commented</a> -->
+<div class='result'>
+  <A CLASS="result__a" href="/l/?uddg=https%3A%2F%2Fa.example&amp;rut=1">Fish &amp; <b>Chips</b></A>
+  <div class="result__snippet">Tasty &lt;fried&gt; food, 3 < 4 &mdash; <b>yes</b></div>
+</div>
+<div class=result><a class=result-link href=https://b.example/x?a=1>Lite link</a>
+<td class="result-snippet">not a snippet container</td>
+<span class="result-snippet" data-x='a > b'>Lite snippet</span></div>
+<a class="result__a" href="https://c.example">No snippet</a>
+<a class="result__url" href="https://d.example">d.example</a>
+<span class="result__snippet">Trailing</span>
+</body></HTML>
+"""
+
+
+def _reference(html: str) -> list[ParsedResult]:
+    parser = _DuckDuckGoParser()
+    parser.feed(html)
+    parser.close()
+    return [
+        ParsedResult(
+            title=result.title,
+            url=_absolute_url(result.url, BASE_URL),
+            snippet=result.snippet,
+        )
+        for result in parser.results
+    ]
+
+
+class FakeProvider(SearchProvider):
+    def __init__(
+        self,
+        name: str,
+        urls: list[str],
+        delay: float = 0.0,
+        error: Exception | None = None,
+    ) -> None:
+        self.name = name
+        self.urls = urls
+        self.delay = delay
+        self.error = error
+        self.cancelled = False
+        self.calls = 0
+
+    async def search(
+        self, query: str, limit: int, client: httpx.AsyncClient
+    ) -> list[ParsedResult]:
+        self.calls += 1
+        delay = self.delay if self.calls == 1 else 0.0
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return [
+            ParsedResult(title=f"{self.name} {index}", url=url, snippet="")
+            for index, url in enumerate(self.urls[:limit])
+        ]
+
+
+def _service(*providers: SearchProvider, **kwargs) -> SearchService:
+    kwargs.setdefault("hedge", HedgePolicy(enabled=False))
+    return SearchService(providers=list(providers), **kwargs)
+
+
+def _run(service: SearchService, limit: int = 5):
+    async def run():
+        try:
+            return await service.asearch("solar", max_results=limit)
+        finally:
+            await service.aclose()
+
+    return asyncio.run(run())
+
+
+def test_stream_parser_matches_reference_parser() -> None:
+    expected = _reference(MESSY_PAGE)
+
+    assert [result.title for result in expected] == [
+        "Fish &Chips",
+        "Lite link",
+        "d.example",
+    ]
+    assert parse_duckduckgo_html(MESSY_PAGE, BASE_URL) == expected
+    assert parse_duckduckgo_html(HTML_WITH_RESULTS, BASE_URL) == _reference(
+        HTML_WITH_RESULTS
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+def test_stream_parser_is_independent_of_chunking(chunk_size: int) -> None:
+    parser = DuckDuckGoStreamParser(BASE_URL)
+    for start in range(0, len(MESSY_PAGE), chunk_size):
+        parser.feed(MESSY_PAGE[start : start + chunk_size])
+
+    assert parser.close() == _reference(MESSY_PAGE)
+
+
+def test_stream_parser_stops_once_limit_is_reached() -> None:
+    parser = DuckDuckGoStreamParser(BASE_URL, limit=1)
+    cut = MESSY_PAGE.index("Lite link")
+
+    assert parser.feed(MESSY_PAGE[:cut])
+    assert parser.feed(MESSY_PAGE[cut:])
+    assert parser.close() == _reference(MESSY_PAGE)[:1]
+
+
+def test_canonical_url_collapses_equivalent_links() -> None:
+    variants = [
+        "https://www.Example.com/page/?utm_source=x&b=2&a=1#section",
+        "http://example.com/page?a=1&b=2&fbclid=abc",
+        "https://duckduckgo.com/l/?uddg=https%3A%2F%2Fexample.com%2Fpage%3Fb%3D2%26a%3D1",
+    ]
+
+    assert {canonical_url(url) for url in variants} == {
+        "https://example.com/page?a=1&b=2"
+    }
+
+
+def test_merge_results_dedupes_and_boosts_agreement() -> None:
+    first = [
+        ParsedResult("A", "https://a.example", ""),
+        ParsedResult("B", "https://b.example", ""),
+    ]
+    second = [
+        ParsedResult("B again", "https://www.b.example/", ""),
+        ParsedResult("C", "https://c.example", ""),
+    ]
+
+    merged = merge_results([first, second])
+
+    assert [result.title for result in merged] == ["B", "A", "C"]
+
+
+def test_fan_out_merges_all_providers_within_quorum() -> None:
+    service = _service(
+        FakeProvider("one", ["https://a.example", "https://shared.example"]),
+        FakeProvider("two", ["https://shared.example/", "https://c.example"]),
+        quorum=2,
+    )
+
+    results = _run(service)
+
+    assert [result.url for result in results][0] == "https://shared.example"
+    assert len(results) == 3
+    assert results[0].confidence == 1.0
+
+
+def test_fan_out_returns_at_quorum_without_waiting_for_slow_provider() -> None:
+    slow = FakeProvider("slow", ["https://slow.example"], delay=5)
+    service = _service(
+        FakeProvider("fast", ["https://fast.example"]),
+        slow,
+        quorum=1,
+    )
+
+    started = time.monotonic()
+    results = _run(service)
+
+    assert time.monotonic() - started < 1
+    assert [result.url for result in results] == ["https://fast.example"]
+    assert slow.cancelled
+
+
+def test_fan_out_returns_partial_results_at_deadline() -> None:
+    service = _service(
+        FakeProvider("fast", ["https://fast.example"]),
+        FakeProvider("slow", ["https://slow.example"], delay=5),
+        quorum=2,
+        fanout_deadline_seconds=0.1,
+    )
+
+    started = time.monotonic()
+    results = _run(service)
+
+    assert time.monotonic() - started < 1
+    assert [result.url for result in results] == ["https://fast.example"]
+
+
+def test_fan_out_tolerates_failed_providers_but_not_all() -> None:
+    healthy = _service(
+        FakeProvider("broken", [], error=RuntimeError("down")),
+        FakeProvider("ok", ["https://ok.example"]),
+        quorum=2,
+    )
+    assert [result.url for result in _run(healthy)] == ["https://ok.example"]
+
+    broken = _service(FakeProvider("broken", [], error=RuntimeError("down")))
+    with pytest.raises(SearchServiceError):
+        _run(broken)
+
+
+def test_slow_request_is_hedged_and_the_hedge_wins() -> None:
+    provider = FakeProvider("slow-once", ["https://a.example"], delay=5)
+    service = _service(
+        provider,
+        hedge=HedgePolicy(enabled=True, default_delay_seconds=0.05),
+    )
+
+    started = time.monotonic()
+    results = _run(service)
+
+    assert time.monotonic() - started < 1
+    assert [result.url for result in results] == ["https://a.example"]
+    assert provider.calls == 2
+    assert provider.cancelled
+    metrics = service.provider_metrics()["slow-once"]
+    assert metrics["hedges"] == 1
+    assert metrics["hedge_wins"] == 1
+
+
+def test_hedge_delay_tracks_observed_p95() -> None:
+    policy = HedgePolicy(
+        enabled=True, min_delay_seconds=0.1, default_delay_seconds=2, min_samples=5
+    )
+    provider = FakeProvider("p", [])
+    service = _service(provider, hedge=policy)
+    latency = service._guarded[0].latency
+
+    assert policy.delay(latency) == 2
+    for seconds in (0.3, 0.4, 0.5, 0.6, 1.5):
+        latency.record(seconds)
+    assert policy.delay(latency) == 1.5
+    for _ in range(200):
+        latency.record(0.01)
+    assert policy.delay(latency) == 0.1
+
+
+def test_open_breaker_fails_fast() -> None:
+    provider = FakeProvider("down", [], error=RuntimeError("down"))
+    service = _service(
+        provider,
+        breaker_factory=lambda name: CircuitBreaker(
+            name=name, minimum_calls=2, window_size=2, open_seconds=60
+        ),
+    )
+
+    async def run():
+        errors = 0
+        for _ in range(4):
+            try:
+                await service.asearch("solar")
+            except SearchServiceError:
+                errors += 1
+        await service.aclose()
+        return errors
+
+    assert asyncio.run(run()) == 4
+    assert provider.calls == 2
+    breaker = service.provider_metrics()["down"]["breaker"]
+    assert breaker["state"] == "open"
+    assert breaker["rejected"] == 2
+
+
+def test_expired_cache_entry_is_served_when_providers_fail() -> None:
+    clock = FakeClock()
+    provider = FakeProvider("flaky", ["https://cached.example"])
+    service = _service(provider, cache=_cache(clock))
+    assert [result.url for result in _run(service)] == ["https://cached.example"]
+
+    clock.now += 10_000
+    provider.error = RuntimeError("down")
+    service = _service(provider, cache=_cache(clock))
+    assert [result.url for result in _run(service)] == ["https://cached.example"]
+    assert service.cache.metrics()["expired_served"] == 1
+
+    strict = _service(provider, cache=_cache(clock), serve_stale_on_failure=False)
+    with pytest.raises(SearchServiceError):
+        _run(strict)
+
+
+def test_build_providers_rejects_unknown_names() -> None:
+    assert [provider.name for provider in build_providers(["duckduckgo"])] == [
+        "duckduckgo"
+    ]
+    with pytest.raises(ValueError):
+        build_providers(["altavista"])
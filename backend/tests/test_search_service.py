@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+
+import httpx
 import pytest
 
 from infograph.services.search_service import SearchService, SearchServiceError
@@ -68,3 +71,59 @@ def test_search_sources_creates_source_models() -> None:
     assert source.url == "https://example.com/alpha"
     assert source.snippet == "Alpha snippet text."
     assert source.confidence == 1.0
+
+
+def test_asearch_uses_shared_async_client() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text=HTML_WITH_RESULTS)
+
+    service = SearchService(
+        async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    async def run() -> list:
+        client = service._get_async_http_client()
+        first = await service.asearch("solar", max_results=1)
+        second = await service.asearch("wind", max_results=2)
+        assert service._get_async_http_client() is client
+        await service.aclose()
+        assert client.is_closed
+        return first + second
+
+    results = asyncio.run(run())
+
+    assert [request.url.params["q"] for request in requests] == ["solar", "wind"]
+    assert [result.title for result in results] == [
+        "Alpha Title",
+        "Alpha Title",
+        "Beta Title",
+    ]
+
+
+def test_asearch_maps_http_errors() -> None:
+    service = SearchService(
+        async_http_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda _request: httpx.Response(503))
+        )
+    )
+
+    async def run() -> None:
+        try:
+            with pytest.raises(SearchServiceError):
+                await service.asearch("solar")
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+
+
+def test_async_client_uses_configured_pool_limits() -> None:
+    service = SearchService(max_connections=7, max_keepalive_connections=3)
+
+    limits = service._limits()
+
+    assert limits.max_connections == 7
+    assert limits.max_keepalive_connections == 3
@@ -1,14 +1,29 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 from fastapi.testclient import TestClient
 
 from infograph.core.schemas.message import MessageCreate
 from infograph.core.schemas.research_session import ResearchSessionCreate
 from infograph.core.schemas.user import User
 from infograph.services.auth_service import AuthService
+from infograph.services.infographic_service import (
+    IMAGE_FORMATS,
+    IMAGE_SIZES,
+    variant_path,
+)
+from infograph.settings import settings
 from infograph.stores.duckdb.duckdb_client import DuckDBClient
+from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
+from infograph.stores.duckdb.job_store_duckdb import JobStoreDuckDB
 from infograph.stores.duckdb.message_store_duckdb import MessageStoreDuckDB
 from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
 from infograph.stores.duckdb.user_store_duckdb import UserStoreDuckDB
+from infograph.svc.api.v1.routers.session_router import SessionRouter
 from infograph.svc.api_service import create_app
+from tests.conftest import wait_for_session
 
 
 def _auth_headers() -> tuple[dict[str, str], User]:
@@ -22,55 +37,156 @@ def _auth_headers() -> tuple[dict[str, str], User]:
 
 
 def test_session_crud_and_messages() -> None:
-    client = TestClient(create_app())
     headers, user = _auth_headers()
 
-    create_payload = {"prompt": "Explain renewable energy trends"}
-    response = client.post("/api/v1/sessions", json=create_payload, headers=headers)
+    with TestClient(create_app()) as client:
+        create_payload = {"prompt": "Explain renewable energy trends"}
+        response = client.post("/api/v1/sessions", json=create_payload, headers=headers)
 
-    assert response.status_code == 200
-    session = response.json()
-    assert session["prompt"] == create_payload["prompt"]
-    assert session["user_id"] == user.user_id
+        assert response.status_code == 202
+        session = response.json()
+        assert session["prompt"] == create_payload["prompt"]
+        assert session["user_id"] == user.user_id
+        assert session["status"] == "pending"
+        completed = wait_for_session(client, session["session_id"], headers)
+        assert completed["status"] == "completed"
 
-    list_response = client.get("/api/v1/sessions", headers=headers)
-    assert list_response.status_code == 200
-    sessions = list_response.json()
-    assert any(item["session_id"] == session["session_id"] for item in sessions)
+        list_response = client.get("/api/v1/sessions", headers=headers)
+        assert list_response.status_code == 200
+        sessions = list_response.json()["items"]
+        assert any(item["session_id"] == session["session_id"] for item in sessions)
 
-    get_response = client.get(
-        f"/api/v1/sessions/{session['session_id']}", headers=headers
-    )
-    assert get_response.status_code == 200
+        get_response = client.get(
+            f"/api/v1/sessions/{session['session_id']}", headers=headers
+        )
+        assert get_response.status_code == 200
 
-    message_payload = {"role": "user", "content": "Give me key stats"}
-    message_response = client.post(
-        f"/api/v1/sessions/{session['session_id']}/messages",
-        json=message_payload,
-        headers=headers,
-    )
-    assert message_response.status_code == 200
-    message = message_response.json()
-    assert message["content"] == message_payload["content"]
+        message_payload = {"role": "user", "content": "Give me key stats"}
+        message_response = client.post(
+            f"/api/v1/sessions/{session['session_id']}/messages",
+            json=message_payload,
+            headers=headers,
+        )
+        assert message_response.status_code == 200
+        message = message_response.json()
+        assert message["content"] == message_payload["content"]
 
-    messages_response = client.get(
-        f"/api/v1/sessions/{session['session_id']}/messages", headers=headers
-    )
-    assert messages_response.status_code == 200
-    messages = messages_response.json()
-    assert len(messages) == 1
+        messages_response = client.get(
+            f"/api/v1/sessions/{session['session_id']}/messages", headers=headers
+        )
+        assert messages_response.status_code == 200
+        messages = messages_response.json()
+        assert len(messages["items"]) == 1
+        assert messages["next_cursor"] is None
+
+        infographic_store = InfographicStoreDuckDB(
+            client=DuckDBClient(db_name="infograph")
+        )
+        infographic = infographic_store.get_infographic(session["session_id"])
+        image_path = Path(infographic.image_path)
+        image_paths = [
+            variant_path(image_path, size, image_format)
+            for size in IMAGE_SIZES
+            for image_format in IMAGE_FORMATS
+        ]
+        for size in IMAGE_SIZES:
+            for image_format in IMAGE_FORMATS:
+                image_response = client.get(
+                    f"/api/v1/sessions/{session['session_id']}/infographic/image",
+                    params={"size": size, "format": image_format},
+                    headers=headers,
+                )
+                assert image_response.status_code == 200
+        assert all(path.exists() for path in image_paths)
+
+        delete_response = client.delete(
+            f"/api/v1/sessions/{session['session_id']}", headers=headers
+        )
+        assert delete_response.status_code == 200
+        assert delete_response.json() == {"success": True}
+
+        deadline = time.monotonic() + 5
+        while any(path.exists() for path in image_paths):
+            if time.monotonic() > deadline:
+                break
+            time.sleep(0.02)
+        assert not any(path.exists() for path in image_paths)
+
+        store_session = SessionStoreDuckDB(client=DuckDBClient(db_name="infograph"))
+        assert store_session.get_session(session["session_id"]) is None
+
+        store_messages = MessageStoreDuckDB(client=DuckDBClient(db_name="infograph"))
+        assert store_messages.list_messages(session["session_id"]) == []
+
+
+def test_session_events_stream_until_completed() -> None:
+    headers, _ = _auth_headers()
+
+    with TestClient(create_app()) as client:
+        response = client.post(
+            "/api/v1/sessions", json={"prompt": "Explain tides"}, headers=headers
+        )
+        session_id = response.json()["session_id"]
+
+        with client.stream(
+            "GET", f"/api/v1/sessions/{session_id}/events", headers=headers
+        ) as stream:
+            assert stream.headers["content-type"].startswith("text/event-stream")
+            events = [
+                json.loads(line.removeprefix("data: "))
+                for line in stream.iter_lines()
+                if line.startswith("data: ")
+            ]
 
-    delete_response = client.delete(
-        f"/api/v1/sessions/{session['session_id']}", headers=headers
+    assert events[-1]["status"] == "completed"
+
+
+def test_create_session_rolls_back_when_the_job_cannot_be_queued(monkeypatch) -> None:
+    headers, user = _auth_headers()
+
+    def refuse(self, job_create):
+        raise RuntimeError("queue unavailable")
+
+    monkeypatch.setattr(JobStoreDuckDB, "enqueue_job", refuse)
+    client = TestClient(create_app(), raise_server_exceptions=False)
+    response = client.post(
+        "/api/v1/sessions", json={"prompt": "Never queued"}, headers=headers
     )
-    assert delete_response.status_code == 200
-    assert delete_response.json() == {"success": True}
 
-    store_session = SessionStoreDuckDB(client=DuckDBClient(db_name="infograph"))
-    assert store_session.get_session(session["session_id"]) is None
+    assert response.status_code == 500
+    store = SessionStoreDuckDB(client=DuckDBClient(db_name="infograph"))
+    assert store.list_sessions_page(user.user_id, 10).items == []
+
 
-    store_messages = MessageStoreDuckDB(client=DuckDBClient(db_name="infograph"))
-    assert store_messages.list_messages(session["session_id"]) == []
+def test_list_sessions_paginates_with_cursor() -> None:
+    headers, user = _auth_headers()
+    store = SessionStoreDuckDB(client=DuckDBClient(db_name="infograph"))
+    created = {
+        store.create_session(
+            user.user_id, ResearchSessionCreate(prompt=f"Prompt {index}")
+        ).session_id
+        for index in range(5)
+    }
+
+    client = TestClient(create_app())
+    seen: list[str] = []
+    cursor = None
+    while True:
+        params = {"limit": 2} if cursor is None else {"limit": 2, "cursor": cursor}
+        response = client.get("/api/v1/sessions", params=params, headers=headers)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["items"]) <= 2
+        seen.extend(item["session_id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert created <= set(seen)
+    assert len(seen) == len(set(seen))
+
+    bad = client.get("/api/v1/sessions", params={"cursor": "nope"}, headers=headers)
+    assert bad.status_code == 400
 
 
 def test_message_requires_authorized_session() -> None:
@@ -84,3 +200,135 @@ def test_message_requires_authorized_session() -> None:
     )
 
     assert response.status_code == 404
+
+
+def test_session_detail_includes_requested_parts() -> None:
+    headers, user = _auth_headers()
+    session_store = SessionStoreDuckDB(client=DuckDBClient(db_name="infograph"))
+    session = session_store.create_session(
+        user.user_id, ResearchSessionCreate(prompt="Explain glaciers")
+    )
+    message_store = MessageStoreDuckDB(client=DuckDBClient(db_name="infograph"))
+    for index in range(3):
+        message_store.create_message(
+            MessageCreate(
+                session_id=session.session_id,
+                role="user",
+                content=f"Question {index}",
+            )
+        )
+
+    client = TestClient(create_app())
+    url = f"/api/v1/sessions/{session.session_id}/detail"
+
+    response = client.get(url, params={"messages_limit": 2}, headers=headers)
+    assert response.status_code == 200
+    detail = response.json()
+    assert detail["session"]["session_id"] == session.session_id
+    assert detail["sources"] == []
+    assert len(detail["messages"]["items"]) == 2
+    assert detail["messages"]["next_cursor"] is not None
+    assert detail["infographic"] is None
+
+    response = client.get(url, params={"include": "sources"}, headers=headers)
+    assert response.status_code == 200
+    detail = response.json()
+    assert detail["sources"] == []
+    assert detail["messages"] is None
+
+    bad = client.get(url, params={"include": "sources,bogus"}, headers=headers)
+    assert bad.status_code == 400
+
+
+def test_session_detail_requires_owner() -> None:
+    headers, _ = _auth_headers()
+    session_store = SessionStoreDuckDB(client=DuckDBClient(db_name="infograph"))
+    session = session_store.create_session(
+        "someone-else", ResearchSessionCreate(prompt="Private")
+    )
+
+    client = TestClient(create_app())
+    forbidden = client.get(
+        f"/api/v1/sessions/{session.session_id}/detail", headers=headers
+    )
+    missing = client.get("/api/v1/sessions/missing/detail", headers=headers)
+
+    assert forbidden.status_code == 403
+    assert missing.status_code == 404
+
+
+def test_list_endpoints_stream_ndjson(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "ndjson_batch_size", 2)
+    headers, user = _auth_headers()
+    session_store = SessionStoreDuckDB(client=DuckDBClient(db_name="infograph"))
+    message_store = MessageStoreDuckDB(client=DuckDBClient(db_name="infograph"))
+    for index in range(3):
+        session_store.create_session(
+            user.user_id, ResearchSessionCreate(prompt=f"Prompt {index}")
+        )
+    session = session_store.create_session(
+        user.user_id, ResearchSessionCreate(prompt="Long conversation")
+    )
+    for index in range(5):
+        message_store.create_message(
+            MessageCreate(
+                session_id=session.session_id, role="user", content=f"Turn {index}"
+            )
+        )
+    stream_headers = {**headers, "Accept": "application/x-ndjson"}
+
+    client = TestClient(create_app())
+    sessions = client.get("/api/v1/sessions", headers=stream_headers)
+    messages = client.get(
+        f"/api/v1/sessions/{session.session_id}/messages", headers=stream_headers
+    )
+    paged = client.get(
+        f"/api/v1/sessions/{session.session_id}/messages", headers=headers
+    )
+
+    assert sessions.headers["content-type"] == "application/x-ndjson"
+    streamed_sessions = [json.loads(line) for line in sessions.text.splitlines()]
+    assert len(streamed_sessions) == 4
+    assert all(item["user_id"] == user.user_id for item in streamed_sessions)
+    assert messages.headers["content-type"] == "application/x-ndjson"
+    streamed_messages = [json.loads(line) for line in messages.text.splitlines()]
+    assert streamed_messages == paged.json()["items"]
+
+    bad = client.get(
+        "/api/v1/sessions", params={"cursor": "nope"}, headers=stream_headers
+    )
+    assert bad.status_code == 400
+
+
+def _stream_events(client: TestClient, session_id: str, headers: dict) -> list[str]:
+    with client.stream(
+        "GET", f"/api/v1/sessions/{session_id}/events", headers=headers
+    ) as stream:
+        return [line for line in stream.iter_lines() if line.startswith("event: ")]
+
+
+def test_session_events_end_when_the_session_is_deleted(monkeypatch) -> None:
+    monkeypatch.setattr(SessionRouter, "event_keepalive_seconds", 0.05)
+    headers, user = _auth_headers()
+    store = SessionStoreDuckDB(client=DuckDBClient(db_name="infograph"))
+
+    with TestClient(create_app()) as client, ThreadPoolExecutor(max_workers=2) as pool:
+        # Created after startup, so job recovery does not pick them up.
+        announced = store.create_session(user.user_id, ResearchSessionCreate(prompt="A"))
+        silent = store.create_session(user.user_id, ResearchSessionCreate(prompt="B"))
+        streams = {
+            session.session_id: pool.submit(
+                _stream_events, client, session.session_id, headers
+            )
+            for session in (announced, silent)
+        }
+        time.sleep(0.3)
+        store.delete_session_cascade(announced.session_id)
+        # Removed without an event: the keep-alive check ends this stream.
+        store.delete_session(silent.session_id)
+
+        announced_events = streams[announced.session_id].result(timeout=10)
+        silent_events = streams[silent.session_id].result(timeout=10)
+
+    assert announced_events == ["event: status", "event: deleted"]
+    assert silent_events == ["event: status", "event: deleted"]
@@ -0,0 +1,173 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from infograph.core.single_flight import (
+    SingleFlight,
+    SingleFlightLimitError,
+    SingleFlightTimeoutError,
+)
+from infograph.services.search_service import SearchService, SearchServiceError
+from tests.test_search_service import HTML_WITH_RESULTS
+
+
+def _blocking_call(release: threading.Event, calls: list[int]):
+    def call() -> str:
+        calls.append(1)
+        release.wait(5)
+        return "result"
+
+    return call
+
+
+def _wait_for_leader(flight: SingleFlight) -> None:
+    deadline = time.monotonic() + 5
+    while flight.metrics()["in_flight"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def _wait_for_waiters(flight: SingleFlight, count: int) -> None:
+    deadline = time.monotonic() + 5
+    while flight.metrics()["waiting"] < count and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def test_concurrent_calls_share_one_execution() -> None:
+    flight = SingleFlight(max_waiters=10, timeout_seconds=5)
+    release = threading.Event()
+    calls: list[int] = []
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [pool.submit(flight.do, "key", _blocking_call(release, calls))]
+        _wait_for_leader(flight)
+        futures += [
+            pool.submit(flight.do, "key", _blocking_call(release, calls))
+            for _ in range(4)
+        ]
+        _wait_for_waiters(flight, 4)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == ["result"] * 5
+    assert calls == [1]
+    assert flight.metrics()["coalesced"] == 4
+
+
+def test_waiters_share_the_leader_exception() -> None:
+    flight = SingleFlight(max_waiters=10, timeout_seconds=5)
+    release = threading.Event()
+
+    def fail() -> None:
+        release.wait(5)
+        raise ValueError("upstream down")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(flight.do, "key", fail)
+        _wait_for_leader(flight)
+        waiter = pool.submit(flight.do, "key", fail)
+        _wait_for_waiters(flight, 1)
+        release.set()
+        with pytest.raises(ValueError):
+            leader.result()
+        with pytest.raises(ValueError):
+            waiter.result()
+
+
+def test_waiter_limit_and_timeout() -> None:
+    flight = SingleFlight(max_waiters=1, timeout_seconds=0.05)
+    release = threading.Event()
+    calls: list[int] = []
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(flight.do, "key", _blocking_call(release, calls))
+        _wait_for_leader(flight)
+        waiter = pool.submit(flight.do, "key", _blocking_call(release, calls))
+        _wait_for_waiters(flight, 1)
+        with pytest.raises(SingleFlightLimitError):
+            flight.do("key", _blocking_call(release, calls))
+        with pytest.raises(SingleFlightTimeoutError):
+            waiter.result()
+        release.set()
+        assert leader.result() == "result"
+
+    assert flight.metrics()["rejected"] == 1
+    assert flight.metrics()["timeouts"] == 1
+
+
+def test_search_service_coalesces_identical_queries() -> None:
+    release = threading.Event()
+    calls: list[str] = []
+
+    def fetcher(query: str) -> str:
+        calls.append(query)
+        release.wait(5)
+        return HTML_WITH_RESULTS
+
+    flight = SingleFlight(max_waiters=10, timeout_seconds=5)
+    service = SearchService(fetcher=fetcher, single_flight=flight)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(service.search, "Solar power", 2)]
+        _wait_for_leader(flight)
+        futures += [pool.submit(service.search, "solar  power", 2) for _ in range(2)]
+        _wait_for_waiters(flight, 2)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert calls == ["Solar power"]
+    assert results[0] == results[1] == results[2]
+    assert results[0] is not results[1]
+
+
+def test_search_service_reports_single_flight_rejection() -> None:
+    flight = SingleFlight(max_waiters=0, timeout_seconds=5)
+    release = threading.Event()
+    service = SearchService(
+        fetcher=lambda _query: release.wait(5) and HTML_WITH_RESULTS,
+        single_flight=flight,
+    )
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        leader = pool.submit(service.search, "tides")
+        _wait_for_leader(flight)
+        with pytest.raises(SearchServiceError):
+            service.search("tides")
+        release.set()
+        assert len(leader.result()) == 2
+
+
+def test_async_calls_share_one_task() -> None:
+    flight = SingleFlight(max_waiters=10, timeout_seconds=5)
+    calls: list[int] = []
+
+    async def fetch() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def run() -> list[str]:
+        return await asyncio.gather(*(flight.ado("key", fetch) for _ in range(5)))
+
+    assert asyncio.run(run()) == ["result"] * 5
+    assert calls == [1]
+    assert flight.metrics()["in_flight"] == 0
+
+
+def test_async_waiter_timeout_leaves_shared_task_running() -> None:
+    flight = SingleFlight(max_waiters=10, timeout_seconds=0.01)
+
+    async def fetch() -> str:
+        await asyncio.sleep(0.1)
+        return "result"
+
+    async def run() -> str:
+        leader = asyncio.create_task(flight.ado("key", fetch))
+        await asyncio.sleep(0)
+        with pytest.raises(SingleFlightTimeoutError):
+            await flight.ado("key", fetch)
+        return await leader
+
+    assert asyncio.run(run()) == "result"
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 from fastapi.testclient import TestClient
 
 from infograph.core.schemas.user import User
@@ -7,6 +9,7 @@ from infograph.services.auth_service import AuthService
 from infograph.stores.duckdb.duckdb_client import DuckDBClient
 from infograph.stores.duckdb.user_store_duckdb import UserStoreDuckDB
 from infograph.svc.api_service import create_app
+from tests.conftest import wait_for_session
 
 
 def _auth_headers() -> tuple[dict[str, str], User]:
@@ -20,20 +23,21 @@ def _auth_headers() -> tuple[dict[str, str], User]:
 
 
 def test_list_sources_for_session() -> None:
-    client = TestClient(create_app())
     headers, _ = _auth_headers()
 
-    response = client.post(
-        "/api/v1/sessions",
-        json={"prompt": "Explain renewable energy"},
-        headers=headers,
-    )
-    assert response.status_code == 200
-    session_id = response.json()["session_id"]
+    with TestClient(create_app()) as client:
+        response = client.post(
+            "/api/v1/sessions",
+            json={"prompt": "Explain renewable energy"},
+            headers=headers,
+        )
+        assert response.status_code == 202
+        session_id = response.json()["session_id"]
+        wait_for_session(client, session_id, headers)
 
-    sources_response = client.get(
-        f"/api/v1/sessions/{session_id}/sources", headers=headers
-    )
+        sources_response = client.get(
+            f"/api/v1/sessions/{session_id}/sources", headers=headers
+        )
     assert sources_response.status_code == 200
     sources = sources_response.json()
     assert len(sources) >= 1
@@ -47,3 +51,23 @@ def test_sources_require_authorized_session() -> None:
     response = client.get("/api/v1/sessions/missing/sources", headers=headers)
 
     assert response.status_code == 404
+
+
+def test_list_sources_streams_ndjson() -> None:
+    headers, _ = _auth_headers()
+
+    with TestClient(create_app()) as client:
+        response = client.post(
+            "/api/v1/sessions", json={"prompt": "Explain tides"}, headers=headers
+        )
+        session_id = response.json()["session_id"]
+        wait_for_session(client, session_id, headers)
+
+        url = f"/api/v1/sessions/{session_id}/sources"
+        streamed = client.get(
+            url, headers={**headers, "Accept": "application/x-ndjson"}
+        )
+        listed = client.get(url, headers=headers)
+
+    assert streamed.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in streamed.text.splitlines()] == listed.json()
@@ -0,0 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from infograph.stores.duckdb.duckdb_client import DuckDBClient
+from infograph.stores.duckdb.duckdb_connection_registry import DuckDBConnectionRegistry
+
+
+def test_clients_share_one_connection_per_database() -> None:
+    registry = DuckDBConnectionRegistry(max_concurrency=2)
+    first = DuckDBClient(db_name="infograph", registry=registry)
+    second = DuckDBClient(db_name="infograph", registry=registry)
+
+    assert first.conn is second.conn
+
+    first.ensure_table("numbers", "CREATE TABLE IF NOT EXISTS numbers (value INTEGER)")
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda value: second.execute("INSERT INTO numbers VALUES (?)", (value,)), range(8)))
+
+    assert first.fetchone("SELECT COUNT(*) FROM numbers") == (8,)
+    registry.close_all()
+
+
+def test_close_checkpoints_and_reopens() -> None:
+    registry = DuckDBConnectionRegistry()
+    client = DuckDBClient(db_name="infograph", registry=registry)
+    client.ensure_table("numbers", "CREATE TABLE IF NOT EXISTS numbers (value INTEGER)")
+    client.execute("INSERT INTO numbers VALUES (1)")
+
+    client.close()
+
+    assert client.fetchall("SELECT value FROM numbers") == [(1,)]
+    registry.close_all()
+
+
+def test_stream_records_fetches_in_batches_across_threads() -> None:
+    registry = DuckDBConnectionRegistry(max_concurrency=1)
+    client = DuckDBClient(db_name="infograph", registry=registry)
+    client.ensure_table("numbers", "CREATE TABLE IF NOT EXISTS numbers (value INTEGER)")
+    client.execute("INSERT INTO numbers SELECT range FROM range(10)")
+
+    batches = client.stream_records(
+        "SELECT value FROM numbers WHERE value >= ? ORDER BY value", (2,), batch_size=3
+    )
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(next, batches).result()
+        # Other statements on the same threads do not disturb the stream.
+        pool.submit(client.fetchall, "SELECT COUNT(*) FROM numbers").result()
+        rest = list(pool.submit(list, batches).result())
+
+    assert first == [{"value": 2}, {"value": 3}, {"value": 4}]
+    assert [len(batch) for batch in rest] == [3, 2]
+    assert rest[-1][-1] == {"value": 9}
+
+    closed_early = client.stream_records("SELECT value FROM numbers", batch_size=2)
+    assert len(next(closed_early)) == 2
+    closed_early.close()
+    # The single concurrency slot was released between and after batches.
+    assert client.fetchone("SELECT COUNT(*) FROM numbers") == (10,)
+    registry.close_all()
@@ -16,5 +16,6 @@ def test_infographic_store_crud(duckdb_client) -> None:
     assert fetched is not None
     assert fetched.infographic_id == infographic.infographic_id
 
-    store.delete_infographic("session-1")
+    assert store.delete_infographic("session-1") == ["/tmp/image.png"]
     assert store.get_infographic("session-1") is None
+    assert store.delete_infographic("session-1") == []
@@ -0,0 +1,58 @@
+from infograph.core.schemas.job import JobCreate
+from infograph.stores.duckdb.job_store_duckdb import JobStoreDuckDB
+
+
+def test_job_store_claim_heartbeat_and_complete(duckdb_client) -> None:
+    store = JobStoreDuckDB(client=duckdb_client)
+    job = store.enqueue_job(JobCreate(session_id="session-1"))
+
+    claimed = store.claim_job("worker-a", lease_seconds=30)
+    assert claimed is not None
+    assert claimed.job_id == job.job_id
+    assert claimed.status == "running"
+    assert claimed.attempts == 1
+    assert store.claim_job("worker-b", lease_seconds=30) is None
+    assert store.list_active_session_ids() == {"session-1"}
+
+    assert store.heartbeat(job.job_id, "worker-a", lease_seconds=30)
+    assert not store.heartbeat(job.job_id, "worker-b", lease_seconds=30)
+
+    assert store.complete_job(job.job_id, "worker-a")
+    assert store.get_job(job.job_id).status == "completed"
+    assert store.list_active_session_ids() == set()
+
+
+def test_job_store_retries_until_attempts_exhausted(duckdb_client) -> None:
+    store = JobStoreDuckDB(client=duckdb_client)
+    job = store.enqueue_job(JobCreate(session_id="session-1", max_attempts=2))
+
+    store.claim_job("worker-a", lease_seconds=30)
+    retried = store.fail_job(job.job_id, "worker-a", "boom")
+    assert retried is not None
+    assert retried.status == "queued"
+    assert retried.last_error == "boom"
+
+    store.claim_job("worker-a", lease_seconds=-1)
+    expired = store.requeue_expired_leases()
+    assert [item.job_id for item in expired] == [job.job_id]
+    assert expired[0].status == "failed"
+
+
+def test_job_store_purges_only_old_finished_jobs(duckdb_client) -> None:
+    store = JobStoreDuckDB(client=duckdb_client)
+    old = store.enqueue_job(JobCreate(session_id="session-old"))
+    store.claim_job("worker-a", lease_seconds=30)
+    store.complete_job(old.job_id, "worker-a")
+    recent = store.enqueue_job(JobCreate(session_id="session-recent"))
+    store.claim_job("worker-a", lease_seconds=30)
+    store.complete_job(recent.job_id, "worker-a")
+    queued = store.enqueue_job(JobCreate(session_id="session-queued"))
+    duckdb_client.execute(
+        "UPDATE jobs SET updated_at = 0 WHERE job_id IN (?, ?)",
+        (old.job_id, queued.job_id),
+    )
+
+    assert store.purge_finished_jobs(updated_before=1000) == 1
+    assert store.get_job(old.job_id) is None
+    assert store.get_job(recent.job_id) is not None
+    assert store.get_job(queued.job_id) is not None
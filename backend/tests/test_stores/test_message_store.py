@@ -14,3 +14,21 @@ def test_message_store_crud(duckdb_client) -> None:
 
     store.delete_messages_for_session("session-1")
     assert store.list_messages("session-1") == []
+
+
+def test_message_store_keyset_pages(duckdb_client) -> None:
+    store = MessageStoreDuckDB(client=duckdb_client)
+    created = [
+        store.create_message(
+            MessageCreate(session_id="session-1", role="user", content=f"Hi {index}")
+        ).message_id
+        for index in range(4)
+    ]
+
+    first = store.list_messages_page("session-1", limit=2)
+    second = store.list_messages_page("session-1", limit=2, cursor=first.next_cursor)
+
+    paged = [message.message_id for message in first.items + second.items]
+    assert sorted(paged) == sorted(created)
+    assert first.next_cursor is not None
+    assert second.next_cursor is None
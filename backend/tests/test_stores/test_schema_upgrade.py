@@ -0,0 +1,85 @@
+import duckdb
+import pytest
+
+from infograph.core.schemas.user import UserCreate
+from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
+from infograph.stores.duckdb.user_store_duckdb import UserStoreDuckDB
+
+
+def _index_names(duckdb_client, table_name: str) -> set[str]:
+    rows = duckdb_client.fetchall(
+        "SELECT index_name FROM duckdb_indexes() WHERE table_name = ?",
+        (table_name,),
+    )
+    return {row[0] for row in rows}
+
+
+def test_existing_database_is_upgraded_with_indexes(duckdb_client) -> None:
+    duckdb_client.execute(
+        """
+        CREATE TABLE research_sessions (
+            session_id VARCHAR PRIMARY KEY,
+            user_id VARCHAR NOT NULL,
+            prompt VARCHAR NOT NULL,
+            status VARCHAR NOT NULL,
+            created_at BIGINT NOT NULL,
+            updated_at BIGINT NOT NULL
+        )
+        """
+    )
+    duckdb_client.execute(
+        "INSERT INTO research_sessions VALUES ('s1', 'u1', 'Old', 'completed', 1, 1)"
+    )
+
+    store = SessionStoreDuckDB(client=duckdb_client)
+
+    assert "idx_research_sessions_user_created" in _index_names(
+        duckdb_client, "research_sessions"
+    )
+    assert duckdb_client.schema_version("research_sessions") == 2
+    assert store.get_session("s1").prompt == "Old"
+
+
+def test_google_id_is_unique(duckdb_client) -> None:
+    store = UserStoreDuckDB(client=duckdb_client)
+    store.create_user(UserCreate(email="a@example.com", name="A", google_id="g-1"))
+
+    assert "idx_users_google_id" in _index_names(duckdb_client, "users")
+    with pytest.raises(duckdb.ConstraintException):
+        store.create_user(UserCreate(email="b@example.com", name="B", google_id="g-1"))
+
+
+def test_duplicate_google_ids_are_merged_on_upgrade(duckdb_client) -> None:
+    duckdb_client.execute(
+        """
+        CREATE TABLE users (
+            user_id VARCHAR PRIMARY KEY,
+            email VARCHAR NOT NULL,
+            name VARCHAR NOT NULL,
+            google_id VARCHAR NOT NULL,
+            created_at BIGINT NOT NULL,
+            updated_at BIGINT NOT NULL
+        )
+        """
+    )
+    duckdb_client.execute(
+        """
+        INSERT INTO users VALUES
+            ('u-late', 'a@example.com', 'A', 'g-1', 20, 20),
+            ('u-first', 'a@example.com', 'A', 'g-1', 10, 10),
+            ('u-other', 'b@example.com', 'B', 'g-2', 15, 15)
+        """
+    )
+    sessions = SessionStoreDuckDB(client=duckdb_client)
+    duckdb_client.execute(
+        "INSERT INTO research_sessions VALUES ('s1', 'u-late', 'Old', 'completed', 1, 1)"
+    )
+
+    store = UserStoreDuckDB(client=duckdb_client)
+
+    assert "idx_users_google_id" in _index_names(duckdb_client, "users")
+    assert duckdb_client.schema_version("users") == 3
+    assert store.get_user_by_google_id("g-1").user_id == "u-first"
+    assert store.get_user_by_id("u-late") is None
+    assert store.get_user_by_id("u-other") is not None
+    assert sessions.get_session("s1").user_id == "u-first"
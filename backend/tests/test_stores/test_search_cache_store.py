@@ -0,0 +1,23 @@
+from infograph.core.schemas.search_cache import SearchCacheEntry
+from infograph.stores.duckdb.search_cache_store_duckdb import SearchCacheStoreDuckDB
+
+
+def test_search_cache_store_round_trip_and_purge(duckdb_client) -> None:
+    store = SearchCacheStoreDuckDB(client=duckdb_client)
+    entry = SearchCacheEntry(
+        cache_key="key-1",
+        query="tides",
+        max_results=5,
+        results=[{"title": "Tides", "url": "https://example.com", "confidence": 1.0}],
+        fetched_at=100,
+    )
+
+    store.put_entry(entry)
+    assert store.get_entry("key-1") == entry
+
+    store.put_entry(entry.model_copy(update={"fetched_at": 200}))
+    assert store.get_entry("key-1").fetched_at == 200
+
+    assert store.delete_entries_before(150) == 0
+    assert store.delete_entries_before(250) == 1
+    assert store.get_entry("key-1") is None
@@ -1,5 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+import pytest
+
+from infograph.core.schemas.infographic import InfographicCreate
+from infograph.core.schemas.message import MessageCreate
 from infograph.core.schemas.research_session import ResearchSessionCreate, ResearchSessionUpdate
+from infograph.core.schemas.source import SourceCreate
+from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
+from infograph.stores.duckdb.message_store_duckdb import MessageStoreDuckDB
 from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
+from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
 
 
 def test_session_store_crud(duckdb_client) -> None:
@@ -25,3 +36,80 @@ def test_session_store_crud(duckdb_client) -> None:
 
     store.delete_session(session.session_id)
     assert store.get_session(session.session_id) is None
+
+
+def test_session_store_keyset_pages(duckdb_client) -> None:
+    store = SessionStoreDuckDB(client=duckdb_client)
+    for index in range(5):
+        store.create_session(
+            user_id="user-1",
+            session_create=ResearchSessionCreate(prompt=f"Prompt {index}"),
+        )
+    expected = [
+        session.session_id
+        for session in store.list_sessions(user_id="user-1", limit=10, offset=0)
+    ]
+
+    first = store.list_sessions_page("user-1", limit=3)
+    assert len(first.items) == 3
+    assert first.next_cursor is not None
+    second = store.list_sessions_page("user-1", limit=3, cursor=first.next_cursor)
+    assert second.next_cursor is None
+
+    paged = [session.session_id for session in first.items + second.items]
+    assert sorted(paged) == sorted(expected)
+    assert len(set(paged)) == 5
+
+
+def test_session_store_delete_cascade(duckdb_client) -> None:
+    session_store = SessionStoreDuckDB(client=duckdb_client)
+    message_store = MessageStoreDuckDB(client=duckdb_client)
+    source_store = SourceStoreDuckDB(client=duckdb_client)
+    infographic_store = InfographicStoreDuckDB(client=duckdb_client)
+    session = session_store.create_session(
+        user_id="user-1", session_create=ResearchSessionCreate(prompt="Tides")
+    )
+    message_store.create_message(
+        MessageCreate(session_id=session.session_id, role="user", content="Hi")
+    )
+    source_store.create_source(
+        SourceCreate(
+            session_id=session.session_id,
+            title="Title",
+            url="https://example.com",
+            snippet="Snippet",
+            confidence=0.9,
+        )
+    )
+    infographic_store.create_infographic(
+        InfographicCreate(
+            session_id=session.session_id,
+            template_type="basic",
+            layout_data={"image_path": "/tmp/tides.png"},
+        )
+    )
+
+    image_paths = session_store.delete_session_cascade(session.session_id)
+
+    assert image_paths == ["/tmp/tides.png"]
+    assert session_store.get_session(session.session_id) is None
+    assert message_store.list_messages(session.session_id) == []
+    assert source_store.list_sources(session.session_id) == []
+    assert infographic_store.get_infographic(session.session_id) is None
+
+
+def test_session_store_lock_conflicts_with_cascade(duckdb_client) -> None:
+    store = SessionStoreDuckDB(client=duckdb_client)
+    session = store.create_session("user-1", ResearchSessionCreate(prompt="Locked"))
+
+    assert store.lock_session("missing") is False
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        with duckdb_client.transaction():
+            assert store.lock_session(session.session_id) is True
+            deleting = pool.submit(store.delete_session_cascade, session.session_id)
+            with pytest.raises(duckdb.TransactionException):
+                deleting.result()
+
+    assert store.get_session(session.session_id) is not None
+    store.delete_session_cascade(session.session_id)
+    assert store.lock_session(session.session_id) is False
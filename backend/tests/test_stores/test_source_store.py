@@ -1,3 +1,6 @@
+import pytest
+
+from infograph.core.event_bus import EventBus, SessionEvent
 from infograph.core.schemas.source import SourceCreate
 from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
 
@@ -20,3 +23,58 @@ def test_source_store_crud(duckdb_client) -> None:
 
     store.delete_sources_for_session("session-1")
     assert store.list_sources("session-1") == []
+
+
+def test_source_store_bulk_insert(duckdb_client) -> None:
+    store = SourceStoreDuckDB(client=duckdb_client, bulk_batch_size=4)
+    source_creates = [
+        SourceCreate(
+            session_id="session-1",
+            title=f"Title {index}",
+            url=f"https://example.com/{index}",
+            snippet="Snippet",
+            confidence=0.5,
+        )
+        for index in range(10)
+    ]
+
+    created = store.create_sources_bulk(source_creates)
+
+    assert [source.url for source in created] == [item.url for item in source_creates]
+    stored = {source.source_id: source for source in store.list_sources("session-1")}
+    assert stored == {source.source_id: source for source in created}
+    assert store.create_sources_bulk([]) == []
+
+
+class RecordingEventBus(EventBus):
+    def __init__(self) -> None:
+        super().__init__()
+        self.events: list[SessionEvent] = []
+
+    def publish(self, event: SessionEvent) -> None:
+        self.events.append(event)
+
+
+def test_source_events_wait_for_the_outermost_commit(duckdb_client) -> None:
+    bus = RecordingEventBus()
+    store = SourceStoreDuckDB(client=duckdb_client, event_bus=bus)
+    source_create = SourceCreate(
+        session_id="session-1",
+        title="Title",
+        url="https://example.com",
+        snippet="Snippet",
+        confidence=0.5,
+    )
+
+    with duckdb_client.transaction():
+        store.create_sources_bulk([source_create, source_create])
+        store.create_source(source_create)
+        assert bus.events == []
+    assert [event.event for event in bus.events] == ["source"] * 3
+
+    with pytest.raises(RuntimeError):
+        with duckdb_client.transaction():
+            store.create_sources_bulk([source_create])
+            raise RuntimeError("conflict")
+    assert len(bus.events) == 3
+    assert len(store.list_sources("session-1")) == 3
@@ -1,3 +1,4 @@
+from infograph.core.cache import TTLCache
 from infograph.core.schemas.user import UserCreate
 from infograph.stores.duckdb.user_store_duckdb import UserStoreDuckDB
 
@@ -23,3 +24,22 @@ def test_user_store_crud(duckdb_client) -> None:
 
     store.delete_user(user.user_id)
     assert store.get_user_by_id(user.user_id) is None
+
+
+def test_user_store_caches_lookups_and_invalidates_on_write(duckdb_client) -> None:
+    store = UserStoreDuckDB(
+        client=duckdb_client, cache=TTLCache(max_entries=10, ttl_seconds=60)
+    )
+    user = store.create_user(
+        UserCreate(email="user@example.com", name="Test User", google_id="google-1")
+    )
+
+    store.get_user_by_id(user.user_id)
+    store.get_user_by_id(user.user_id)
+    assert store.cache.metrics()["hits"] == 1
+
+    store.update_user(user.model_copy(update={"name": "Renamed"}))
+    assert store.get_user_by_id(user.user_id).name == "Renamed"
+
+    store.delete_user(user.user_id)
+    assert store.get_user_by_id(user.user_id) is None
@@ -0,0 +1,61 @@
+from PIL import Image, ImageDraw, ImageFont
+
+from infograph.services.text_layout import FontMetrics, FontRegistry, wrap_text
+
+
+def _legacy_wrap(text: str, font, max_width: int) -> list[str]:
+    draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+    lines: list[str] = []
+    for paragraph in text.splitlines():
+        words = paragraph.split()
+        if not words:
+            lines.append("")
+            continue
+        current = words[0]
+        for word in words[1:]:
+            candidate = f"{current} {word}"
+            if draw.textlength(candidate, font=font) <= max_width:
+                current = candidate
+            else:
+                lines.append(current)
+                current = word
+        lines.append(current)
+    return lines
+
+
+def test_wrap_matches_measuring_each_candidate_line() -> None:
+    font = ImageFont.load_default()
+    metrics = FontMetrics(font)
+    text = (
+        "Research: how do tidal energy installations affect coastal ecosystems "
+        "and what mitigation strategies exist?\n\nA-very-long-hyphenated-word-that"
+        "-does-not-fit-anywhere ünïcödé words too"
+    )
+
+    for max_width in (40, 120, 300, 896):
+        assert wrap_text(text, metrics, max_width) == _legacy_wrap(
+            text, font, max_width
+        )
+
+
+def test_text_width_is_the_sum_of_cached_advances() -> None:
+    font = ImageFont.load_default()
+    metrics = FontMetrics(font)
+
+    assert metrics.text_width("Hello world") == font.getlength("Hello world")
+    assert metrics.text_width("") == 0
+    assert metrics.line_height == sum(font.getmetrics())
+
+
+def test_registry_loads_each_font_once() -> None:
+    loads: list[str] = []
+
+    def loader():
+        loads.append("body")
+        return ImageFont.load_default()
+
+    registry = FontRegistry({"body": loader})
+    registry.preload()
+
+    assert registry.get("body") is registry.get("body")
+    assert loads == ["body"]
@@ -1,3 +1,6 @@
+import { API_BASE } from '../env'
+import { pinia } from '../stores'
+import { useAuthStore } from '../stores/modules/auth'
 import request from '../utils/request'
 
 export const createSession = (payload) => request.post('/api/v1/sessions', payload)
@@ -9,9 +12,74 @@ export const listSessions = (params = {}) =>
 
 export const getSession = (sessionId) => request.get(`/api/v1/sessions/${sessionId}`)
 
+export const getSessionDetail = (sessionId, params = {}) =>
+  request.get(`/api/v1/sessions/${sessionId}/detail`, {
+    params,
+  })
+
 export const deleteSession = (sessionId) => request.delete(`/api/v1/sessions/${sessionId}`)
 
-export const listMessages = (sessionId) => request.get(`/api/v1/sessions/${sessionId}/messages`)
+export const listMessages = (sessionId, params = {}) =>
+  request.get(`/api/v1/sessions/${sessionId}/messages`, {
+    params,
+  })
+
+export const listAllMessages = async (sessionId) => {
+  const messages = []
+  let cursor = null
+  do {
+    const { data } = await listMessages(sessionId, cursor ? { cursor } : {})
+    messages.push(...data.items)
+    cursor = data.next_cursor
+  } while (cursor)
+  return messages
+}
 
 export const createMessage = (sessionId, payload) =>
   request.post(`/api/v1/sessions/${sessionId}/messages`, payload)
+
+const parseEventBlock = (block) => {
+  let event = 'message'
+  const data = []
+  block.split('\n').forEach((line) => {
+    if (line.startsWith('event: ')) {
+      event = line.slice(7)
+    } else if (line.startsWith('data: ')) {
+      data.push(line.slice(6))
+    }
+  })
+  return data.length ? { event, data: JSON.parse(data.join('\n')) } : null
+}
+
+// EventSource cannot send the Authorization header, so the SSE stream is read with fetch.
+export const streamSessionEvents = async (sessionId, { onEvent, signal } = {}) => {
+  const authStore = useAuthStore(pinia)
+  const response = await fetch(`${API_BASE}/api/v1/sessions/${sessionId}/events`, {
+    headers: {
+      Accept: 'text/event-stream',
+      Authorization: `Bearer ${authStore.token}`,
+    },
+    signal,
+  })
+  if (!response.ok) {
+    throw new Error(`Session event stream failed with status ${response.status}`)
+  }
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader()
+  let buffer = ''
+  for (;;) {
+    const { value, done } = await reader.read()
+    if (done) {
+      return
+    }
+    buffer += value
+    let boundary = buffer.indexOf('\n\n')
+    while (boundary !== -1) {
+      const parsed = parseEventBlock(buffer.slice(0, boundary))
+      buffer = buffer.slice(boundary + 2)
+      if (parsed && onEvent) {
+        onEvent(parsed.event, parsed.data)
+      }
+      boundary = buffer.indexOf('\n\n')
+    }
+  }
+}
@@ -1,6 +1,6 @@
 import { defineStore } from 'pinia'
 
-import { createMessage, listMessages } from '../../../api/session'
+import { createMessage, listAllMessages } from '../../../api/session'
 
 export const useChatStore = defineStore('chat', {
   state: () => ({
@@ -21,10 +21,10 @@ export const useChatStore = defineStore('chat', {
       this.status = 'loading'
       this.error = null
       try {
-        const { data } = await listMessages(sessionId)
-        this.messages = data
+        const messages = await listAllMessages(sessionId)
+        this.messages = messages
         this.status = 'ready'
-        return data
+        return messages
       } catch (error) {
         this.status = 'error'
         this.error = error
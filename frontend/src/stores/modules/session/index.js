@@ -1,23 +1,32 @@
 import { defineStore } from 'pinia'
 
-import { createSession, deleteSession, getSession, listSessions } from '../../../api/session'
+import {
+  createSession,
+  deleteSession,
+  getSession,
+  getSessionDetail,
+  listSessions,
+  streamSessionEvents,
+} from '../../../api/session'
 
 export const useSessionStore = defineStore('session', {
   state: () => ({
     sessions: [],
+    nextCursor: null,
     activeSession: null,
     status: 'idle',
     error: null,
   }),
   actions: {
-    async fetchSessions(params = { limit: 20, offset: 0 }) {
+    async fetchSessions(params = { limit: 20 }) {
       this.status = 'loading'
       this.error = null
       try {
         const { data } = await listSessions(params)
-        this.sessions = data
+        this.sessions = params.cursor ? [...this.sessions, ...data.items] : data.items
+        this.nextCursor = data.next_cursor
         this.status = 'ready'
-        return data
+        return data.items
       } catch (error) {
         this.status = 'error'
         this.error = error
@@ -38,6 +47,20 @@ export const useSessionStore = defineStore('session', {
         throw error
       }
     },
+    async fetchSessionDetail(sessionId, include) {
+      this.status = 'loading'
+      this.error = null
+      try {
+        const { data } = await getSessionDetail(sessionId, include ? { include } : {})
+        this.activeSession = data.session
+        this.status = 'ready'
+        return data
+      } catch (error) {
+        this.status = 'error'
+        this.error = error
+        throw error
+      }
+    },
     async createSession(prompt) {
       this.status = 'loading'
       this.error = null
@@ -69,6 +92,29 @@ export const useSessionStore = defineStore('session', {
         throw error
       }
     },
+    async watchSession(sessionId, { onEvent, signal } = {}) {
+      await streamSessionEvents(sessionId, {
+        signal,
+        onEvent: (event, data) => {
+          if (event === 'status') {
+            if (this.activeSession && this.activeSession.session_id === sessionId) {
+              this.activeSession = data
+            }
+            this.sessions = this.sessions.map((session) =>
+              session.session_id === sessionId ? data : session
+            )
+          } else if (event === 'deleted') {
+            if (this.activeSession && this.activeSession.session_id === sessionId) {
+              this.activeSession = null
+            }
+            this.sessions = this.sessions.filter((session) => session.session_id !== sessionId)
+          }
+          if (onEvent) {
+            onEvent(event, data)
+          }
+        },
+      })
+    },
     clearActiveSession() {
       this.activeSession = null
     },